@@ -18,15 +18,16 @@ Usage:
 
 from __future__ import annotations
 
-import json
+import functools
 import logging
+import os
 import sys
+from collections import Counter
+from dataclasses import dataclass, replace
 from pathlib import Path
 from typing import Optional
 
 import typer
-from rich.console import Console
-from rich.table import Table
 
 from . import __version__
 
@@ -35,7 +36,27 @@ app = typer.Typer(
     help="Generate test datasets to maximize SAS code coverage.",
     add_completion=False,
 )
-console = Console()
+
+
+class _LazyConsole:
+    """Proxy for rich's Console that is only built on first use.
+
+    Keeps rich's import cost out of `--help`/`--version` and other commands
+    that never print through the console.
+    """
+
+    def __init__(self) -> None:
+        self._console = None
+
+    def __getattr__(self, name: str):
+        if self._console is None:
+            from rich.console import Console
+            self._console = Console()
+        return getattr(self._console, name)
+
+
+console = _LazyConsole()
+logger = logging.getLogger(__name__)
 
 
 def _setup_logging(verbose: bool) -> None:
@@ -47,6 +68,60 @@ def _setup_logging(verbose: bool) -> None:
     )
 
 
+def _load_json(path: str):
+    """Load a JSON configuration file (--macros, --libnames).
+
+    Uses orjson on the raw bytes when installed (no separate decode step),
+    otherwise the standard library parser.
+    """
+    try:
+        import orjson
+    except ImportError:
+        import json
+        return json.loads(Path(path).read_bytes())
+    return orjson.loads(Path(path).read_bytes())
+
+
+@functools.lru_cache(maxsize=None)
+def _scan_project_cached(project_dir: str, entry_file: str | None) -> tuple[Path, ...]:
+    from .include_resolver import prefetch_sources, scan_project_directory
+    files = tuple(scan_project_directory(project_dir, entry_file=entry_file))
+    # Every file is resolved next; read them all up front, concurrently
+    prefetch_sources(files)
+    return files
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve_includes_cached(
+    sas_file: Path,
+    search_dirs: tuple[str, ...] | None,
+    macro_items: tuple[tuple[str, str], ...] | None,
+):
+    from .include_resolver import resolve_includes
+    return resolve_includes(
+        sas_file,
+        search_dirs=list(search_dirs) if search_dirs else None,
+        macro_vars=dict(macro_items) if macro_items else None,
+    )
+
+
+def _resolve_includes(
+    sas_file: Path,
+    include_paths: list[str] | None,
+    macro_vars: dict[str, str] | None,
+):
+    """resolve_includes, memoized for the duration of one CLI invocation.
+
+    `run` needs the resolved source twice per file (parsing, then
+    instrumentation); the include tree is only walked once.
+    """
+    return _resolve_includes_cached(
+        Path(sas_file).resolve(),
+        tuple(include_paths) if include_paths else None,
+        tuple(sorted(macro_vars.items())) if macro_vars else None,
+    )
+
+
 def _resolve_sas_files(
     sas_files: list[Path] | None,
     project_dir: str | None,
@@ -62,8 +137,7 @@ def _resolve_sas_files(
         - Otherwise: returns the explicit file list
     """
     if project_dir:
-        from .include_resolver import scan_project_directory
-        files = scan_project_directory(project_dir, entry_file=entry_file)
+        files = list(_scan_project_cached(str(project_dir), entry_file))
         if not files:
             console.print(f"[red]No .sas files found in {project_dir}[/red]")
         return files, True
@@ -88,52 +162,227 @@ def _parse_file_or_project(
             sas_file,
             search_dirs=include_paths,
             macro_vars=macro_vars,
+            resolved=_resolve_includes(sas_file, include_paths, macro_vars),
         )
     else:
         return parse_sas_file(sas_file)
 
 
-def _display_parse_result(result, file_label: str) -> None:
-    """Display parse results in a formatted table."""
-    console.print(f"\n[bold]File: {file_label}[/bold]")
-    console.print(f"  Blocks: {len(result.blocks)}")
-    console.print(f"  Coverage points: {len(result.all_coverage_points)}")
-    console.print(f"  Variables: {len(result.all_variables)}")
+def _parse_cache_dir(use_cache: bool) -> Path | None:
+    """Directory for the persistent parse cache, or None when disabled."""
+    if not use_cache:
+        return None
+    from .parse_cache import DEFAULT_CACHE_DIR
+    return DEFAULT_CACHE_DIR
+
+
+def _load_or_parse(
+    sas_file: Path,
+    include_paths: list[str] | None,
+    macro_vars: dict[str, str] | None,
+    use_project: bool,
+    cache_dir: Path | None,
+):
+    """Parse a SAS file, reusing a cached ParseResult from cache_dir when possible.
+
+    The cache is keyed on the source text (the include-resolved source in
+    project mode), so any edit to the program or one of its includes is a
+    cache miss. See parse_cache for the key details.
+    """
+    if cache_dir is None:
+        return _parse_file_or_project(sas_file, include_paths, macro_vars, use_project)
+
+    from . import parse_cache
+
+    if use_project or include_paths:
+        resolved = _resolve_includes(sas_file, include_paths, macro_vars)
+        source = resolved.resolved_code.encode("utf-8")
+    else:
+        source = Path(sas_file).read_bytes()
+
+    key = parse_cache.cache_key(sas_file, source, "project" if use_project else "file")
+    result = parse_cache.load(key, cache_dir)
+    if result is None:
+        result = _parse_file_or_project(sas_file, include_paths, macro_vars, use_project)
+        parse_cache.store(key, result, cache_dir)
+    return result
+
+
+def _existing_files(files: list[Path]) -> list[Path]:
+    """Report missing files and return the ones that exist, in order."""
+    existing = []
+    for sas_file in files:
+        if sas_file.exists():
+            existing.append(sas_file)
+        else:
+            console.print(f"[red]File not found: {sas_file}[/red]")
+    return existing
+
+
+def _output_names(files: list[Path]) -> list[str]:
+    """Return a distinct output name per file: its stem, index-prefixed if shared.
+
+    Reports, instrumented code and (with -j) work directories are named
+    after it, so same-named files from different directories never write
+    to the same paths.
+    """
+    stem_counts = Counter(f.stem for f in files)
+    names: list[str] = []
+    used: set[str] = set()
+    for i, sas_file in enumerate(files, 1):
+        name = sas_file.stem
+        if stem_counts[name] > 1:
+            name = f"{i}_{name}"
+            while name in used or name in stem_counts:
+                name = f"{i}_{name}"
+        used.add(name)
+        names.append(name)
+    return names
+
+
+def _map_files(func, files: list[Path], jobs: int, **kwargs) -> list:
+    """Apply ``func(sas_file, **kwargs)`` to every file, in a process pool if useful.
+
+    The per-file work (parsing, dataset generation) is pure-Python CPU work,
+    so separate processes sidestep the GIL. Results are returned in input
+    order, and all console output stays in the parent process.
+    """
+    from functools import partial
+
+    workers = min(jobs or os.cpu_count() or 1, len(files))
+    worker = partial(func, **kwargs)
+    if workers <= 1:
+        return [worker(f) for f in files]
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(worker, files))
+
+
+def _export_datasets(datasets: list, output_dir: Path, formats: list[str]) -> list[list[str]]:
+    """Export datasets concurrently; returns each dataset's paths, in order.
+
+    Exports are independent, I/O-bound writes (pandas/pyarrow release the
+    GIL while serializing), so a small thread pool overlaps them. All of
+    them finish before this returns, so SAS never reads a partial file; the
+    first failure is raised at once, without waiting for the other writes.
+    """
+    from .dataset_generator import export_dataset
+
+    if len(datasets) <= 1:
+        return [export_dataset(ds, output_dir, formats=formats) for ds in datasets]
+
+    from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
+
+    executor = ThreadPoolExecutor(max_workers=min(8, len(datasets)))
+    try:
+        futures = [
+            executor.submit(export_dataset, ds, output_dir, formats=formats) for ds in datasets
+        ]
+        done, _ = wait(futures, return_when=FIRST_EXCEPTION)
+        for future in done:
+            future.result()  # Re-raises the first failure
+        return [future.result() for future in futures]
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _parse_and_generate(
+    sas_file: Path,
+    include_paths: list[str] | None,
+    macro_vars: dict[str, str] | None,
+    use_project: bool,
+    cache_dir: Path | None,
+    num_rows: int,
+    seed: int,
+):
+    """Worker for `generate`: parse one file and build its seed datasets."""
+    from .dataset_generator import generate_seed_datasets
+
+    parse_result = _load_or_parse(sas_file, include_paths, macro_vars, use_project, cache_dir)
+    return generate_seed_datasets(parse_result, num_rows=num_rows, seed=seed)
+
+
+# Above this many rows, tables are printed as plain TSV: Rich measures and
+# styles every cell, which dominates output time for large projects.
+_TABLE_ROW_LIMIT = 500
+
+
+def _rows_renderable(title: str, columns: list[tuple[str, dict]], rows: list[tuple[str, ...]]):
+    """Build a Rich table for rows, or a plain TSV block when there are too many."""
+    if len(rows) > _TABLE_ROW_LIMIT:
+        from rich.text import Text
+
+        header = "\t".join(name for name, _ in columns)
+        body = "\n".join("\t".join(row) for row in rows)
+        return Text(f"{title}\n{header}\n{body}", no_wrap=True, overflow="ignore")
+
+    from rich.table import Table
+
+    table = Table(title=title)
+    for name, options in columns:
+        table.add_column(name, **options)
+    for row in rows:
+        table.add_row(*row)
+    return table
+
+
+def _display_parse_result(result, file_label: str, verbose: bool = False) -> None:
+    """Display parse results: summary counts, plus detail tables when verbose.
+
+    Everything for one file is rendered in a single console.print call.
+    """
+    lines = [
+        f"\n[bold]File: {file_label}[/bold]",
+        f"  Blocks: {len(result.blocks)}",
+        f"  Coverage points: {len(result.all_coverage_points)}",
+        f"  Variables: {len(result.all_variables)}",
+    ]
 
     if result.errors:
-        console.print(f"  [yellow]Warnings: {len(result.errors)}[/yellow]")
-        for err in result.errors:
-            console.print(f"    {err}")
+        lines.append(f"  [yellow]Warnings: {len(result.errors)}[/yellow]")
+        lines.extend(f"    {err}" for err in result.errors)
+
+    if not verbose:
+        # The tables can be thousands of rows long; only render them on request
+        if result.all_coverage_points or result.all_variables:
+            lines.append("  (use --verbose to list coverage points and variables)")
+        console.print("\n".join(lines))
+        return
+
+    from rich.console import Group
+
+    renderables = ["\n".join(lines)]
 
     if result.all_coverage_points:
-        table = Table(title="Coverage Points")
-        table.add_column("ID", style="cyan")
-        table.add_column("Type", style="green")
-        table.add_column("Line")
-        table.add_column("Description")
-        table.add_column("Condition", max_width=50)
-
-        for cp in result.all_coverage_points:
-            table.add_row(
-                cp.point_id,
-                cp.point_type.name,
-                str(cp.line_number),
-                cp.description,
-                cp.condition[:50] if cp.condition else "",
-            )
-        console.print(table)
+        rows = [
+            (cp.point_id, cp.point_type.name, str(cp.line_number), cp.description,
+             (cp.condition or "")[:50])
+            for cp in result.all_coverage_points
+        ]
+        renderables.append(_rows_renderable("Coverage Points", [
+            ("ID", {"style": "cyan"}),
+            ("Type", {"style": "green"}),
+            ("Line", {}),
+            ("Description", {}),
+            ("Condition", {"max_width": 50}),
+        ], rows))
 
     if result.all_variables:
-        vtable = Table(title="Detected Variables")
-        vtable.add_column("Name", style="cyan")
-        vtable.add_column("Type", style="green")
-        vtable.add_column("Source")
-        vtable.add_column("Line")
-        vtable.add_column("Format")
+        rows = [
+            (v.name, v.inferred_type, v.source, str(v.line_number), v.format)
+            for v in result.all_variables
+        ]
+        renderables.append(_rows_renderable("Detected Variables", [
+            ("Name", {"style": "cyan"}),
+            ("Type", {"style": "green"}),
+            ("Source", {}),
+            ("Line", {}),
+            ("Format", {}),
+        ], rows))
 
-        for v in result.all_variables:
-            vtable.add_row(v.name, v.inferred_type, v.source, str(v.line_number), v.format)
-        console.print(vtable)
+    console.print(Group(*renderables))
 
 
 @app.callback()
@@ -164,6 +413,14 @@ def analyze(
         None, "--macros",
         help="JSON file with macro variables (used for resolving %%INCLUDE paths)",
     ),
+    jobs: int = typer.Option(
+        0, "--jobs", "-j",
+        help="Worker processes for multi-file input (0 = one per CPU)",
+    ),
+    use_cache: bool = typer.Option(
+        True, "--cache/--no-cache",
+        help="Reuse parse results cached under ~/.cache/sas-data-generator",
+    ),
     verbose: bool = typer.Option(False, "--verbose", "-v"),
 ) -> None:
     """Parse SAS files and display coverage points and variables.
@@ -173,10 +430,11 @@ def analyze(
     - Project mode: pass --project-dir to scan a directory and resolve %INCLUDE
     """
     _setup_logging(verbose)
+    cache_dir = _parse_cache_dir(use_cache)
 
     macro_vars = None
     if macro_vars_json:
-        macro_vars = json.loads(Path(macro_vars_json).read_text())
+        macro_vars = _load_json(macro_vars_json)
 
     files, use_project = _resolve_sas_files(sas_files, project_dir, entry_file, include_paths, macro_vars)
 
@@ -186,16 +444,20 @@ def analyze(
     if use_project and entry_file:
         # In project mode with an entry file: parse the whole project as one unit
         entry = files[0]
-        result = _parse_file_or_project(entry, include_paths, macro_vars, use_project)
-        _display_parse_result(result, f"{entry} (project mode, {len(files)} files scanned)")
+        result = _load_or_parse(entry, include_paths, macro_vars, use_project, cache_dir)
+        _display_parse_result(
+            result, f"{entry} (project mode, {len(files)} files scanned)", verbose,
+        )
     else:
-        # File-by-file mode
-        for sas_file in files:
-            if not sas_file.exists():
-                console.print(f"[red]File not found: {sas_file}[/red]")
-                continue
-            result = _parse_file_or_project(sas_file, include_paths, macro_vars, use_project)
-            _display_parse_result(result, str(sas_file))
+        # File-by-file mode: files are independent, parse them in parallel
+        files = _existing_files(files)
+        results = _map_files(
+            _load_or_parse, files, jobs,
+            include_paths=include_paths, macro_vars=macro_vars, use_project=use_project,
+            cache_dir=cache_dir,
+        )
+        for sas_file, result in zip(files, results):
+            _display_parse_result(result, str(sas_file), verbose)
 
 
 @app.command()
@@ -217,7 +479,7 @@ def instrument(
     With --include-path, resolves %INCLUDE before instrumenting.
     """
     _setup_logging(verbose)
-    from .sas_instrumenter import instrument_sas_file
+    from .sas_instrumenter import instrument_sas_code, instrument_sas_file, instrument_sas_file_to
 
     if not sas_file.exists():
         console.print(f"[red]File not found: {sas_file}[/red]")
@@ -225,23 +487,23 @@ def instrument(
 
     macro_vars = None
     if macro_vars_json:
-        macro_vars = json.loads(Path(macro_vars_json).read_text())
+        macro_vars = _load_json(macro_vars_json)
 
-    # If include paths are provided, resolve includes first and write a temp file
+    # If include paths are provided, resolve includes first and instrument the result
     if include_paths:
-        from .include_resolver import resolve_includes
-        resolved = resolve_includes(sas_file, search_dirs=include_paths, macro_vars=macro_vars)
+        resolved = _resolve_includes(sas_file, include_paths, macro_vars)
         if resolved.errors:
             for err in resolved.errors:
                 console.print(f"  [yellow]{err}[/yellow]")
 
-        # Write resolved code to temp file for instrumentation
-        from tempfile import NamedTemporaryFile
-        with NamedTemporaryFile(mode="w", suffix=".sas", delete=False, encoding="utf-8") as f:
-            f.write(resolved.resolved_code)
-            f.flush()
-            result = instrument_sas_file(f.name)
+        result = instrument_sas_code(resolved.resolved_code, file_id=sas_file.stem[:20])
         console.print(f"  Resolved {len(resolved.included_files)} included files")
+    elif output:
+        # Streamed to disk: the whole program is never held as one string
+        points = instrument_sas_file_to(sas_file, output)
+        console.print(f"Instrumented code written to: {output}")
+        console.print(f"\n[bold]Coverage points: {len(points)}[/bold]")
+        return
     else:
         result = instrument_sas_file(sas_file)
 
@@ -277,6 +539,14 @@ def generate(
         None, "--macros",
         help="JSON file with macro variables",
     ),
+    use_cache: bool = typer.Option(
+        True, "--cache/--no-cache",
+        help="Reuse parse results cached under ~/.cache/sas-data-generator",
+    ),
+    jobs: int = typer.Option(
+        0, "--jobs", "-j",
+        help="Worker processes for multi-file input (0 = one per CPU)",
+    ),
     verbose: bool = typer.Option(False, "--verbose", "-v"),
 ) -> None:
     """Generate test datasets from SAS program analysis (no SAS execution).
@@ -288,7 +558,7 @@ def generate(
 
     macro_vars = None
     if macro_vars_json:
-        macro_vars = json.loads(Path(macro_vars_json).read_text())
+        macro_vars = _load_json(macro_vars_json)
 
     files, use_project = _resolve_sas_files(sas_files, project_dir, entry_file, include_paths, macro_vars)
 
@@ -296,11 +566,12 @@ def generate(
         raise typer.Exit(1)
 
     output_dir.mkdir(parents=True, exist_ok=True)
+    cache_dir = _parse_cache_dir(use_cache)
 
     # In project mode with entry: parse everything as one unit
     if use_project and entry_file:
         entry = files[0]
-        parse_result = _parse_file_or_project(entry, include_paths, macro_vars, use_project)
+        parse_result = _load_or_parse(entry, include_paths, macro_vars, use_project, cache_dir)
         console.print(f"\n[bold]Project: {entry} ({len(files)} files)[/bold]")
         console.print(f"  Blocks: {len(parse_result.blocks)}, "
                       f"Coverage points: {len(parse_result.all_coverage_points)}")
@@ -312,14 +583,14 @@ def generate(
             for note in ds.generation_notes:
                 console.print(f"    {note}")
     else:
-        for sas_file in files:
-            if not sas_file.exists():
-                console.print(f"[red]File not found: {sas_file}[/red]")
-                continue
-
-            parse_result = _parse_file_or_project(sas_file, include_paths, macro_vars, use_project)
-            datasets = generate_seed_datasets(parse_result, num_rows=num_rows, seed=seed)
-
+        # Files are independent: parse and generate in parallel, export here
+        files = _existing_files(files)
+        all_datasets = _map_files(
+            _parse_and_generate, files, jobs,
+            include_paths=include_paths, macro_vars=macro_vars, use_project=use_project,
+            cache_dir=cache_dir, num_rows=num_rows, seed=seed,
+        )
+        for datasets in all_datasets:
             for ds in datasets:
                 paths = export_dataset(ds, output_dir, formats=formats)
                 console.print(f"  Generated: {ds.name} -> {paths}")
@@ -327,6 +598,243 @@ def generate(
                     console.print(f"    {note}")
 
 
+@dataclass(frozen=True)
+class _RunConfig:
+    """Settings shared by every file processed by `run` (picklable for workers)."""
+    output_dir: Path
+    work_root: Path  # Where iter_<n>/ and final/ directories go
+    include_paths: list[str] | None
+    macro_vars: dict[str, str] | None
+    libname_map: dict[str, str] | None
+    use_project: bool
+    cache_dir: Path | None
+    num_rows: int
+    seed: int
+    max_iterations: int
+    coverage_target: float
+    sas_executable: str | None
+    dry_run: bool
+    timeout: int
+    formats: list[str]
+    output_name: str = ""  # Prefix of the file's reports; defaults to its stem
+    save_iterations: bool = False
+    keep_iterations: int = 0  # 0 keeps every iter_<n>/ directory
+    verbose: bool = False
+
+
+def _process_one_file(sas_file: Path, cfg: _RunConfig):
+    """Run the parse/instrument/generate/iterate loop for one SAS file.
+
+    Returns the file's final CoverageReport, or None if it has no coverage
+    points.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    from .sas_instrumenter import instrument_sas_file, instrument_sas_code
+    from .sas_runner import run_sas, run_sas_dry
+    from .dataset_generator import (
+        generate_seed_datasets,
+        mutate_datasets,
+    )
+    from .coverage import (
+        expected_index,
+        parse_coverage_from_log,
+        parse_coverage_from_log_file,
+        merge_coverage_reports,
+        export_coverage_report,
+        CoverageReport,
+    )
+
+    output_dir = cfg.output_dir
+    output_name = cfg.output_name or sas_file.stem
+    include_paths = cfg.include_paths
+    macro_vars = cfg.macro_vars
+
+    console.print(f"\n[bold]=== Processing: {sas_file} ===[/bold]")
+
+    # Phase 1: Parse (with or without include resolution)
+    parse_result = _load_or_parse(sas_file, include_paths, macro_vars, cfg.use_project, cfg.cache_dir)
+    console.print(f"  Parsed: {len(parse_result.blocks)} blocks, "
+                  f"{len(parse_result.all_coverage_points)} coverage points")
+
+    if parse_result.errors:
+        for err in parse_result.errors:
+            console.print(f"  [yellow]{err}[/yellow]")
+
+    if not parse_result.all_coverage_points:
+        console.print("  [yellow]No coverage points found — skipping[/yellow]")
+        return None
+
+    # Phase 2: Instrument
+    coverage_csv = str(output_dir / f"{output_name}_coverage.csv")
+    if cfg.use_project or include_paths:
+        # Resolve includes first (memoized from parsing), then instrument
+        resolved = _resolve_includes(sas_file, include_paths, macro_vars)
+        instr_result = instrument_sas_code(
+            resolved.resolved_code,
+            file_id=sas_file.stem[:20],
+            coverage_csv_path=coverage_csv,
+        )
+    else:
+        instr_result = instrument_sas_file(sas_file, coverage_csv_path=coverage_csv)
+
+    # Save instrumented code for debugging. A dry run already writes the full
+    # program to each iteration directory, so only keep a copy on request.
+    if not cfg.dry_run or cfg.verbose:
+        instr_path = output_dir / f"{output_name}_instrumented.sas"
+        instr_path.write_text(instr_result.instrumented_code, encoding="utf-8")
+        console.print(f"  Instrumented code: {instr_path}")
+
+    # Phase 3: Generate seed datasets
+    datasets = generate_seed_datasets(parse_result, num_rows=cfg.num_rows, seed=cfg.seed)
+
+    # Phase 4: Iterate — coverage is merged incrementally, one report per iteration
+    merged = CoverageReport()
+    load_template = ""
+    template_datasets = None
+    # Shared by every iteration's log parse (and so by the merged report)
+    all_point_ids, point_detail = expected_index(instr_result.coverage_points)
+    speculation = None
+
+    # One helper thread computes the next mutation while SAS runs (the
+    # subprocess wait releases the GIL). It is shut down without waiting:
+    # a speculation that turns out unused is never waited for.
+    pool = ThreadPoolExecutor(max_workers=1)
+    try:
+        for iteration in range(cfg.max_iterations):
+            console.print(f"\n  [cyan]--- Iteration {iteration + 1}/{cfg.max_iterations} ---[/cyan]")
+
+            # Export datasets (SAS reads them; a dry run only needs them on request)
+            iter_dir = cfg.work_root / f"iter_{iteration}"
+            if not cfg.dry_run or cfg.save_iterations:
+                _export_datasets(datasets, iter_dir, cfg.formats)
+
+            # Build SAS code with data loading preamble. The template only needs
+            # rebuilding after a mutation (character widths follow the data).
+            if datasets is not template_datasets:
+                load_template = _build_data_load_template(datasets, cfg.libname_map)
+                template_datasets = datasets
+            data_load_code = load_template.format(data_dir=iter_dir)
+            full_sas_code = "\n".join((data_load_code, instr_result.instrumented_code))
+
+            # Run SAS
+            if cfg.dry_run:
+                sas_result = run_sas_dry(full_sas_code, work_dir=str(iter_dir))
+                console.print("  [yellow]Dry run — no SAS execution[/yellow]")
+            else:
+                # Bet that this iteration hits no new points: the next datasets
+                # are then known before SAS returns.
+                speculative_missed = all_point_ids - merged.hit_point_ids
+                speculative_report = CoverageReport(
+                    total_points=len(all_point_ids),
+                    hit_points=merged.hit_points,
+                    hit_point_ids=merged.hit_point_ids,
+                    missed_point_ids=speculative_missed,
+                    points_detail=point_detail,
+                    is_complete=merged.is_complete,
+                    expected_ids=all_point_ids,
+                )
+                speculation = pool.submit(
+                    mutate_datasets,
+                    datasets,
+                    speculative_report,
+                    parse_result,
+                    seed=cfg.seed + iteration + 1,
+                )
+                sas_result = run_sas(
+                    full_sas_code,
+                    work_dir=str(iter_dir),
+                    sas_executable=cfg.sas_executable,
+                    timeout_seconds=cfg.timeout,
+                    macro_vars=macro_vars,
+                    libname_map=cfg.libname_map,
+                    # Coverage is read from the log file itself
+                    keep_log_text=False,
+                )
+
+            if sas_result.sas_errors:
+                console.print(f"  [red]SAS errors: {len(sas_result.sas_errors)}[/red]")
+                for err in sas_result.sas_errors[:3]:
+                    console.print(f"    {err}")
+
+            # Parse coverage (straight from the log file when SAS wrote one)
+            if sas_result.log_path and Path(sas_result.log_path).is_file():
+                report = parse_coverage_from_log_file(
+                    sas_result.log_path,
+                    instr_result.coverage_points,
+                    all_point_ids,
+                    point_detail,
+                )
+            else:
+                report = parse_coverage_from_log(
+                    sas_result.log_text,
+                    instr_result.coverage_points,
+                    all_point_ids,
+                    point_detail,
+                )
+            merged = merge_coverage_reports(merged, report)
+            console.print(f"  Coverage: {merged.hit_points}/{merged.total_points} "
+                          f"({merged.coverage_pct:.1f}%)")
+
+            # Only the most recent iterations are worth keeping on disk
+            if cfg.keep_iterations > 0 and iteration >= cfg.keep_iterations:
+                import shutil
+                stale_dir = cfg.work_root / f"iter_{iteration - cfg.keep_iterations}"
+                shutil.rmtree(stale_dir, ignore_errors=True)
+
+            # Check if target reached
+            if merged.coverage_pct >= cfg.coverage_target:
+                console.print(f"  [green]Target coverage reached![/green]")
+                break
+
+            # Mutate datasets for next iteration
+            if speculation is not None and merged.missed_point_ids == speculative_missed:
+                datasets = speculation.result()
+            else:
+                if speculation is not None:
+                    # Wrong guess: drop it. A mutation already running cannot
+                    # be interrupted; it finishes on the helper thread and
+                    # its result is discarded.
+                    speculation.cancel()
+                    speculation = None
+                datasets = mutate_datasets(
+                    datasets,
+                    merged,
+                    parse_result,
+                    seed=cfg.seed + iteration + 1,
+                )
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    # Export final datasets
+    final_dir = cfg.work_root / "final"
+    _export_datasets(datasets, final_dir, cfg.formats)
+
+    # Export coverage report
+    final_report = merged
+
+    report_path = output_dir / f"{output_name}_coverage_report.json"
+    export_coverage_report(final_report, report_path, format="json")
+
+    text_report_path = output_dir / f"{output_name}_coverage_report.txt"
+    export_coverage_report(final_report, text_report_path, format="text")
+
+    console.print(f"\n  [bold]Final coverage: {final_report.coverage_pct:.1f}%[/bold]")
+    console.print(f"  Report: {report_path}")
+
+    return final_report
+
+
+def _process_one_file_captured(sas_file: Path, cfg: _RunConfig):
+    """Worker-process entry point: run one file, returning (report, console output).
+
+    Output is captured rather than printed so the parent can write each
+    file's log as one block instead of interleaving lines from all workers.
+    """
+    with console.capture() as capture:
+        report = _process_one_file(sas_file, cfg)
+    return report, capture.get()
+
+
 @app.command()
 def run(
     sas_files: Optional[list[Path]] = typer.Argument(None, help="SAS program files"),
@@ -353,6 +861,24 @@ def run(
     formats: list[str] = typer.Option(["csv"], "--format", "-f", help="Output formats"),
     macro_vars_json: Optional[str] = typer.Option(None, "--macros", help="JSON file with macro variables"),
     libname_json: Optional[str] = typer.Option(None, "--libnames", help="JSON file with libname mappings"),
+    use_cache: bool = typer.Option(
+        True, "--cache/--no-cache",
+        help="Reuse parse results cached under ~/.cache/sas-data-generator",
+    ),
+    save_iterations: bool = typer.Option(
+        False, "--save-iterations",
+        help="With --dry-run, still export each iteration's datasets to iter_<n>/",
+    ),
+    keep_iterations: int = typer.Option(
+        0, "--keep-iter",
+        help="Keep only the last N iter_<n>/ directories (0 = keep all)",
+    ),
+    jobs: int = typer.Option(
+        1, "--jobs", "-j",
+        help="SAS files processed in parallel (0 = one per CPU); each file then "
+             "gets its own <output>/<name>/ work directory. Bounded in practice "
+             "by the number of concurrent SAS sessions your licence allows",
+    ),
     verbose: bool = typer.Option(False, "--verbose", "-v"),
 ) -> None:
     """Full loop: generate datasets, run SAS, measure coverage, mutate, repeat.
@@ -364,32 +890,20 @@ def run(
     Project mode resolves all %INCLUDE directives automatically.
     """
     _setup_logging(verbose)
-    from .sas_parser import parse_sas_file, parse_sas_project
-    from .sas_instrumenter import instrument_sas_file, instrument_sas_code
-    from .sas_runner import run_sas, run_sas_dry
-    from .dataset_generator import (
-        generate_seed_datasets,
-        mutate_datasets,
-        export_dataset,
-    )
-    from .coverage import (
-        parse_coverage_from_log,
-        merge_coverage_reports,
-        export_coverage_report,
-        CoverageReport,
-    )
+    from .coverage import merge_coverage_reports, CoverageReport
 
     output_dir = Path(output_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
+    cache_dir = _parse_cache_dir(use_cache)
 
     # Load optional config
     macro_vars = None
     if macro_vars_json:
-        macro_vars = json.loads(Path(macro_vars_json).read_text())
+        macro_vars = _load_json(macro_vars_json)
 
     libname_map = None
     if libname_json:
-        libname_map = json.loads(Path(libname_json).read_text())
+        libname_map = _load_json(libname_json)
 
     files, use_project = _resolve_sas_files(sas_files, project_dir, entry_file, include_paths, macro_vars)
     if not files:
@@ -401,138 +915,151 @@ def run(
     if use_project and entry_file:
         files_to_process = [files[0]]  # Only the resolved entry
     else:
-        files_to_process = files
-
-    for sas_file in files_to_process:
-        if not sas_file.exists():
-            console.print(f"[red]File not found: {sas_file}[/red]")
-            continue
-
-        console.print(f"\n[bold]=== Processing: {sas_file} ===[/bold]")
-
-        # Phase 1: Parse (with or without include resolution)
-        parse_result = _parse_file_or_project(sas_file, include_paths, macro_vars, use_project)
-        console.print(f"  Parsed: {len(parse_result.blocks)} blocks, "
-                      f"{len(parse_result.all_coverage_points)} coverage points")
-
-        if parse_result.errors:
-            for err in parse_result.errors:
-                console.print(f"  [yellow]{err}[/yellow]")
+        files_to_process = _existing_files(files)
+
+    workers = min(jobs or os.cpu_count() or 1, len(files_to_process))
+    output_names = _output_names(files_to_process)
+    cfg = _RunConfig(
+        output_dir=output_dir,
+        work_root=output_dir,
+        include_paths=include_paths,
+        macro_vars=macro_vars,
+        libname_map=libname_map,
+        use_project=use_project,
+        cache_dir=cache_dir,
+        num_rows=num_rows,
+        seed=seed,
+        max_iterations=max_iterations,
+        coverage_target=coverage_target,
+        sas_executable=sas_executable,
+        dry_run=dry_run,
+        timeout=timeout,
+        formats=formats,
+        save_iterations=save_iterations,
+        keep_iterations=keep_iterations,
+        verbose=verbose,
+    )
 
-        if not parse_result.all_coverage_points:
-            console.print("  [yellow]No coverage points found — skipping[/yellow]")
-            continue
-
-        # Phase 2: Instrument
-        coverage_csv = str(output_dir / f"{sas_file.stem}_coverage.csv")
-        if use_project or include_paths:
-            # Resolve includes first, then instrument the resolved code
-            from .include_resolver import resolve_includes
-            resolved = resolve_includes(sas_file, search_dirs=include_paths, macro_vars=macro_vars)
-            instr_result = instrument_sas_code(
-                resolved.resolved_code,
-                coverage_csv_path=coverage_csv,
+    if workers > 1:
+        # Files are independent SAS programs: run them side by side, each in
+        # its own work directory so concurrent SAS sessions never share files.
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            outcomes = executor.map(
+                _process_one_file_captured,
+                files_to_process,
+                [
+                    replace(cfg, work_root=output_dir / name, output_name=name)
+                    for name in output_names
+                ],
             )
-        else:
-            instr_result = instrument_sas_file(sas_file, coverage_csv_path=coverage_csv)
-
-        # Save instrumented code for debugging
-        instr_path = output_dir / f"{sas_file.stem}_instrumented.sas"
-        instr_path.write_text(instr_result.instrumented_code, encoding="utf-8")
-        console.print(f"  Instrumented code: {instr_path}")
-
-        # Phase 3: Generate seed datasets
-        datasets = generate_seed_datasets(parse_result, num_rows=num_rows, seed=seed)
-
-        # Phase 4: Iterate
-        file_reports: list[CoverageReport] = []
-
-        for iteration in range(max_iterations):
-            console.print(f"\n  [cyan]--- Iteration {iteration + 1}/{max_iterations} ---[/cyan]")
-
-            # Export datasets
-            iter_dir = output_dir / f"iter_{iteration}"
-            for ds in datasets:
-                export_dataset(ds, iter_dir, formats=formats)
+            for report, output in outcomes:
+                console.file.write(output)
+                if report is not None:
+                    all_reports.append(report)
+    else:
+        for sas_file, name in zip(files_to_process, output_names):
+            report = _process_one_file(sas_file, replace(cfg, output_name=name))
+            if report is not None:
+                all_reports.append(report)
 
-            # Build SAS code with data loading preamble
-            data_load_code = _build_data_load_sas(datasets, iter_dir, libname_map)
-            full_sas_code = data_load_code + "\n" + instr_result.instrumented_code
+    # Overall summary
+    if all_reports:
+        overall = merge_coverage_reports(*all_reports)
+        console.print(f"\n[bold]=== Overall Coverage: {overall.coverage_pct:.1f}% ===[/bold]")
 
-            # Run SAS
-            if dry_run:
-                sas_result = run_sas_dry(full_sas_code, work_dir=str(iter_dir))
-                console.print("  [yellow]Dry run — no SAS execution[/yellow]")
-            else:
-                sas_result = run_sas(
-                    full_sas_code,
-                    work_dir=str(iter_dir),
-                    sas_executable=sas_executable,
-                    timeout_seconds=timeout,
-                    macro_vars=macro_vars,
-                    libname_map=libname_map,
-                )
+        if overall.missed_point_ids:
+            console.print(f"  Missed points ({len(overall.missed_point_ids)}):")
+            for cp in overall.missed_points:
+                console.print(f"    [{cp.point_id}] {cp.description}")
 
-            if sas_result.sas_errors:
-                console.print(f"  [red]SAS errors: {len(sas_result.sas_errors)}[/red]")
-                for err in sas_result.sas_errors[:3]:
-                    console.print(f"    {err}")
+        # Exit with non-zero if coverage is below target
+        if overall.coverage_pct < coverage_target:
+            raise typer.Exit(1)
 
-            # Parse coverage
-            report = parse_coverage_from_log(
-                sas_result.log_text,
-                instr_result.coverage_points,
-            )
-            file_reports.append(report)
 
-            merged = merge_coverage_reports(*file_reports)
-            console.print(f"  Coverage: {merged.hit_points}/{merged.total_points} "
-                          f"({merged.coverage_pct:.1f}%)")
+# SAS declarations per column kind: (length, informat, format)
+_SAS_COLUMN_DECLS = {
+    "numeric": ("8", "", ""),
+    "date": ("8", "yymmdd10.", "date9."),
+}
 
-            # Check if target reached
-            if merged.coverage_pct >= coverage_target:
-                console.print(f"  [green]Target coverage reached![/green]")
-                break
 
-            # Mutate datasets for next iteration
-            datasets = mutate_datasets(
-                datasets,
-                merged,
-                parse_result,
-                seed=seed + iteration + 1,
-            )
+def _sas_column_specs(df) -> list[tuple[str, str, str, str]]:
+    """Derive (name, length, informat, format) SAS declarations from a DataFrame.
 
-        # Export final datasets
-        final_dir = output_dir / "final"
-        for ds in datasets:
-            export_dataset(ds, final_dir, formats=formats)
+    The generated CSVs have a schema known on the Python side, so the loading
+    step can declare it instead of letting PROC IMPORT guess it.
+    """
+    import pandas as pd
+
+    specs = []
+    for col in df.columns:
+        series = df[col]
+        if pd.api.types.is_datetime64_any_dtype(series):
+            kind = "date"
+        elif pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+            kind = "numeric"
+        else:
+            kind = "character"
+
+        if kind == "character":
+            non_missing = series.dropna().astype(str)
+            # SAS lengths are bytes and the CSV is UTF-8: count encoded bytes
+            # so non-ASCII values are not truncated
+            byte_lengths = non_missing.str.encode("utf-8").str.len()
+            width = int(byte_lengths.max()) if len(non_missing) else 0
+            specs.append((str(col), f"${max(width, 1)}", "", ""))
+        else:
+            length, informat, fmt = _SAS_COLUMN_DECLS[kind]
+            specs.append((str(col), length, informat, fmt))
+    return specs
 
-        # Export coverage report
-        final_report = merge_coverage_reports(*file_reports)
-        all_reports.append(final_report)
 
-        report_path = output_dir / f"{sas_file.stem}_coverage_report.json"
-        export_coverage_report(final_report, report_path, format="json")
+def _build_data_load_template(
+    datasets: list,
+    libname_map: dict[str, str] | None = None,
+) -> str:
+    """Build the data loading SAS code with a ``{data_dir}`` placeholder.
 
-        text_report_path = output_dir / f"{sas_file.stem}_coverage_report.txt"
-        export_coverage_report(final_report, text_report_path, format="text")
+    Each dataset is read by a DATA step with explicit LENGTH/INFORMAT/INPUT
+    statements, so SAS reads every CSV once instead of PROC IMPORT's guess
+    pass followed by the load pass. Only the directory changes between `run`
+    iterations, so the template is built once per set of datasets and
+    formatted per iteration.
+    """
+    import io
 
-        console.print(f"\n  [bold]Final coverage: {final_report.coverage_pct:.1f}%[/bold]")
-        console.print(f"  Report: {report_path}")
+    buf = io.StringIO()
+    buf.write("/* Auto-generated data loading */\n")
 
-    # Overall summary
-    if all_reports:
-        overall = merge_coverage_reports(*all_reports)
-        console.print(f"\n[bold]=== Overall Coverage: {overall.coverage_pct:.1f}% ===[/bold]")
+    for ds in datasets:
+        specs = _sas_column_specs(ds.df)
+        if not specs:
+            continue  # Nothing to load for a dataset without columns
+
+        csv_path = f"{{data_dir}}{os.sep}{ds.file_stem}.csv"
+        lengths = " ".join(f"{col} {length}" for col, length, _, _ in specs)
+        informats = " ".join(f"{col} {informat}" for col, _, informat, _ in specs if informat)
+        formats = " ".join(f"{col} {fmt}" for col, _, _, fmt in specs if fmt)
+        inputs = " ".join(
+            f"{col} $" if length.startswith("$") else col
+            for col, length, _, _ in specs
+        )
 
-        if overall.missed_point_ids:
-            console.print(f"  Missed points ({len(overall.missed_point_ids)}):")
-            for cp in overall.missed_points:
-                console.print(f"    [{cp.point_id}] {cp.description}")
+        buf.write(
+            f"data {ds.sas_name};\n"
+            f"  infile \"{csv_path}\" dlm=',' dsd firstobs=2 lrecl=32767 truncover;\n"
+            f"  length {lengths};\n"
+        )
+        if informats:
+            buf.write(f"  informat {informats};\n")
+        if formats:
+            buf.write(f"  format {formats};\n")
+        buf.write(f"  input {inputs};\nrun;\n\n")
 
-        # Exit with non-zero if coverage is below target
-        if overall.coverage_pct < coverage_target:
-            raise typer.Exit(1)
+    return buf.getvalue()
 
 
 def _build_data_load_sas(
@@ -541,26 +1068,7 @@ def _build_data_load_sas(
     libname_map: dict[str, str] | None = None,
 ) -> str:
     """Build SAS code that loads generated CSV datasets into WORK library."""
-    import re as _re
-
-    lines = [
-        "/* Auto-generated data loading */",
-    ]
-
-    for ds in datasets:
-        clean_name = _re.sub(r"[^\w]", "_", ds.name)
-        # Remove library prefix for WORK datasets
-        sas_name = clean_name.split("_", 1)[-1] if "." in ds.name else clean_name
-        csv_path = data_dir / f"{clean_name}.csv"
-
-        if csv_path.exists() or True:  # Will exist at runtime
-            lines.append(f'proc import datafile="{csv_path}"')
-            lines.append(f"  out={sas_name} dbms=csv replace;")
-            lines.append("  getnames=yes;")
-            lines.append("run;")
-            lines.append("")
-
-    return "\n".join(lines)
+    return _build_data_load_template(datasets, libname_map).format(data_dir=data_dir)
 
 
 if __name__ == "__main__":
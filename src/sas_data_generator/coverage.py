@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import csv
 import logging
+import mmap
+import os
 import re
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -12,8 +14,25 @@ from .sas_parser import CoveragePoint, CoveragePointType
 
 logger = logging.getLogger(__name__)
 
-_COV_MARKER_RE = re.compile(r"COV:POINT=([\w:]+)")
+# Point markers and the completion marker, matched in a single scan of the log
+_COV_ANY_RE = re.compile(r"COV:(?:POINT=([\w:]+)|(COMPLETE))")
+_COV_ANY_BYTES_RE = re.compile(rb"COV:(?:POINT=([\w:]+)|(COMPLETE))")
+# Each marker alone: bulk point extraction, and the completion check
+_COV_POINT_RE = re.compile(r"COV:POINT=([\w:]+)")
+_COV_POINT_BYTES_RE = re.compile(rb"COV:POINT=([\w:]+)")
 _COV_COMPLETE_RE = re.compile(r"COV:COMPLETE")
+_COV_COMPLETE_BYTES_RE = re.compile(rb"COV:COMPLETE")
+
+# (combined, point-only, completion-only) patterns per log representation
+_TEXT_PATTERNS = (_COV_ANY_RE, _COV_POINT_RE, _COV_COMPLETE_RE)
+_BYTES_PATTERNS = (_COV_ANY_BYTES_RE, _COV_POINT_BYTES_RE, _COV_COMPLETE_BYTES_RE)
+
+# Above this many expected points, membership tests move out of the
+# per-match Python loop and into C-level set operations
+_BULK_SCAN_MIN_POINTS = 5000
+
+# How much of the end of a log to search first for COV:COMPLETE
+_COMPLETE_TAIL_BYTES = 8192
 
 
 @dataclass
@@ -21,10 +40,12 @@ class CoverageReport:
     """Coverage report for a single run or accumulated across runs."""
     total_points: int = 0
     hit_points: int = 0
-    hit_point_ids: set[str] = field(default_factory=set)
-    missed_point_ids: set[str] = field(default_factory=set)
+    hit_point_ids: frozenset[str] = field(default_factory=frozenset)
+    missed_point_ids: frozenset[str] = field(default_factory=frozenset)
     points_detail: dict[str, CoveragePoint] = field(default_factory=dict)
     is_complete: bool = False  # Whether SAS ran to completion
+    # Every instrumented point ID (hit | missed); empty when not tracked
+    expected_ids: frozenset[str] = field(default_factory=frozenset)
 
     @property
     def coverage_pct(self) -> float:
@@ -40,12 +61,34 @@ class CoverageReport:
             if pid in self.points_detail
         ]
 
+    @property
+    def sorted_hit_ids(self) -> list[str]:
+        return self._sorted("hit_point_ids")
+
+    @property
+    def sorted_missed_ids(self) -> list[str]:
+        return self._sorted("missed_point_ids")
+
+    def _sorted(self, attr: str) -> list[str]:
+        """Sorted view of an ID set, computed once per set object.
+
+        Reports are not modified after construction, so summary() and
+        to_dict() can share one sort. The cache is keyed on the set itself,
+        so assigning a new set invalidates it.
+        """
+        ids = getattr(self, attr)
+        cached = self.__dict__.get(f"_{attr}_sorted")
+        if cached is None or cached[0] is not ids:
+            cached = (ids, sorted(ids))
+            self.__dict__[f"_{attr}_sorted"] = cached
+        return cached[1]
+
     def summary(self) -> str:
         lines = [
             f"Coverage: {self.hit_points}/{self.total_points} "
             f"({self.coverage_pct:.1f}%)",
-            f"  Hit:    {sorted(self.hit_point_ids)}",
-            f"  Missed: {sorted(self.missed_point_ids)}",
+            f"  Hit:    {self.sorted_hit_ids}",
+            f"  Missed: {self.sorted_missed_ids}",
         ]
         if not self.is_complete:
             lines.append("  WARNING: SAS did not run to completion (COV:COMPLETE not found)")
@@ -58,8 +101,8 @@ class CoverageReport:
             "hit_points": self.hit_points,
             "coverage_pct": round(self.coverage_pct, 2),
             "is_complete": self.is_complete,
-            "hit_point_ids": sorted(self.hit_point_ids),
-            "missed_point_ids": sorted(self.missed_point_ids),
+            "hit_point_ids": self.sorted_hit_ids,
+            "missed_point_ids": self.sorted_missed_ids,
             "missed_details": [
                 {
                     "point_id": cp.point_id,
@@ -76,38 +119,154 @@ class CoverageReport:
 def parse_coverage_from_log(
     log_text: str,
     expected_points: list[CoveragePoint],
+    all_ids: frozenset[str] | None = None,
+    detail: dict[str, CoveragePoint] | None = None,
 ) -> CoverageReport:
     """Parse coverage markers from SAS log output.
 
     Args:
         log_text: The full SAS log text.
         expected_points: List of all coverage points we instrumented.
+        all_ids: Precomputed point IDs of expected_points (see expected_index).
+        detail: Precomputed point ID -> CoveragePoint map of expected_points.
 
     Returns:
         CoverageReport with hit/miss information.
     """
-    all_ids = {cp.point_id for cp in expected_points}
-    detail = {cp.point_id: cp for cp in expected_points}
+    all_ids, detail = _fill_index(expected_points, all_ids, detail)
+    return _report_from_markers(log_text, all_ids, detail, _TEXT_PATTERNS)
+
+
+def parse_coverage_from_log_file(
+    log_path: str | Path,
+    expected_points: list[CoveragePoint],
+    all_ids: frozenset[str] | None = None,
+    detail: dict[str, CoveragePoint] | None = None,
+) -> CoverageReport:
+    """Parse coverage markers directly from a SAS log file.
+
+    The file is memory-mapped and scanned as bytes, so a large log is never
+    read and decoded into a str; only the matched point IDs are decoded.
+    """
+    all_ids, detail = _fill_index(expected_points, all_ids, detail)
+    with Path(log_path).open("rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return _report_from_markers(b"", all_ids, detail, _BYTES_PATTERNS)
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return _report_from_markers(mm, all_ids, detail, _BYTES_PATTERNS)
+
+
+def expected_index(
+    expected_points: list[CoveragePoint],
+) -> tuple[frozenset[str], dict[str, CoveragePoint]]:
+    """Return (all_ids, detail) for expected_points.
+
+    Callers parsing several logs against the same instrumented program (one
+    per `run` iteration) compute this once and pass it to the parse_*
+    functions instead of letting each call rebuild it.
+    """
+    return (
+        frozenset(cp.point_id for cp in expected_points),
+        {cp.point_id: cp for cp in expected_points},
+    )
+
+
+def _fill_index(expected_points, all_ids, detail):
+    if all_ids is None or detail is None:
+        return expected_index(expected_points)
+    return all_ids, detail
+
+
+def _report_from_markers(
+    log_data,
+    all_ids: frozenset[str],
+    detail: dict[str, CoveragePoint],
+    patterns: tuple[re.Pattern, re.Pattern, re.Pattern],
+) -> CoverageReport:
+    """Build a CoverageReport by scanning log_data (str, bytes or mmap).
+
+    Once every expected point has been seen, the rest of the log is only
+    searched for the completion marker. Programs with many points skip the
+    per-match loop altogether (see _bulk_hits).
+    """
+    any_re, point_re, complete_re = patterns
+    # Degenerate inputs: nothing logged (SAS never started), or nothing to
+    # hit, where only the completion marker matters
+    if not log_data:
+        return _build_report(all_ids, set(), detail, False)
+    if not all_ids:
+        return _build_report(all_ids, set(), detail, _has_complete_marker(log_data, complete_re))
+
+    if len(all_ids) > _BULK_SCAN_MIN_POINTS:
+        hit_ids = _bulk_hits(point_re.findall(log_data), all_ids)
+        is_complete = _has_complete_marker(log_data, complete_re)
+        return _build_report(all_ids, hit_ids, detail, is_complete)
 
     hit_ids: set[str] = set()
-    for match in _COV_MARKER_RE.finditer(log_text):
+    is_complete = False
+    warn_unknown = logger.isEnabledFor(logging.WARNING)
+    for match in any_re.finditer(log_data):
         point_id = match.group(1)
+        if point_id is None:
+            is_complete = True
+            continue
+        if isinstance(point_id, bytes):
+            point_id = point_id.decode("ascii")
         if point_id in all_ids:
             hit_ids.add(point_id)
-        else:
+            if len(hit_ids) == len(all_ids):
+                is_complete = is_complete or _has_complete_marker(log_data, complete_re, match.end())
+                break
+        elif warn_unknown:
             logger.warning("Unknown coverage point in log: %s", point_id)
 
-    is_complete = bool(_COV_COMPLETE_RE.search(log_text))
+    return _build_report(all_ids, hit_ids, detail, is_complete)
+
+
+def _has_complete_marker(log_data, complete_re: re.Pattern, start: int = 0) -> bool:
+    """Whether COV:COMPLETE occurs in log_data at or after start.
+
+    The postamble emits the marker at the very end of the program, so the
+    last few KB are searched first; the full range is only scanned when the
+    marker is not there (e.g. an aborted run).
+    """
+    tail_start = max(start, len(log_data) - _COMPLETE_TAIL_BYTES)
+    if complete_re.search(log_data, tail_start) is not None:
+        return True
+    return tail_start > start and complete_re.search(log_data, start) is not None
+
+
+def _bulk_hits(found: list, all_ids: frozenset[str]) -> set[str]:
+    """Intersect every point ID found in a log with the expected IDs.
 
+    Deduplicating with set() and intersecting both run in C, which beats a
+    Python-level membership test per marker on logs with many markers.
+    Unknown IDs are reported in one aggregate warning.
+    """
+    unique = {p.decode("ascii") if isinstance(p, bytes) else p for p in set(found)}
+    unknown = unique - all_ids
+    if unknown:
+        logger.warning("%d unknown coverage points in log, e.g. %s",
+                       len(unknown), ", ".join(sorted(unknown)[:5]))
+    return unique & all_ids
+
+
+def _build_report(
+    all_ids: frozenset[str],
+    hit_ids: set[str],
+    detail: dict[str, CoveragePoint],
+    is_complete: bool,
+) -> CoverageReport:
     missed_ids = all_ids - hit_ids
 
     report = CoverageReport(
         total_points=len(all_ids),
         hit_points=len(hit_ids),
-        hit_point_ids=hit_ids,
+        hit_point_ids=frozenset(hit_ids),
         missed_point_ids=missed_ids,
         points_detail=detail,
         is_complete=is_complete,
+        expected_ids=all_ids,
     )
 
     logger.info("Coverage: %d/%d (%.1f%%)", report.hit_points, report.total_points, report.coverage_pct)
@@ -117,6 +276,8 @@ def parse_coverage_from_log(
 def parse_coverage_from_csv(
     csv_path: str | Path,
     expected_points: list[CoveragePoint],
+    all_ids: frozenset[str] | None = None,
+    detail: dict[str, CoveragePoint] | None = None,
 ) -> CoverageReport:
     """Parse coverage from the exported coverage CSV dataset.
 
@@ -124,19 +285,23 @@ def parse_coverage_from_csv(
     PROC EXPORT of the _cov_tracker dataset.
     """
     csv_path = Path(csv_path)
-    all_ids = {cp.point_id for cp in expected_points}
-    detail = {cp.point_id: cp for cp in expected_points}
+    all_ids, detail = _fill_index(expected_points, all_ids, detail)
 
     hit_ids: set[str] = set()
 
     if csv_path.exists():
         try:
-            with csv_path.open(encoding="utf-8") as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    point_id = row.get("point_id", "").strip()
-                    if point_id in all_ids:
-                        hit_ids.add(point_id)
+            with csv_path.open(encoding="utf-8", newline="") as f:
+                reader = csv.reader(f)
+                header = next(reader, [])
+                if "point_id" in header:
+                    # Index rows directly instead of building a dict per row
+                    idx = header.index("point_id")
+                    for row in reader:
+                        if len(row) > idx:
+                            point_id = row[idx].strip()
+                            if point_id in all_ids:
+                                hit_ids.add(point_id)
         except Exception as exc:
             logger.warning("Failed to read coverage CSV %s: %s", csv_path, exc)
     else:
@@ -147,10 +312,11 @@ def parse_coverage_from_csv(
     return CoverageReport(
         total_points=len(all_ids),
         hit_points=len(hit_ids),
-        hit_point_ids=hit_ids,
+        hit_point_ids=frozenset(hit_ids),
         missed_point_ids=missed_ids,
         points_detail=detail,
         is_complete=True,  # If CSV exists, SAS completed
+        expected_ids=all_ids,
     )
 
 
@@ -162,18 +328,27 @@ def merge_coverage_reports(*reports: CoverageReport) -> CoverageReport:
     if not reports:
         return CoverageReport()
 
-    # Use the first report's point detail as the base
-    all_detail = {}
-    all_ids: set[str] = set()
-    all_hits: set[str] = set()
-
-    for report in reports:
-        all_detail.update(report.points_detail)
-        all_ids.update(report.hit_point_ids | report.missed_point_ids)
-        all_hits.update(report.hit_point_ids)
-
+    all_hits = frozenset().union(*(r.hit_point_ids for r in reports))
+    # Runs of one program share their expected_ids set, which then needs no
+    # union; reports without one contribute their hit and missed IDs
+    id_sets = [r.expected_ids or r.hit_point_ids | r.missed_point_ids for r in reports]
+    id_sets = [ids for ids in id_sets if ids]
+    if id_sets and all(ids is id_sets[0] for ids in id_sets):
+        all_ids = id_sets[0]
+    else:
+        all_ids = frozenset().union(*id_sets)
     missed = all_ids - all_hits
 
+    # Reports of the same file usually share one detail mapping; only build
+    # a combined one when merging across files.
+    details = [r.points_detail for r in reports if r.points_detail]
+    if details and all(d is details[0] for d in details):
+        all_detail = details[0]
+    else:
+        all_detail = {}
+        for detail in details:
+            all_detail.update(detail)
+
     return CoverageReport(
         total_points=len(all_ids),
         hit_points=len(all_hits),
@@ -181,33 +356,42 @@ def merge_coverage_reports(*reports: CoverageReport) -> CoverageReport:
         missed_point_ids=missed,
         points_detail=all_detail,
         is_complete=any(r.is_complete for r in reports),
+        expected_ids=all_ids,
     )
 
 
+def _dump_json(data: dict) -> bytes:
+    """Serialize data as indented JSON, with orjson when installed."""
+    try:
+        import orjson
+    except ImportError:
+        import json
+        return json.dumps(data, indent=2).encode("utf-8")
+    return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+
+
 def export_coverage_report(
     report: CoverageReport,
     output_path: str | Path,
     format: str = "json",
 ) -> None:
     """Export coverage report to file."""
-    import json
-
     output_path = Path(output_path)
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
+    # Render in memory and write once: json.dump and per-line writes issue
+    # one write() call per token/line.
     if format == "json":
-        with output_path.open("w", encoding="utf-8") as f:
-            json.dump(report.to_dict(), f, indent=2)
+        output_path.write_bytes(_dump_json(report.to_dict()))
         logger.info("Coverage report written to %s", output_path)
     elif format == "text":
-        with output_path.open("w", encoding="utf-8") as f:
-            f.write(report.summary())
-            f.write("\n\nMissed Points Detail:\n")
-            for cp in report.missed_points:
-                f.write(f"  [{cp.point_id}] {cp.point_type.name} line {cp.line_number}: "
-                        f"{cp.description}\n")
-                if cp.condition:
-                    f.write(f"    Condition: {cp.condition}\n")
+        parts = [report.summary(), "\n\nMissed Points Detail:\n"]
+        for cp in report.missed_points:
+            parts.append(f"  [{cp.point_id}] {cp.point_type.name} line {cp.line_number}: "
+                         f"{cp.description}\n")
+            if cp.condition:
+                parts.append(f"    Condition: {cp.condition}\n")
+        output_path.write_text("".join(parts), encoding="utf-8")
         logger.info("Coverage report written to %s", output_path)
     else:
         raise ValueError(f"Unknown format: {format}")
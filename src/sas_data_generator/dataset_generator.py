@@ -17,8 +17,11 @@ Strategy:
 
 from __future__ import annotations
 
+import functools
 import logging
+import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 
@@ -31,6 +34,7 @@ from .sas_parser import (
     CoveragePointType,
     ParseResult,
     VariableRef,
+    _merge_variables,
 )
 
 logger = logging.getLogger(__name__)
@@ -52,6 +56,44 @@ class GeneratedDataset:
     csv_path: str = ""
     generation_notes: list[str] = field(default_factory=list)
 
+    @property
+    def file_stem(self) -> str:
+        """File name (without extension) used when exporting this dataset."""
+        return _dataset_names(self.name)[0]
+
+    @property
+    def sas_name(self) -> str:
+        """Dataset name to create in SAS (library prefix dropped for WORK)."""
+        return _dataset_names(self.name)[1]
+
+
+class _NameTranslation(dict):
+    """str.translate table mapping every non-word character to "_".
+
+    Same result as re.sub(r"[^\\w]", "_", name), filled lazily per code point.
+    """
+
+    def __missing__(self, codepoint: int) -> int | str:
+        char = chr(codepoint)
+        value = codepoint if char.isalnum() or char == "_" else "_"
+        self[codepoint] = value
+        return value
+
+
+_NAME_TRANSLATION = _NameTranslation()
+
+
+@functools.lru_cache(maxsize=None)
+def _dataset_names(name: str) -> tuple[str, str]:
+    """Return (file_stem, sas_name) for a dataset name.
+
+    Names are stable across seed and mutated datasets, so the sanitizing is
+    done once per name rather than on every export and `run` iteration.
+    """
+    file_stem = name.translate(_NAME_TRANSLATION)
+    sas_name = file_stem.split("_", 1)[-1] if "." in name else file_stem
+    return file_stem, sas_name
+
 
 # ---------------------------------------------------------------------------
 # Value generation helpers
@@ -59,75 +101,104 @@ class GeneratedDataset:
 
 _NUMERIC_EDGE_VALUES = [0, 1, -1, 0.5, -0.5, 999999, -999999, 0.001]
 _DATE_EDGE_VALUES = pd.to_datetime(["1960-01-01", "2000-01-01", "2025-12-31", "1999-12-31"])
+_SAS_EPOCH = np.datetime64("1960-01-01", "D")
+_DATE_EDGE_DAYS = (_DATE_EDGE_VALUES.to_numpy().astype("datetime64[D]") - _SAS_EPOCH).astype(np.int64)
+# Largest day offset a pandas Timedelta accepts
+_MAX_DATE_OFFSET_DAYS = 106751
+# Below this many cells (rows x columns) per dataset, threads cost more
+# than they save
+_PARALLEL_MIN_CELLS = 1_000_000
 _CHAR_EDGE_VALUES = ["", " ", "A", "test", "NULL", "missing", "X" * 50]
 
 
-def _extract_threshold_values(condition: str) -> list[float]:
-    """Extract numeric threshold values from a SAS condition.
+# Everything the generator reads from a condition, in one tokenizer pass:
+# "var OP number" comparisons, IN (...) lists and quoted string literals
+_CONDITION_TOKEN_RE = re.compile(
+    r"""(?ix)
+    (?P<var>\w+)\s*(?P<op>>=?|<=?|=|eq|ne|gt|lt|ge|le)\s*(?P<num>\d+\.?\d*)
+    |\bin\s*\((?P<inlist>[^)]+)\)
+    |['"](?P<str>[^'"]*?)['"]
+    """,
+)
 
-    For example: 'age > 65' -> [64, 65, 66]
-                 'score >= 80' -> [79, 80, 81]
-                 'amount in (100, 200, 300)' -> [100, 200, 300, 99, 301]
-    """
-    values = []
+# Every token above needs a digit, a quote or an IN list parenthesis
+_CONDITION_HINT_RE = re.compile(r"[\d'\"(]")
 
-    # Direct comparisons: var OP number
-    for match in re.finditer(r"(\w+)\s*(>=?|<=?|=|eq|ne|gt|lt|ge|le)\s*(\d+\.?\d*)", condition, re.I):
-        try:
-            threshold = float(match.group(3))
-            operator = match.group(2).lower()
+# Used by the mutator to find which variable a missed condition tests
+_COMPARISON_RE = re.compile(r"(\w+)\s*(>=?|<=?|=|ne|eq|gt|lt|ge|le)\s*(\d+\.?\d*)", re.I)
+_STRING_COMPARISON_RE = re.compile(r"""(\w+)\s*=\s*['"]([^'"]*?)['"]""", re.I)
 
-            # Generate boundary values around the threshold
-            if operator in (">", "gt"):
-                values.extend([threshold - 1, threshold, threshold + 1])
-            elif operator in (">=", "ge"):
-                values.extend([threshold - 1, threshold, threshold + 1])
-            elif operator in ("<", "lt"):
-                values.extend([threshold - 1, threshold, threshold + 1])
-            elif operator in ("<=", "le"):
-                values.extend([threshold - 1, threshold, threshold + 1])
-            elif operator in ("=", "eq"):
-                values.extend([threshold - 1, threshold, threshold + 1])
-            elif operator in ("ne",):
-                values.extend([threshold, threshold + 1])
-        except ValueError:
-            pass
-
-    # IN lists: var in (val1, val2, ...)
-    for match in re.finditer(r"\bin\s*\(([^)]+)\)", condition, re.I):
-        for val_str in match.group(1).split(","):
-            val_str = val_str.strip().strip("'\"")
-            try:
-                values.append(float(val_str))
-            except ValueError:
-                pass  # Non-numeric, skip
-
-    return values
 
+@functools.lru_cache(maxsize=4096)
+def _scan_condition(condition: str) -> tuple[tuple[float, ...], tuple[str, ...]]:
+    """Return (threshold values, string values) for a condition.
 
-def _extract_string_values(condition: str) -> list[str]:
-    """Extract string literal values from a SAS condition.
-
-    For example: 'status = "ACTIVE"' -> ["ACTIVE", "INACTIVE", ""]
-                 'type in ("A", "B")' -> ["A", "B", "C", ""]
+    The same conditions are looked at for every column of every dataset,
+    so results are cached per condition string.
     """
-    values = []
-
-    # Quoted strings
-    for match in re.finditer(r"""['"]([^'"]*?)['"]""", condition):
-        values.append(match.group(1))
+    # Conditions such as "flag" or "first.id" hold no value to extract:
+    # a character-class search is cheaper than running the tokenizer
+    if not _CONDITION_HINT_RE.search(condition):
+        return (), ()
+
+    numerics: list[float] = []
+    strings: list[str] = []
+
+    for match in _CONDITION_TOKEN_RE.finditer(condition):
+        kind = match.lastgroup
+        if kind == "num":
+            threshold = float(match.group("num"))
+            operator = match.group("op").lower()
+            # Generate boundary values around the threshold
+            if operator == "ne":
+                numerics.extend([threshold, threshold + 1])
+            else:
+                numerics.extend([threshold - 1, threshold, threshold + 1])
+        elif kind == "inlist":
+            for val_str in match.group("inlist").split(","):
+                val_str = val_str.strip()
+                unquoted = val_str.strip("'\"")
+                if unquoted != val_str:
+                    strings.append(unquoted)
+                try:
+                    numerics.append(float(unquoted))
+                except ValueError:
+                    pass  # Non-numeric, skip
+        else:
+            strings.append(match.group("str"))
 
     # Add variations
     extra = []
-    for v in values:
+    for v in strings:
         if v.upper() != v:
             extra.append(v.upper())
         if v:
             extra.append("")
             extra.append(v[0])  # First character
-    values.extend(extra)
+    strings.extend(extra)
+
+    # dict.fromkeys dedupes in first-seen order, so a given --seed yields the
+    # same datasets in every process (set order varies with hash seeding)
+    return tuple(numerics), tuple(dict.fromkeys(strings))
+
 
-    return list(set(values))
+def _extract_threshold_values(condition: str) -> list[float]:
+    """Extract numeric threshold values from a SAS condition.
+
+    For example: 'age > 65' -> [64, 65, 66]
+                 'score >= 80' -> [79, 80, 81]
+                 'amount in (100, 200, 300)' -> [100, 200, 300, 99, 301]
+    """
+    return list(_scan_condition(condition)[0])
+
+
+def _extract_string_values(condition: str) -> list[str]:
+    """Extract string literal values from a SAS condition.
+
+    For example: 'status = "ACTIVE"' -> ["ACTIVE", "INACTIVE", ""]
+                 'type in ("A", "B")' -> ["A", "B", "C", ""]
+    """
+    return list(_scan_condition(condition)[1])
 
 
 def _generate_column_values(
@@ -135,67 +206,65 @@ def _generate_column_values(
     num_rows: int,
     rng: np.random.Generator,
     conditions: list[str] | None = None,
-) -> pd.Series:
-    """Generate values for a single column based on variable metadata and conditions."""
-    values = []
+) -> np.ndarray:
+    """Generate values for a single column based on variable metadata and conditions.
 
+    Returns a bare ndarray so the caller can assemble the DataFrame in one go,
+    without building (and index-aligning) a Series per column.
+    """
     # Gather condition-based values
     condition_numerics: list[float] = []
     condition_strings: list[str] = []
     if conditions:
         for cond in conditions:
-            condition_numerics.extend(_extract_threshold_values(cond))
-            condition_strings.extend(_extract_string_values(cond))
+            numerics, strings = _scan_condition(cond)
+            condition_numerics.extend(numerics)
+            condition_strings.extend(strings)
 
     if var.inferred_type == "character":
         # Mix of condition-extracted values and random strings
         pool = condition_strings or _CHAR_EDGE_VALUES[:]
         if not pool:
             pool = ["A", "B", "C", "X", ""]
-        values = list(rng.choice(pool, size=num_rows))
+        # Gather from an object array: no intermediate fixed-width str array
+        pool_arr = np.asarray(pool, dtype=object)
+        return pool_arr[rng.integers(0, pool_arr.size, size=num_rows)]
 
     elif var.inferred_type == "date":
-        # Generate date values
-        base_dates = _DATE_EDGE_VALUES.tolist()
-        if condition_numerics:
-            # SAS dates are days since 1960-01-01
-            for n in condition_numerics:
-                try:
-                    base_dates.append(pd.Timestamp("1960-01-01") + pd.Timedelta(days=int(n)))
-                except (OverflowError, ValueError):
-                    pass
-        # Fill remaining with random dates
-        pool_dates = base_dates[:num_rows]
-        while len(pool_dates) < num_rows:
-            random_days = rng.integers(0, 25000)
-            pool_dates.append(pd.Timestamp("1960-01-01") + pd.Timedelta(days=int(random_days)))
-        values = pool_dates[:num_rows]
+        # Day offsets from the SAS epoch (1960-01-01): edge dates first, then
+        # condition values read as SAS dates, then random dates
+        cond_days = np.asarray(condition_numerics, dtype=np.float64)
+        # Offsets a Timedelta can hold; NaN fails the comparison too
+        cond_days = np.trunc(cond_days[np.abs(cond_days) <= _MAX_DATE_OFFSET_DAYS])
+        seed_days = np.concatenate([_DATE_EDGE_DAYS, cond_days.astype(np.int64)])
+        offsets = np.empty(num_rows, dtype=np.int64)
+        filled = min(seed_days.size, num_rows)
+        offsets[:filled] = seed_days[:filled]
+        if filled < num_rows:
+            offsets[filled:] = rng.integers(0, 25000, size=num_rows - filled)
+        return (_SAS_EPOCH + offsets.astype("timedelta64[D]")).astype(_DATE_EDGE_VALUES.dtype)
 
     else:
-        # Numeric (default)
+        # Numeric (default): filled in place in one float64 array
         # Start with condition-based values and edge values
-        seed_values = condition_numerics + _NUMERIC_EDGE_VALUES
+        seed_values = np.asarray(condition_numerics + _NUMERIC_EDGE_VALUES, dtype=np.float64)
+        out = np.empty(num_rows, dtype=np.float64)
         # Ensure we have enough values
-        if len(seed_values) >= num_rows:
-            values = list(rng.choice(seed_values, size=num_rows, replace=True))
+        if seed_values.size >= num_rows:
+            out[:] = rng.choice(seed_values, size=num_rows, replace=True)
         else:
-            values = seed_values[:]
+            out[:seed_values.size] = seed_values
             # Fill remaining with random values in a reasonable range
             if condition_numerics:
                 low = min(condition_numerics) - 10
                 high = max(condition_numerics) + 10
             else:
                 low, high = -100, 100
-            remaining = num_rows - len(values)
-            values.extend(rng.uniform(low, high, size=remaining).tolist())
+            out[seed_values.size:] = rng.uniform(low, high, size=num_rows - seed_values.size)
         # Add some NaN (SAS missing) values
         if num_rows > 5:
-            nan_indices = rng.choice(num_rows, size=max(1, num_rows // 10), replace=False)
-            for idx in nan_indices:
-                if idx < len(values):
-                    values[idx] = np.nan
-
-    return pd.Series(values[:num_rows], name=var.name)
+            out[rng.choice(num_rows, size=max(1, num_rows // 10), replace=False)] = np.nan
+        return out
 
 
 # ---------------------------------------------------------------------------
@@ -214,47 +283,38 @@ def generate_seed_datasets(
     - What columns are needed (from INPUT/conditions)
     - What values to use (from conditions/comparisons)
     """
-    rng = np.random.default_rng(seed)
+    seed_seq = np.random.SeedSequence(seed)
     datasets: list[GeneratedDataset] = []
 
-    # Collect all input datasets and their required variables
-    dataset_vars: dict[str, list[VariableRef]] = {}
-    dataset_conditions: dict[str, list[str]] = {}
+    # Collect all input datasets and their required variables, deduplicated
+    # as they are collected: variables by lowercase name (SAS names are
+    # case-insensitive), conditions by text (dict keys keep first-seen order)
+    dataset_vars: dict[str, dict[str, VariableRef]] = {}
+    dataset_conditions: dict[str, dict[str, None]] = {}
 
     for block in parse_result.blocks:
         for ds_name in block.input_datasets:
             ds_key = ds_name.lower()
-            if ds_key not in dataset_vars:
-                dataset_vars[ds_key] = []
-                dataset_conditions[ds_key] = []
-
             # Add variables found in this block
-            dataset_vars[ds_key].extend(block.variables)
+            _merge_variables(dataset_vars.setdefault(ds_key, {}), block.variables)
 
             # Collect conditions
+            conditions = dataset_conditions.setdefault(ds_key, {})
             for cp in block.coverage_points:
                 if cp.condition:
-                    dataset_conditions[ds_key].append(cp.condition)
+                    conditions[cp.condition] = None
 
     # Also add variables from the global parse result
     if not dataset_vars:
         # No input datasets found — create a default one
         if parse_result.all_variables:
-            dataset_vars["input"] = parse_result.all_variables
-            dataset_conditions["input"] = [
+            dataset_vars["input"] = _merge_variables({}, parse_result.all_variables)
+            dataset_conditions["input"] = dict.fromkeys(
                 cp.condition for cp in parse_result.all_coverage_points if cp.condition
-            ]
+            )
 
     # Generate each dataset
-    for ds_name, variables in dataset_vars.items():
-        # Deduplicate variables
-        seen = {}
-        for v in variables:
-            key = v.name.lower()
-            if key not in seen or (seen[key].inferred_type == "unknown" and v.inferred_type != "unknown"):
-                seen[key] = v
-        unique_vars = list(seen.values())
-
+    for ds_name, unique_vars in dataset_vars.items():
         if not unique_vars:
             logger.warning("No variables found for dataset %s, creating empty dataset", ds_name)
             datasets.append(GeneratedDataset(
@@ -265,23 +325,36 @@ def generate_seed_datasets(
             continue
 
         # Find conditions that reference each variable
-        conditions = dataset_conditions.get(ds_name, [])
+        conditions = dataset_conditions.get(ds_name, {})
         var_conditions: dict[str, list[str]] = {}
+        # One alternation over all variable names: each condition is scanned
+        # once, whatever the number of variables
+        names = sorted(unique_vars, key=len, reverse=True)
+        names_re = re.compile(r"\b(?:" + "|".join(map(re.escape, names)) + r")\b", re.I)
         for cond in conditions:
-            for v in unique_vars:
-                if re.search(rf"\b{re.escape(v.name)}\b", cond, re.I):
-                    var_conditions.setdefault(v.name.lower(), []).append(cond)
-
-        # Generate columns
-        columns = {}
-        for v in unique_vars:
-            v_conds = var_conditions.get(v.name.lower(), [])
-            columns[v.name] = _generate_column_values(v, num_rows, rng, v_conds)
+            for key in {m.group(0).lower() for m in names_re.finditer(cond)}:
+                var_conditions.setdefault(key, []).append(cond)
+
+        # Generate columns. Each column draws from its own stream spawned from
+        # the seed, so the result does not depend on how columns are scheduled.
+        col_rngs = [np.random.default_rng(s) for s in seed_seq.spawn(len(unique_vars))]
+        jobs = [
+            (v, num_rows, col_rng, var_conditions.get(key, []))
+            for (key, v), col_rng in zip(unique_vars.items(), col_rngs)
+        ]
+        workers = min(len(jobs), os.cpu_count() or 1)
+        if workers > 1 and num_rows * len(jobs) >= _PARALLEL_MIN_CELLS:
+            # NumPy releases the GIL while filling large arrays
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                values = list(pool.map(lambda job: _generate_column_values(*job), jobs))
+        else:
+            values = [_generate_column_values(*job) for job in jobs]
+        columns = {v.name: arr for v, arr in zip(unique_vars.values(), values)}
 
-        df = pd.DataFrame(columns)
+        df = pd.DataFrame(columns, copy=False)
         notes = [
             f"Seed dataset with {num_rows} rows, {len(unique_vars)} columns",
-            f"Variables: {[v.name for v in unique_vars]}",
+            f"Variables: {[v.name for v in unique_vars.values()]}",
             f"Conditions analyzed: {len(conditions)}",
         ]
 
@@ -319,7 +392,14 @@ def mutate_datasets(
     logger.info("Targeting %d missed coverage points", len(missed))
 
     for ds in datasets:
-        new_rows: list[dict] = []
+        columns = ds.df.columns.tolist()
+        # New rows are accumulated column by column: one list per column,
+        # all kept the same length (NaN where a row sets no value)
+        new_cols: dict[str, list] = {col: [] for col in columns}
+        # Case-insensitive column lookup (first match wins)
+        col_lookup: dict[str, str] = {}
+        for col in columns:
+            col_lookup.setdefault(col.lower(), col)
 
         for cp in missed:
             if not cp.condition:
@@ -328,60 +408,56 @@ def mutate_datasets(
             # Generate values that should trigger this branch
             if cp.point_type == CoveragePointType.IF_TRUE:
                 # Need to make the condition TRUE
-                _add_targeted_rows(new_rows, cp.condition, ds.df.columns.tolist(), rng, target_true=True)
+                _add_targeted_rows(new_cols, cp.condition, col_lookup, target_true=True)
             elif cp.point_type == CoveragePointType.IF_FALSE:
                 # Need to make the condition FALSE
-                _add_targeted_rows(new_rows, cp.condition, ds.df.columns.tolist(), rng, target_true=False)
+                _add_targeted_rows(new_cols, cp.condition, col_lookup, target_true=False)
             elif cp.point_type in (CoveragePointType.SELECT_WHEN, CoveragePointType.SQL_CASE_WHEN):
-                _add_targeted_rows(new_rows, cp.condition, ds.df.columns.tolist(), rng, target_true=True)
+                _add_targeted_rows(new_cols, cp.condition, col_lookup, target_true=True)
             elif cp.point_type in (CoveragePointType.SELECT_OTHERWISE, CoveragePointType.SQL_CASE_ELSE):
                 # Need a value that doesn't match ANY of the WHEN conditions
-                _add_edge_case_rows(new_rows, ds.df.columns.tolist(), rng)
-
-        if new_rows:
-            mutation_df = pd.DataFrame(new_rows)
-            # Align columns
-            for col in ds.df.columns:
-                if col not in mutation_df.columns:
-                    mutation_df[col] = np.nan
-            mutation_df = mutation_df[ds.df.columns]
+                _add_edge_case_rows(new_cols, rng)
 
+        num_new = len(next(iter(new_cols.values()), []))
+        if num_new:
+            # Built from columns, so no per-row dict inference or realignment;
+            # concat still reconciles dtypes with the existing frame
+            mutation_df = pd.DataFrame(new_cols, columns=ds.df.columns)
             combined = pd.concat([ds.df, mutation_df], ignore_index=True)
-            notes = ds.generation_notes + [f"Mutated: added {len(new_rows)} targeted rows"]
+            notes = ds.generation_notes + [f"Mutated: added {num_new} targeted rows"]
             mutated.append(GeneratedDataset(
                 name=ds.name,
                 df=combined,
                 generation_notes=notes,
             ))
-            logger.info("Mutated dataset '%s': added %d rows", ds.name, len(new_rows))
+            logger.info("Mutated dataset '%s': added %d rows", ds.name, num_new)
         else:
             mutated.append(ds)
 
     return mutated
 
 
+def _append_row(new_cols: dict[str, list], row: dict) -> None:
+    """Append one row to column lists, using NaN for columns it does not set."""
+    for col, values in new_cols.items():
+        values.append(row.get(col, np.nan))
+
+
 def _add_targeted_rows(
-    rows: list[dict],
+    new_cols: dict[str, list],
     condition: str,
-    columns: list[str],
-    rng: np.random.Generator,
+    col_lookup: dict[str, str],
     target_true: bool = True,
 ) -> None:
     """Generate rows targeting a specific condition to be true or false."""
     # Parse the condition to extract variable comparisons
-    for match in re.finditer(
-        r"(\w+)\s*(>=?|<=?|=|ne|eq|gt|lt|ge|le)\s*(\d+\.?\d*)",
-        condition, re.I,
-    ):
-        var_name = match.group(1).lower()
-        operator = match.group(2).lower()
-        threshold = float(match.group(3))
-
-        if var_name not in [c.lower() for c in columns]:
+    for match in _COMPARISON_RE.finditer(condition):
+        col_name = col_lookup.get(match.group(1).lower())
+        if col_name is None:
             continue
 
-        # Map column name (case-insensitive match)
-        col_name = next(c for c in columns if c.lower() == var_name)
+        operator = match.group(2).lower()
+        threshold = float(match.group(3))
 
         # Determine target value
         if target_true:
@@ -389,43 +465,33 @@ def _add_targeted_rows(
         else:
             value = _value_to_violate(operator, threshold)
 
-        row = {col_name: value}
-        rows.append(row)
+        _append_row(new_cols, {col_name: value})
         return
 
     # String conditions
-    for match in re.finditer(
-        r"""(\w+)\s*=\s*['"]([^'"]*?)['"]""",
-        condition, re.I,
-    ):
-        var_name = match.group(1).lower()
-        string_val = match.group(2)
-
-        if var_name not in [c.lower() for c in columns]:
+    for match in _STRING_COMPARISON_RE.finditer(condition):
+        col_name = col_lookup.get(match.group(1).lower())
+        if col_name is None:
             continue
 
-        col_name = next(c for c in columns if c.lower() == var_name)
-
         if target_true:
-            rows.append({col_name: string_val})
+            _append_row(new_cols, {col_name: match.group(2)})
         else:
-            rows.append({col_name: "ZZZZ_NOMATCH"})
+            _append_row(new_cols, {col_name: "ZZZZ_NOMATCH"})
         return
 
 
 def _add_edge_case_rows(
-    rows: list[dict],
-    columns: list[str],
+    new_cols: dict[str, list],
     rng: np.random.Generator,
 ) -> None:
     """Add edge-case rows (missing values, extremes)."""
     # Row with all missing
-    rows.append({col: np.nan for col in columns})
+    for values in new_cols.values():
+        values.append(np.nan)
     # Row with extreme values
-    extreme_row = {}
-    for col in columns:
-        extreme_row[col] = rng.choice([999999, -999999, 0])
-    rows.append(extreme_row)
+    for values in new_cols.values():
+        values.append(rng.choice([999999, -999999, 0]))
 
 
 def _value_to_satisfy(operator: str, threshold: float) -> float:
@@ -464,6 +530,47 @@ def _value_to_violate(operator: str, threshold: float) -> float:
     return threshold + 1
 
 
+def _to_arrow(df: pd.DataFrame):
+    """Convert a DataFrame to a pyarrow Table once, for every Arrow-based writer.
+
+    Returns None when pyarrow is not installed or cannot convert the frame
+    (e.g. mixed-type object columns after mutation); callers then fall back
+    to pandas.
+    """
+    try:
+        import pyarrow as pa
+    except ImportError:
+        return None
+
+    try:
+        return pa.Table.from_pandas(df, preserve_index=False)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        return None
+
+
+def _write_csv(df: pd.DataFrame, csv_path: Path, table=None) -> None:
+    """Write a DataFrame as CSV, using pyarrow's columnar writer when available.
+
+    pyarrow serializes whole columns in C++ instead of formatting row by row,
+    which matters for large --rows values. Date columns are written as
+    YYYY-MM-DD, the layout the generated SAS loading step reads with
+    yymmdd10. Without an Arrow table (see _to_arrow) pandas writes the file.
+    """
+    if table is None:
+        df.to_csv(csv_path, index=False)
+        return
+
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+
+    for i, arrow_field in enumerate(table.schema):
+        if pa.types.is_timestamp(arrow_field.type):
+            dates = table.column(i).cast(pa.date32(), safe=False)
+            table = table.set_column(i, arrow_field.name, dates)
+
+    pa_csv.write_csv(table, str(csv_path))
+
+
 def export_dataset(
     dataset: GeneratedDataset,
     output_dir: str | Path,
@@ -474,7 +581,7 @@ def export_dataset(
     Args:
         dataset: The dataset to export.
         output_dir: Directory to write files to.
-        formats: List of formats ("csv", "sas7bdat"). Defaults to ["csv"].
+        formats: List of formats ("csv", "parquet", "sas7bdat"). Defaults to ["csv"].
 
     Returns:
         List of file paths created.
@@ -487,16 +594,35 @@ def export_dataset(
 
     paths = []
 
-    # Clean dataset name for filename
-    clean_name = re.sub(r"[^\w]", "_", dataset.name)
+    clean_name = dataset.file_stem
+
+    # CSV and Parquet share one pandas -> Arrow conversion
+    table = _to_arrow(dataset.df) if "csv" in formats or "parquet" in formats else None
 
     if "csv" in formats:
         csv_path = output_dir / f"{clean_name}.csv"
-        dataset.df.to_csv(csv_path, index=False)
+        _write_csv(dataset.df, csv_path, table)
         dataset.csv_path = str(csv_path)
         paths.append(str(csv_path))
         logger.info("Exported CSV: %s", csv_path)
 
+    if "parquet" in formats:
+        try:
+            parquet_path = output_dir / f"{clean_name}.parquet"
+            # zstd keeps snapshots several times smaller than CSV at little CPU cost
+            if table is not None:
+                import pyarrow.parquet as pq
+                pq.write_table(table, parquet_path, compression="zstd")
+            else:
+                dataset.df.to_parquet(parquet_path, index=False, compression="zstd")
+            paths.append(str(parquet_path))
+            logger.info("Exported Parquet: %s", parquet_path)
+        except ImportError:
+            logger.warning(
+                "pyarrow not installed — skipping Parquet export. "
+                "Install with: pip install pyarrow"
+            )
+
     if "sas7bdat" in formats:
         try:
             import pyreadstat
@@ -31,29 +31,38 @@ Limitations:
 
 from __future__ import annotations
 
+import functools
+import io
 import logging
+import os
 import re
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass, field
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
-# Match %INCLUDE or %INC with quoted or unquoted path
+# Match %INCLUDE or %INC with quoted or unquoted path. No part of the
+# pattern matches "\n", so searching a whole file finds what a search of
+# each line would.
 _INCLUDE_RE = re.compile(
     r"""(?ix)
-    %\s*inc(?:lude)?\s+      # %include or %inc
+    %[^\S\n]*inc(?:lude)?[^\S\n]+  # %include or %inc
     (?:
-        "([^"]+)"            # double-quoted path  (group 1)
-        |'([^']+)'           # single-quoted path  (group 2)
-        |(\S+?)              # unquoted path        (group 3)
+        "([^"\n]+)"                 # double-quoted path  (group 1)
+        |'([^'\n]+)'                # single-quoted path  (group 2)
+        |(\S+?)                     # unquoted path        (group 3)
     )
-    \s*;                     # trailing semicolon
+    [^\S\n]*;                       # trailing semicolon
     """,
 )
 
 # Match macro variable references in paths: &varname. or &varname
 _MACRO_VAR_RE = re.compile(r"&(\w+)\.?")
 
+# Line boundaries str.splitlines() honours besides "\n"
+_OTHER_LINE_BREAKS_RE = re.compile(r"[\r\v\f\x1c-\x1e\x85\u2028\u2029]")
+
 
 @dataclass
 class ResolvedSource:
@@ -68,13 +77,97 @@ class ResolvedSource:
     # (start_line, end_line, original_file_path)
 
 
+def _iter_sas(root: str | Path) -> Iterator[Path]:
+    """Yield every .sas file under root, recursively.
+
+    os.scandir reports the entry type from the directory listing, so files
+    are filtered by name before any Path is built and no extra stat is
+    needed. Symlinked directories are not followed (no loops).
+    """
+    stack = [os.fspath(root)]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.endswith(".sas"):
+                        yield Path(entry.path)
+        except OSError as exc:
+            logger.warning("Cannot scan directory %s: %s", current, exc)
+
+
+@functools.lru_cache(maxsize=512)
+def _read_and_scan(
+    path: str, mtime_ns: int, size: int,
+) -> tuple[str, tuple[tuple[int, int, str], ...]]:
+    """Read a SAS file and locate its %INCLUDE directives.
+
+    Returns the text, normalized to "\n" line breaks and ending with one,
+    and a (line_start, line_end, include_path) entry per directive line.
+    Projects include the same macro files from many entry points; the
+    modification time and size are part of the cache key, so an edited
+    file is read again.
+    """
+    raw = Path(path).read_text(encoding="utf-8", errors="replace")
+
+    # Normalize to "\n"-only text so lines can be counted with str.count
+    if _OTHER_LINE_BREAKS_RE.search(raw):
+        raw = "".join(line + "\n" for line in raw.splitlines())
+    elif raw and not raw.endswith("\n"):
+        raw += "\n"
+
+    # One directive per line: the search resumes on the next line
+    directives = []
+    include_match = _INCLUDE_RE.search(raw)
+    while include_match:
+        line_start = raw.rfind("\n", 0, include_match.start()) + 1
+        line_end = raw.index("\n", include_match.end())
+        # Extract the path from whichever group matched
+        inc_path = include_match.group(1) or include_match.group(2) or include_match.group(3)
+        directives.append((line_start, line_end, inc_path))
+        include_match = _INCLUDE_RE.search(raw, line_end + 1)
+    return raw, tuple(directives)
+
+
+def _read_and_scan_path(path: Path) -> None:
+    try:
+        st = path.stat()
+        _read_and_scan(str(path), st.st_mtime_ns, st.st_size)
+    except OSError:
+        pass  # Reported when the file is actually resolved
+
+
+def prefetch_sources(paths: Iterable[str | Path], max_workers: int = 8) -> None:
+    """Read and scan SAS files ahead of resolve_includes, several at a time.
+
+    File reads release the GIL, so on a cold cache or a network share the
+    waits overlap instead of adding up. Results land in the same cache
+    resolve_includes reads from; unreadable files are skipped here and
+    reported when resolved.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    paths = [Path(p).resolve() for p in paths]
+    if len(paths) < 2:
+        return
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(paths)))) as pool:
+        list(pool.map(_read_and_scan_path, paths))
+
+
 def _expand_macro_vars(path_str: str, macro_vars: dict[str, str]) -> str:
-    """Expand &macro_var references in an include path."""
+    """Expand &macro_var references in an include path.
+
+    macro_vars must have lowercase keys (see resolve_includes).
+    """
+    if "&" not in path_str:
+        return path_str
+
     def _replacer(m: re.Match) -> str:
-        var_name = m.group(1).lower()
-        for key, value in macro_vars.items():
-            if key.lower() == var_name:
-                return value
+        value = macro_vars.get(m.group(1).lower())
+        if value is not None:
+            return value
         # Unknown macro var — leave as-is but warn
         logger.warning("Unresolved macro variable in include path: &%s", m.group(1))
         return m.group(0)
@@ -82,10 +175,33 @@ def _expand_macro_vars(path_str: str, macro_vars: dict[str, str]) -> str:
     return _MACRO_VAR_RE.sub(_replacer, path_str)
 
 
+def _index_search_dirs(search_dirs: list[Path]) -> dict[str, list[Path]]:
+    """Map each file name found directly in search_dirs to its paths.
+
+    Names are keyed by os.path.normcase, so lookups fold case where the
+    platform does (Windows). Paths are listed in search-directory order,
+    so the first entry is the one a directory-by-directory probe would
+    have found.
+    """
+    index: dict[str, list[Path]] = {}
+    for search_dir in search_dirs:
+        try:
+            with os.scandir(search_dir) as entries:
+                for entry in entries:
+                    if entry.is_file():
+                        index.setdefault(os.path.normcase(entry.name), []).append(
+                            search_dir / entry.name
+                        )
+        except OSError as exc:
+            logger.warning("Cannot scan include directory %s: %s", search_dir, exc)
+    return index
+
+
 def _find_include_file(
     include_path: str,
     current_file_dir: Path,
     search_dirs: list[Path],
+    search_index: dict[str, list[Path]],
 ) -> Path | None:
     """Find an included file by searching multiple directories.
 
@@ -93,6 +209,10 @@ def _find_include_file(
     1. Absolute path (if the include path is absolute)
     2. Relative to the current file's directory
     3. Each directory in search_dirs, in order
+
+    search_index comes from _index_search_dirs(search_dirs): file-name
+    probes are dict lookups instead of one stat per directory. Names the
+    index misses are still probed on disk.
     """
     include_p = Path(include_path)
 
@@ -106,16 +226,26 @@ def _find_include_file(
         return candidate.resolve()
 
     # 3. Search directories
+    hits = search_index.get(os.path.normcase(include_p.name))
+    if hits is None:
+        # Not indexed under this spelling: a case-insensitive file system
+        # (macOS) may still find it under another one, so probe each directory
+        hits = [d / include_p.name for d in search_dirs if (d / include_p.name).exists()]
+    if len(include_p.parts) == 1:
+        # Bare file name: the first indexed hit is the first directory
+        # that contains it
+        return hits[0].resolve() if hits else None
+
     for search_dir in search_dirs:
         candidate = search_dir / include_p
         if candidate.exists():
             return candidate.resolve()
 
-        # Also try just the filename (common: %include "macro_risque.sas"
-        # when the file is in a macros/ subfolder)
-        candidate = search_dir / include_p.name
-        if candidate.exists():
-            return candidate.resolve()
+        # Also try just the filename (common: %include "macros/risque.sas"
+        # when the file sits directly in a search directory)
+        for hit in hits:
+            if hit.parent == search_dir:
+                return hit.resolve()
 
     return None
 
@@ -140,7 +270,12 @@ def resolve_includes(
         ResolvedSource with fully inlined code.
     """
     entry_file = Path(entry_file).resolve()
-    macro_vars = macro_vars or {}
+    # SAS macro names are case-insensitive: normalize once (first spelling wins)
+    macro_vars_lc: dict[str, str] = {}
+    for key, value in (macro_vars or {}).items():
+        macro_vars_lc.setdefault(key.lower(), value)
+    # Include path -> expanded path; projects repeat the same includes a lot
+    expanded_paths: dict[str, str] = {}
 
     # Build search path list
     resolved_search_dirs: list[Path] = []
@@ -149,9 +284,12 @@ def resolve_includes(
     if entry_file.parent.parent != entry_file.parent:
         resolved_search_dirs.append(entry_file.parent.parent)
     # Add all subdirectories of the entry file's parent (common pattern)
-    for subdir in entry_file.parent.parent.iterdir():
-        if subdir.is_dir() and subdir not in resolved_search_dirs:
-            resolved_search_dirs.append(subdir)
+    with os.scandir(entry_file.parent.parent) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                subdir = Path(entry.path)
+                if subdir not in resolved_search_dirs:
+                    resolved_search_dirs.append(subdir)
 
     if search_dirs:
         for sd in search_dirs:
@@ -160,6 +298,7 @@ def resolve_includes(
                 resolved_search_dirs.append(p)
 
     logger.info("Include search dirs: %s", [str(d) for d in resolved_search_dirs])
+    search_index = _index_search_dirs(resolved_search_dirs)
 
     result = ResolvedSource(
         resolved_code="",
@@ -167,7 +306,9 @@ def resolve_includes(
     )
 
     visited: set[str] = set()  # Tracks files already included (circular ref protection)
-    output_lines: list[str] = []
+    # Every line is written with its trailing "\n"; the last one is dropped
+    # at the end. A StringIO avoids holding one str per line of the project.
+    buf = io.StringIO()
     current_line = 1
 
     def _resolve_file(file_path: Path, depth: int) -> None:
@@ -178,7 +319,7 @@ def resolve_includes(
             msg = f"Circular include detected: {file_path}"
             result.errors.append(msg)
             logger.warning(msg)
-            output_lines.append(f"/* SKIPPED — circular include: {file_path.name} */")
+            buf.write(f"/* SKIPPED — circular include: {file_path.name} */\n")
             current_line += 1
             return
 
@@ -192,7 +333,8 @@ def resolve_includes(
         result.included_files.append(str(file_path))
 
         try:
-            raw = file_path.read_text(encoding="utf-8", errors="replace")
+            st = file_path.stat()
+            raw, directives = _read_and_scan(str(file_path), st.st_mtime_ns, st.st_size)
         except OSError as exc:
             msg = f"Cannot read included file {file_path}: {exc}"
             result.errors.append(msg)
@@ -200,62 +342,59 @@ def resolve_includes(
             return
 
         # Add source map marker
-        output_lines.append(f"/* === BEGIN INCLUDE: {file_path.name} ({file_path}) === */")
+        buf.write(f"/* === BEGIN INCLUDE: {file_path.name} ({file_path}) === */\n")
         start_line = current_line + 1
         current_line += 1
 
-        # Process line by line, looking for %INCLUDE directives
-        for line in raw.splitlines():
-            include_match = _INCLUDE_RE.search(line)
-
-            if include_match:
-                # Extract the path from whichever group matched
-                inc_path = (
-                    include_match.group(1)
-                    or include_match.group(2)
-                    or include_match.group(3)
-                )
-
-                if not inc_path:
-                    output_lines.append(line)
-                    current_line += 1
-                    continue
-
-                # Expand macro variables in path
-                inc_path = _expand_macro_vars(inc_path, macro_vars)
-
-                # Find the actual file
-                found = _find_include_file(
-                    inc_path,
-                    file_path.parent,
-                    resolved_search_dirs,
-                )
-
-                if found:
-                    output_lines.append(f"/* %INCLUDE resolved: {inc_path} -> {found} */")
-                    current_line += 1
-                    _resolve_file(found, depth + 1)
-                else:
-                    msg = f"Include file not found: {inc_path} (referenced in {file_path.name})"
-                    result.errors.append(msg)
-                    logger.warning(msg)
-                    output_lines.append(f"/* WARNING: include not found: {inc_path} */")
-                    output_lines.append(line)  # Keep original line as comment
-                    current_line += 2
-            else:
-                output_lines.append(line)
+        # Jump from one %INCLUDE line to the next; the lines in between are
+        # copied in one write (all of the file when it includes nothing)
+        pos = 0
+        for line_start, line_end, inc_path in directives:
+            buf.write(raw[pos:line_start])
+            current_line += raw.count("\n", pos, line_start)
+            line = raw[line_start:line_end]
+            pos = line_end + 1
+
+            # Expand macro variables in path
+            expanded = expanded_paths.get(inc_path)
+            if expanded is None:
+                expanded = _expand_macro_vars(inc_path, macro_vars_lc)
+                expanded_paths[inc_path] = expanded
+            inc_path = expanded
+
+            # Find the actual file
+            found = _find_include_file(
+                inc_path,
+                file_path.parent,
+                resolved_search_dirs,
+                search_index,
+            )
+
+            if found:
+                buf.write(f"/* %INCLUDE resolved: {inc_path} -> {found} */\n")
                 current_line += 1
+                _resolve_file(found, depth + 1)
+            else:
+                msg = f"Include file not found: {inc_path} (referenced in {file_path.name})"
+                result.errors.append(msg)
+                logger.warning(msg)
+                buf.write(f"/* WARNING: include not found: {inc_path} */\n")
+                buf.write(line + "\n")  # Keep original line as comment
+                current_line += 2
+
+        buf.write(raw[pos:])
+        current_line += raw.count("\n", pos)
 
         # Source map entry
         result.source_map.append((start_line, current_line, str(file_path)))
 
-        output_lines.append(f"/* === END INCLUDE: {file_path.name} === */")
+        buf.write(f"/* === END INCLUDE: {file_path.name} === */\n")
         current_line += 1
 
     # Start resolution from entry file
     _resolve_file(entry_file, depth=0)
 
-    result.resolved_code = "\n".join(output_lines)
+    result.resolved_code = buf.getvalue()[:-1]
     result.all_sas_files = list(visited)
 
     logger.info(
@@ -292,7 +431,7 @@ def scan_project_directory(
         raise FileNotFoundError(f"Not a directory: {project_dir}")
 
     # Collect all .sas files recursively
-    all_sas = sorted(project_dir.rglob("*.sas"))
+    all_sas = sorted(_iter_sas(project_dir))
 
     if not all_sas:
         logger.warning("No .sas files found in %s", project_dir)
@@ -0,0 +1,89 @@
+"""Persistent parse cache — reuse ParseResult objects across CLI invocations.
+
+Parsing only depends on the program text, so a pickled ParseResult stays
+valid as long as the source (include-resolved in project mode), the parser
+and the Python version are unchanged. All three go into the cache key: the
+parser by a hash of sas_parser.py, so parser edits invalidate entries even
+in an editable install without a version bump. Any change is a miss, and
+stale entries are simply never looked up again.
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import logging
+import os
+import pickle
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from . import __version__
+
+if TYPE_CHECKING:
+    from .sas_parser import ParseResult
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    / "sas-data-generator"
+    / "parse-ast"
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _parser_fingerprint() -> bytes:
+    """Return a digest of the parser source, or of the package version if unreadable."""
+    from . import sas_parser
+
+    try:
+        source = Path(getattr(sas_parser, "__file__", None)).read_bytes()
+    except (OSError, TypeError):
+        source = __version__.encode("ascii")
+    return hashlib.sha256(source).digest()
+
+
+def cache_key(sas_path: str | Path, source: bytes, mode: str = "file") -> str:
+    """Build the cache key for a SAS file.
+
+    Args:
+        sas_path: Path of the parsed file (recorded in ParseResult.file_path).
+        source: Exact text handed to the parser, as bytes.
+        mode: "file" or "project" — the two modes yield different results.
+    """
+    digest = hashlib.sha256()
+    digest.update(str(sas_path).encode("utf-8"))
+    digest.update(f"|{mode}|".encode("ascii"))
+    digest.update(_parser_fingerprint())
+    digest.update(source)
+    return f"{digest.hexdigest()}_{__version__}_py{sys.version_info[0]}{sys.version_info[1]}"
+
+
+def load(key: str, cache_dir: str | Path | None = None) -> ParseResult | None:
+    """Return the cached ParseResult for key, or None on a miss."""
+    cache_path = Path(cache_dir or DEFAULT_CACHE_DIR) / f"{key}.pkl"
+    try:
+        with cache_path.open("rb") as f:
+            return pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError) as exc:
+        logger.warning("Ignoring unreadable parse cache %s: %s", cache_path, exc)
+        return None
+
+
+def store(key: str, result: ParseResult, cache_dir: str | Path | None = None) -> None:
+    """Pickle result under key. Failures are logged, never raised."""
+    cache_dir = Path(cache_dir or DEFAULT_CACHE_DIR)
+    cache_path = cache_dir / f"{key}.pkl"
+    tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        with tmp_path.open("wb") as f:
+            pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+        # Atomic so concurrent workers never read a half-written entry
+        os.replace(tmp_path, cache_path)
+    except OSError as exc:
+        logger.warning("Cannot write parse cache %s: %s", cache_path, exc)
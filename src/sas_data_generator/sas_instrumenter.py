@@ -24,11 +24,14 @@ For PROC SQL, we use %PUT (macro PUT) since regular PUT isn't available in SQL.
 
 from __future__ import annotations
 
+import functools
 import hashlib
 import logging
 import re
-from dataclasses import dataclass
+from bisect import bisect_left
+from dataclasses import dataclass, field, replace
 from pathlib import Path
+from typing import Callable
 
 from .sas_parser import (
     BlockType,
@@ -36,11 +39,23 @@ from .sas_parser import (
     CoveragePointType,
     ParseResult,
     SASBlock,
+    parse_sas_code,
     parse_sas_file,
 )
 
 logger = logging.getLogger(__name__)
 
+# Control-flow keywords located around each coverage point. SAS keywords
+# are ASCII: re.ASCII keeps case-insensitive matching on ASCII folding,
+# which runs about 3x faster than Unicode folding on str input.
+_THEN_RE = re.compile(r"\bTHEN\b", re.I | re.A)
+_THEN_DO_RE = re.compile(r"\bTHEN\s+DO\b", re.I | re.A)
+_ELSE_RE = re.compile(r"\bELSE\b", re.I | re.A)
+_WHEN_RE = re.compile(r"\bWHEN\b", re.I | re.A)
+_OTHERWISE_RE = re.compile(r"\bOTHERWISE\b", re.I | re.A)
+_END_RE = re.compile(r"\bEND\s*;", re.I | re.A)
+_DO_RE = re.compile(r"\bDO\b", re.I | re.A)
+
 
 @dataclass
 class InstrumentationResult:
@@ -111,146 +126,215 @@ run;
 """
 
 
+@functools.lru_cache(maxsize=32)
+def _postamble(coverage_csv_path: str) -> str:
+    """Return the postamble for a coverage CSV path (one placeholder, no format parsing)."""
+    return _POSTAMBLE_TEMPLATE.replace("{coverage_csv_path}", coverage_csv_path)
+
+
+_PUT_FMT = 'put "COV:POINT=%s";'
+_MACRO_FMT = "%%_cov_hit(%s)"
+
+
 def _make_put_statement(point_id: str) -> str:
     """Create a PUT statement that writes a coverage marker to the log."""
-    return f'put "COV:POINT={point_id}";'
+    return _PUT_FMT % point_id
 
 
 def _make_macro_call(point_id: str) -> str:
     """Create a macro call to record coverage hit (for use inside DATA steps)."""
-    return f'%_cov_hit({point_id})'
+    return _MACRO_FMT % point_id
+
+
+def _apply_insertions(lines: list[str], insertions: list[tuple[int, str]]) -> list[str]:
+    """Return lines with each (index, code) inserted before lines[index].
 
+    Built in one pass instead of one list.insert per insertion. Code
+    inserted at the same index comes out in reverse order of insertions,
+    as with the former reverse-sorted insert loop.
+    """
+    if not insertions:
+        return lines
+
+    by_index: dict[int, list[str]] = {}
+    for line_idx, code in insertions:
+        by_index.setdefault(min(line_idx, len(lines)), []).append(code)
+
+    out: list[str] = []
+    for i, line in enumerate(lines):
+        if i in by_index:
+            out.extend(reversed(by_index[i]))
+        out.append(line)
+    if len(lines) in by_index:
+        out.extend(reversed(by_index[len(lines)]))
+    return out
 
-def _instrument_data_step(block: SASBlock, raw_code: str) -> str:
-    """Instrument a DATA step with coverage markers.
 
-    We work on the raw text of the DATA step and insert PUT statements
-    at the right locations.
+@dataclass
+class _BlockAnchors:
+    """Control-flow keyword positions of a DATA step, from one scan of its lines.
+
+    Line lists are sorted 0-based indices. then_do_end maps each THEN DO
+    line to the line of its matching END;.
+    """
+    then_lines: list[int] = field(default_factory=list)
+    then_do_lines: set[int] = field(default_factory=set)
+    else_lines: list[int] = field(default_factory=list)
+    when_lines: list[int] = field(default_factory=list)
+    otherwise_lines: list[int] = field(default_factory=list)
+    semicolon_lines: list[int] = field(default_factory=list)
+    then_do_end: dict[int, int] = field(default_factory=dict)
+    num_lines: int = 0
+
+
+def _scan_anchors(lines: list[str]) -> _BlockAnchors:
+    """Index the keyword lines of a DATA step in a single pass."""
+    anchors = _BlockAnchors(num_lines=len(lines))
+    # DO/END depth after each line. A THEN DO on a line left at depth d is
+    # closed by the first later END; that brings the depth back to d - 1;
+    # open ones wait here keyed by that depth.
+    depth = 0
+    open_then_do: dict[int, list[int]] = {}
+    for i, line in enumerate(lines):
+        # Keyword substring checks skip most regex searches: the majority
+        # of lines hold none of the control-flow keywords
+        upper = line.upper()
+        then_do = False
+        if "THEN" in upper and _THEN_RE.search(line):
+            anchors.then_lines.append(i)
+            if _THEN_DO_RE.search(line):
+                anchors.then_do_lines.add(i)
+                then_do = True
+        if "ELSE" in upper and _ELSE_RE.search(line):
+            anchors.else_lines.append(i)
+        if "WHEN" in upper and _WHEN_RE.search(line):
+            anchors.when_lines.append(i)
+        if "OTHERWISE" in upper and _OTHERWISE_RE.search(line):
+            anchors.otherwise_lines.append(i)
+        if ";" in line:
+            anchors.semicolon_lines.append(i)
+        if "DO" in upper and _DO_RE.search(line):
+            depth += 1
+        if "END" in upper and _END_RE.search(line):
+            depth -= 1
+            for then_line in open_then_do.pop(depth, ()):
+                anchors.then_do_end[then_line] = i
+        if then_do:
+            # Registered after this line's own DO/END: they never close it
+            open_then_do.setdefault(depth - 1, []).append(i)
+    return anchors
+
+
+def _first_in_range(indices: list[int], start: int, stop: int) -> int | None:
+    """Return the first index in sorted indices within [start, stop), or None."""
+    pos = bisect_left(indices, start)
+    if pos < len(indices) and indices[pos] < stop:
+        return indices[pos]
+    return None
+
+
+# (line_index, code): code goes in before lines[line_index]
+_Insertion = tuple[int, str]
+
+# DATA step handlers, one per coverage point type. Each gets the block's
+# anchors, the point's line within the block and its PUT statement, and
+# returns the (line_index, code) insertion or None when no anchor is found.
+
+def _at_step_entry(anchors: _BlockAnchors, target_line: int, put: str) -> _Insertion | None:
+    # Insert after the DATA statement line (first line of block)
+    return (1, f"  {put}")
+
+
+def _at_if_true(anchors: _BlockAnchors, target_line: int, put: str) -> _Insertion | None:
+    # Insert after the THEN on this line or nearby: as the first statement
+    # of a THEN DO block, or on the line following a single-statement THEN
+    i = _first_in_range(anchors.then_lines, target_line, target_line + 3)
+    return None if i is None else (i + 1, f"    {put}")
+
+
+def _at_if_false(anchors: _BlockAnchors, target_line: int, put: str) -> _Insertion | None:
+    # Find the ELSE clause corresponding to this IF
+    i = _first_in_range(anchors.else_lines, target_line, target_line + 10)
+    if i is not None:
+        return (i + 1, f"    {put}")
+
+    # No ELSE exists — we need to add one after the end of the IF/THEN block
+    i = _first_in_range(anchors.then_lines, target_line, target_line + 15)
+    if i is None:
+        return None
+    if i in anchors.then_do_lines:
+        # After the matching END;
+        j = anchors.then_do_end.get(i)
+    else:
+        # Single statement after THEN — after its semicolon
+        j = _first_in_range(anchors.semicolon_lines, i, anchors.num_lines)
+    return None if j is None else (j + 1, f"  else {put}")
+
+
+def _at_select_when(anchors: _BlockAnchors, target_line: int, put: str) -> _Insertion | None:
+    i = _first_in_range(anchors.when_lines, target_line, target_line + 3)
+    return None if i is None else (i + 1, f"    {put}")
+
+
+def _at_select_otherwise(anchors: _BlockAnchors, target_line: int, put: str) -> _Insertion | None:
+    i = _first_in_range(anchors.otherwise_lines, target_line, target_line + 3)
+    return None if i is None else (i + 1, f"    {put}")
+
+
+_DATA_STEP_HANDLERS = {
+    CoveragePointType.STEP_ENTRY: _at_step_entry,
+    CoveragePointType.IF_TRUE: _at_if_true,
+    CoveragePointType.IF_FALSE: _at_if_false,
+    CoveragePointType.SELECT_WHEN: _at_select_when,
+    CoveragePointType.SELECT_OTHERWISE: _at_select_otherwise,
+}
+
+
+def _data_step_insertions(block: SASBlock, lines: list[str]) -> list[_Insertion]:
+    """Return the coverage marker insertions for a DATA step.
+
+    We work on the raw lines of the DATA step and place PUT statements
+    at the right locations; indices are relative to lines.
     """
-    lines = raw_code.split("\n")
-    insertions: list[tuple[int, str]] = []  # (line_index, code_to_insert)
+    anchors = _scan_anchors(lines)
+    insertions: list[_Insertion] = []
 
     for cp in block.coverage_points:
+        handler = _DATA_STEP_HANDLERS.get(cp.point_type)
+        if handler is None:
+            continue
         # Convert absolute line number to relative within the block
         relative_line = cp.line_number - block.start_line
+        target_line = max(0, min(relative_line, anchors.num_lines - 1))
+        insertion = handler(anchors, target_line, _make_put_statement(cp.point_id))
+        if insertion is not None:
+            insertions.append(insertion)
 
-        if cp.point_type == CoveragePointType.STEP_ENTRY:
-            # Insert after the DATA statement line (first line of block)
-            insertions.append((1, f"  {_make_put_statement(cp.point_id)}"))
-
-        elif cp.point_type == CoveragePointType.IF_TRUE:
-            # Insert after THEN — we need to find the THEN on or after this line
-            # and insert the PUT as the first statement in the DO block or before
-            # the single statement
-            target_line = max(0, min(relative_line, len(lines) - 1))
-            # Search for THEN on this line or nearby
-            for i in range(max(0, target_line), min(target_line + 3, len(lines))):
-                if re.search(r"(?i)\bTHEN\b", lines[i]):
-                    # Check if THEN is followed by DO on the same line
-                    if re.search(r"(?i)\bTHEN\s+DO\b", lines[i]):
-                        insertions.append((i + 1, f"    {_make_put_statement(cp.point_id)}"))
-                    else:
-                        # Insert PUT before the action statement
-                        # We wrap: IF cond THEN DO; PUT; original_action; END;
-                        # But simpler: just insert PUT after THEN on next line
-                        insertions.append((i + 1, f"    {_make_put_statement(cp.point_id)}"))
-                    break
-
-        elif cp.point_type == CoveragePointType.IF_FALSE:
-            # Find the ELSE clause corresponding to this IF
-            target_line = max(0, min(relative_line, len(lines) - 1))
-            found_else = False
-            for i in range(max(0, target_line), min(target_line + 10, len(lines))):
-                if re.search(r"(?i)\bELSE\b", lines[i]):
-                    if re.search(r"(?i)\bELSE\s+DO\b", lines[i]):
-                        insertions.append((i + 1, f"    {_make_put_statement(cp.point_id)}"))
-                    else:
-                        insertions.append((i + 1, f"    {_make_put_statement(cp.point_id)}"))
-                    found_else = True
-                    break
-
-            if not found_else:
-                # No ELSE exists — we need to add one
-                # Find the end of the IF/THEN block
-                for i in range(max(0, target_line), min(target_line + 15, len(lines))):
-                    # Look for the end of the THEN block
-                    if re.search(r"(?i)\bTHEN\b", lines[i]):
-                        # Find matching END; or the single statement's semicolon
-                        if re.search(r"(?i)\bTHEN\s+DO\b", lines[i]):
-                            # Find the matching END;
-                            depth = 1
-                            for j in range(i + 1, len(lines)):
-                                if re.search(r"(?i)\bDO\b", lines[j]):
-                                    depth += 1
-                                if re.search(r"(?i)\bEND\s*;", lines[j]):
-                                    depth -= 1
-                                    if depth == 0:
-                                        insertions.append((
-                                            j + 1,
-                                            f"  else {_make_put_statement(cp.point_id)}",
-                                        ))
-                                        break
-                        else:
-                            # Single statement after THEN — find its semicolon
-                            for j in range(i, len(lines)):
-                                if ";" in lines[j] and j >= i:
-                                    insertions.append((
-                                        j + 1,
-                                        f"  else {_make_put_statement(cp.point_id)}",
-                                    ))
-                                    break
-                        break
-
-        elif cp.point_type == CoveragePointType.SELECT_WHEN:
-            target_line = max(0, min(relative_line, len(lines) - 1))
-            for i in range(max(0, target_line), min(target_line + 3, len(lines))):
-                if re.search(r"(?i)\bWHEN\b", lines[i]):
-                    # Check for DO block
-                    if re.search(r"(?i)\bDO\s*;", lines[i]):
-                        insertions.append((i + 1, f"    {_make_put_statement(cp.point_id)}"))
-                    else:
-                        insertions.append((i + 1, f"    {_make_put_statement(cp.point_id)}"))
-                    break
-
-        elif cp.point_type == CoveragePointType.SELECT_OTHERWISE:
-            target_line = max(0, min(relative_line, len(lines) - 1))
-            for i in range(max(0, target_line), min(target_line + 3, len(lines))):
-                if re.search(r"(?i)\bOTHERWISE\b", lines[i]):
-                    insertions.append((i + 1, f"    {_make_put_statement(cp.point_id)}"))
-                    break
-
-    # Apply insertions in reverse order to preserve line indices
-    insertions.sort(key=lambda x: x[0], reverse=True)
-    for line_idx, code in insertions:
-        line_idx = min(line_idx, len(lines))
-        lines.insert(line_idx, code)
+    return insertions
 
-    return "\n".join(lines)
 
-
-def _instrument_proc_sql(block: SASBlock, raw_code: str) -> str:
-    """Instrument a PROC SQL block with coverage markers.
+def _proc_sql_insertions(block: SASBlock, lines: list[str]) -> list[_Insertion]:
+    """Return the coverage marker insertions for a PROC SQL block.
 
     PROC SQL doesn't support PUT directly, so we use %PUT (macro facility).
     For CASE/WHEN, we can't easily inject into SQL expressions,
     so we add %PUT before/after the SQL statement.
     """
-    lines = raw_code.split("\n")
-    insertions: list[tuple[int, str]] = []
+    insertions: list[_Insertion] = []
+    last_line = len(lines) - 1
 
     for cp in block.coverage_points:
-        relative_line = cp.line_number - block.start_line
+        target_line = max(0, min(cp.line_number - block.start_line, last_line))
 
         if cp.point_type == CoveragePointType.STEP_ENTRY:
             # Insert %PUT after PROC SQL;
-            insertions.append((1, f"  %_cov_hit({cp.point_id})"))
+            insertions.append((1, f"  {_make_macro_call(cp.point_id)}"))
 
         elif cp.point_type == CoveragePointType.SQL_WHERE:
             # We can't instrument inside WHERE easily.
             # Strategy: Add %PUT before the SELECT that contains this WHERE.
             # The coverage will be "this SQL with WHERE was executed"
-            target_line = max(0, min(relative_line, len(lines) - 1))
-            insertions.append((target_line, f"  %_cov_hit({cp.point_id})"))
+            insertions.append((target_line, f"  {_make_macro_call(cp.point_id)}"))
 
         elif cp.point_type in (
             CoveragePointType.SQL_CASE_WHEN,
@@ -259,15 +343,21 @@ def _instrument_proc_sql(block: SASBlock, raw_code: str) -> str:
             # For CASE/WHEN in SQL, we record that the SQL block ran.
             # True branch-level coverage of SQL CASE requires runtime analysis
             # of the output data. We mark this as a limitation.
-            target_line = max(0, min(relative_line, len(lines) - 1))
-            insertions.append((target_line, f"  %_cov_hit({cp.point_id})"))
+            insertions.append((target_line, f"  {_make_macro_call(cp.point_id)}"))
 
-    insertions.sort(key=lambda x: x[0], reverse=True)
-    for line_idx, code in insertions:
-        line_idx = min(line_idx, len(lines))
-        lines.insert(line_idx, code)
+    return insertions
+
+
+_BLOCK_INSERTIONS = {
+    BlockType.DATA_STEP: _data_step_insertions,
+    BlockType.PROC_SQL: _proc_sql_insertions,
+}
 
-    return "\n".join(lines)
+
+# Instrumentation results by (file path, content digest, coverage CSV path).
+# Bounded; the oldest entry is evicted first.
+_RESULT_CACHE: dict[tuple[str, bytes, str], InstrumentationResult] = {}
+_RESULT_CACHE_SIZE = 256
 
 
 def instrument_sas_file(
@@ -277,6 +367,10 @@ def instrument_sas_file(
 ) -> InstrumentationResult:
     """Instrument a SAS file with coverage markers.
 
+    Results are cached by file content: instrumenting an unchanged file
+    again returns a copy of the earlier result without re-parsing. The
+    cache is bypassed when a parse_result is supplied.
+
     Args:
         file_path: Path to the original SAS file.
         coverage_csv_path: Where the coverage CSV should be written by SAS.
@@ -288,44 +382,104 @@ def instrument_sas_file(
     file_path = Path(file_path)
     logger.info("Instrumenting SAS file: %s", file_path)
 
-    if parse_result is None:
-        parse_result = parse_sas_file(file_path)
-
     original_code = file_path.read_text(encoding="utf-8", errors="replace")
+    if parse_result is not None:
+        return _instrument_parsed(original_code, str(file_path), coverage_csv_path, parse_result)
+    return _instrument_text(
+        original_code, str(file_path), coverage_csv_path, lambda: parse_sas_file(file_path)
+    )
 
-    # Build a map from (start_line, end_line) -> instrumented text
-    # Process blocks in reverse order to preserve positions
-    blocks_sorted = sorted(parse_result.blocks, key=lambda b: b.start_line, reverse=True)
 
-    code_lines = original_code.split("\n")
+def _instrument_text(
+    code: str,
+    original_path: str,
+    coverage_csv_path: str,
+    parse: Callable[[], ParseResult],
+) -> InstrumentationResult:
+    """Instrument code, reusing the cached result for identical input.
 
-    for block in blocks_sorted:
-        # Extract the block's raw text from the original code
-        block_start_idx = block.start_line - 1  # 0-based
-        block_end_idx = block.end_line  # exclusive
+    parse is only called on a cache miss.
+    """
+    digest = hashlib.blake2b(code.encode("utf-8"), digest_size=16).digest()
+    # The path is part of the key: coverage point IDs derive from it
+    cache_key = (original_path, digest, coverage_csv_path)
+    cached = _RESULT_CACHE.get(cache_key)
+    if cached is not None:
+        logger.debug("Reusing instrumentation of unchanged code from %s", original_path)
+        return replace(cached, coverage_points=list(cached.coverage_points))
 
-        block_lines = code_lines[block_start_idx:block_end_idx]
-        block_text = "\n".join(block_lines)
+    result = _instrument_parsed(code, original_path, coverage_csv_path, parse())
 
-        if block.block_type == BlockType.DATA_STEP:
-            instrumented = _instrument_data_step(block, block_text)
-        elif block.block_type == BlockType.PROC_SQL:
-            instrumented = _instrument_proc_sql(block, block_text)
-        else:
-            continue  # Skip other PROC types for MVP
+    if len(_RESULT_CACHE) >= _RESULT_CACHE_SIZE:
+        del _RESULT_CACHE[next(iter(_RESULT_CACHE))]
+    _RESULT_CACHE[cache_key] = replace(result, coverage_points=list(result.coverage_points))
+    return result
 
-        # Replace in code_lines
-        new_lines = instrumented.split("\n")
-        code_lines[block_start_idx:block_end_idx] = new_lines
 
-    instrumented_code = "\n".join(code_lines)
+def _instrumented_lines(original_code: str, parse_result: ParseResult) -> list[str]:
+    """Return the lines of original_code with the coverage markers inserted.
 
+    Built front to back in one pass: unchanged runs of lines are copied
+    once, instead of splicing each instrumented block into the full list.
+    Steps that share a line (e.g. "run; data b;") are instrumented together
+    over the union of their lines, so every coverage point gets its marker.
+    """
+    code_lines = original_code.split("\n")
+    # Other PROC types are skipped for MVP; blocks without points insert nothing
+    blocks = sorted(
+        (b for b in parse_result.blocks
+         if b.block_type in _BLOCK_INSERTIONS and b.coverage_points),
+        key=lambda b: b.start_line,
+    )
+    if not blocks:
+        return code_lines
+
+    # Group blocks whose line ranges overlap
+    groups: list[list[SASBlock]] = []
+    group_end = 0  # Exclusive end (0-based) of the last group's lines
+    for block in blocks:
+        if groups and block.start_line - 1 < group_end:
+            groups[-1].append(block)
+        else:
+            groups.append([block])
+        group_end = max(group_end, block.end_line)
+
+    out: list[str] = []
+    pos = 0  # Next original line (0-based) not yet copied to out
+    for group in groups:
+        start_idx = group[0].start_line - 1  # 0-based
+        end_idx = max(b.end_line for b in group)  # exclusive
+        insertions: list[_Insertion] = []
+        for block in group:
+            offset = block.start_line - 1 - start_idx
+            block_lines = code_lines[block.start_line - 1:block.end_line]
+            insertions.extend(
+                (offset + i, code)
+                for i, code in _BLOCK_INSERTIONS[block.block_type](block, block_lines)
+            )
+        out.extend(code_lines[pos:start_idx])
+        out.extend(_apply_insertions(code_lines[start_idx:end_idx], insertions))
+        pos = end_idx
+
+    out.extend(code_lines[pos:])
+    return out
+
+
+def _instrument_parsed(
+    original_code: str,
+    original_path: str,
+    coverage_csv_path: str,
+    parse_result: ParseResult,
+) -> InstrumentationResult:
+    """Insert the coverage markers described by parse_result into original_code."""
+    code_lines = _instrumented_lines(original_code, parse_result)
     preamble = _PREAMBLE_TEMPLATE
-    postamble = _POSTAMBLE_TEMPLATE.format(coverage_csv_path=coverage_csv_path)
+    postamble = _postamble(coverage_csv_path)
 
     return InstrumentationResult(
-        original_path=str(file_path),
-        instrumented_code=preamble + instrumented_code + postamble,
+        original_path=original_path,
+        # One join: no intermediate preamble + code copy
+        instrumented_code="".join((preamble, "\n".join(code_lines), postamble)),
         coverage_points=parse_result.all_coverage_points,
         preamble=preamble,
         postamble=postamble,
@@ -333,17 +487,48 @@ def instrument_sas_file(
     )
 
 
+def instrument_sas_file_to(
+    file_path: str | Path,
+    out_path: str | Path,
+    coverage_csv_path: str = "_coverage_results.csv",
+    parse_result: ParseResult | None = None,
+) -> list[CoveragePoint]:
+    """Instrument a SAS file and write the program straight to out_path.
+
+    Writes the same text as instrument_sas_file(...).instrumented_code,
+    line by line, without building the whole program as one string.
+
+    Returns:
+        The coverage points of the instrumented program.
+    """
+    file_path = Path(file_path)
+    logger.info("Instrumenting SAS file: %s -> %s", file_path, out_path)
+
+    if parse_result is None:
+        parse_result = parse_sas_file(file_path)
+    original_code = file_path.read_text(encoding="utf-8", errors="replace")
+    code_lines = _instrumented_lines(original_code, parse_result)
+
+    with open(out_path, "w", encoding="utf-8", buffering=1024 * 1024) as f:
+        f.write(_PREAMBLE_TEMPLATE)
+        # Newline after every line but the last, as "\n".join would
+        f.writelines(line + "\n" for line in code_lines[:-1])
+        f.write(code_lines[-1])
+        f.write(_postamble(coverage_csv_path))
+
+    return parse_result.all_coverage_points
+
+
 def instrument_sas_code(
     code: str,
     file_id: str = "inline",
     coverage_csv_path: str = "_coverage_results.csv",
 ) -> InstrumentationResult:
-    """Instrument SAS code from a string (useful for testing)."""
-    from tempfile import NamedTemporaryFile
-
-    with NamedTemporaryFile(
-        mode="w", suffix=".sas", delete=False, encoding="utf-8"
-    ) as f:
-        f.write(code)
-        f.flush()
-        return instrument_sas_file(f.name, coverage_csv_path)
+    """Instrument SAS code from a string (useful for testing).
+
+    The code is instrumented in memory; file_id stands in for the file path.
+    """
+    logger.info("Instrumenting SAS code: %s", file_id)
+    return _instrument_text(
+        code, file_id, coverage_csv_path, lambda: parse_sas_code(code, file_id=file_id)
+    )
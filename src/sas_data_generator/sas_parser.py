@@ -19,14 +19,28 @@ These are documented and planned for V1 improvements.
 
 from __future__ import annotations
 
+import hashlib
 import logging
+import os
 import re
-from dataclasses import dataclass, field
+import sys
+import threading
+from bisect import bisect_right
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
 from enum import Enum, auto
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .include_resolver import ResolvedSource
 
 logger = logging.getLogger(__name__)
 
+# Parsing creates thousands of these records per file: slotted instances
+# are smaller and faster to read. dataclass(slots=...) needs Python 3.10.
+_SLOTS: dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 class BlockType(Enum):
     DATA_STEP = auto()
@@ -45,7 +59,7 @@ class CoveragePointType(Enum):
     SQL_CASE_ELSE = auto()    # SQL CASE/ELSE branch
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class CoveragePoint:
     """A single instrumentable location in SAS code."""
     point_id: str
@@ -55,7 +69,7 @@ class CoveragePoint:
     condition: str = ""  # The original condition text, if applicable
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class VariableRef:
     """A variable referenced in SAS code with inferred type hints."""
     name: str
@@ -65,7 +79,7 @@ class VariableRef:
     format: str = ""  # SAS format if detected (e.g., "date9.", "$20.")
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class SASBlock:
     """A parsed DATA or PROC block."""
     block_type: BlockType
@@ -79,7 +93,7 @@ class SASBlock:
     output_datasets: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ParseResult:
     """Complete parse result for a SAS file."""
     file_path: str
@@ -88,6 +102,27 @@ class ParseResult:
     all_variables: list[VariableRef] = field(default_factory=list)
     errors: list[str] = field(default_factory=list)
 
+    def to_soa(self) -> dict[str, Any]:
+        """Return all_coverage_points as parallel columns.
+
+        point_type holds CoveragePointType values (int8) and line_number is
+        int32, so per-type counts or line-range filters vectorize with numpy.
+        point_id and condition stay lists of str.
+        """
+        import numpy as np
+
+        points = self.all_coverage_points
+        return {
+            "point_id": [cp.point_id for cp in points],
+            "point_type": np.fromiter(
+                (cp.point_type.value for cp in points), dtype=np.int8, count=len(points),
+            ),
+            "line_number": np.fromiter(
+                (cp.line_number for cp in points), dtype=np.int32, count=len(points),
+            ),
+            "condition": [cp.condition for cp in points],
+        }
+
 
 # ---------------------------------------------------------------------------
 # Regex patterns
@@ -97,22 +132,18 @@ class ParseResult:
 _BLOCK_COMMENT_RE = re.compile(r"/\*.*?\*/", re.DOTALL)
 _LINE_COMMENT_RE = re.compile(r"(?m)^\s*\*[^;]*;")
 
-# DATA step: DATA <names> ; ... RUN ;
-_DATA_STEP_RE = re.compile(
-    r"(?i)\bDATA\s+([\w.'\"]+(?:\s+[\w.'\"]+)*)\s*;(.*?)RUN\s*;",
-    re.DOTALL,
-)
-
-# PROC SQL: PROC SQL ... QUIT;
-_PROC_SQL_RE = re.compile(
-    r"(?i)\bPROC\s+SQL\b[^;]*;(.*?)QUIT\s*;",
-    re.DOTALL,
-)
-
-# Other PROC: PROC <name> ... RUN;/QUIT;
-_PROC_OTHER_RE = re.compile(
-    r"(?i)\bPROC\s+(\w+)\b(?!\s+SQL)[^;]*;(.*?)(?:RUN|QUIT)\s*;",
-    re.DOTALL,
+_NEWLINE_RE = re.compile(r"\n")
+
+# Step boundaries, found in one left-to-right pass (see _find_steps).
+# Headers only consume their keywords: the lookaheads capture the rest, so
+# a RUN or QUIT inside a header is still seen as a token of its own. The
+# leading class check skips most positions before any alternative is tried.
+_STEP_TOKEN_RE = re.compile(
+    r"(?i)(?=[dpqr])(?:"
+    r"\bDATA\s+(?=(?P<data_names>[\w.'\"]+(?:\s+[\w.'\"]+)*)(?P<data_semi>\s*;))"
+    r"|\bPROC\s+SQL\b(?=(?P<sql_head>[^;]*;))"
+    r"|(?P<run>RUN\s*;)"
+    r"|(?P<quit>QUIT\s*;))"
 )
 
 # IF / THEN / ELSE  (DATA step style)
@@ -135,24 +166,78 @@ _SQL_CASE_RE = re.compile(r"(?i)\bCASE\b(.*?)\bEND\b", re.DOTALL)
 _SQL_WHEN_RE = re.compile(r"(?i)\bWHEN\b\s+(.+?)\s+\bTHEN\b", re.DOTALL)
 _SQL_ELSE_RE = re.compile(r"(?i)\bELSE\b")
 
+# Dataset reference with optional options, e.g. lib.a(where=(x in (1, 2))).
+# Parentheses nest up to three levels; keeping every part unambiguous
+# avoids exponential backtracking when a SET/MERGE list has no semicolon.
+_DATASET_OPTIONS = r"\((?:[^()\n]|\((?:[^()\n]|\([^()\n]*\))*\))*\)"
+_DATASET_REF = rf"[\w.]+(?:\s*{_DATASET_OPTIONS})?"
+
 # SET statement (input datasets)
-_SET_RE = re.compile(r"(?i)\bSET\s+([\w.]+(?:\s*\(.*?\))?(?:\s+[\w.]+(?:\s*\(.*?\))?)*)\s*;")
+_SET_RE = re.compile(rf"(?i)\bSET\s+({_DATASET_REF}(?:\s+{_DATASET_REF})*)\s*;")
 
 # MERGE statement
-_MERGE_RE = re.compile(r"(?i)\bMERGE\s+([\w.]+(?:\s*\(.*?\))?(?:\s+[\w.]+(?:\s*\(.*?\))?)*)\s*;")
+_MERGE_RE = re.compile(rf"(?i)\bMERGE\s+({_DATASET_REF}(?:\s+{_DATASET_REF})*)\s*;")
 
 # INPUT statement (column definitions)
 _INPUT_RE = re.compile(r"(?i)\bINPUT\b\s+(.+?)\s*;", re.DOTALL)
 
-# Variable names in conditions: simple heuristic
-_VAR_IN_CONDITION_RE = re.compile(r"\b([a-zA-Z_]\w*)\b")
+# INPUT tokens: pointers (@1, +2, #3), names, and $w. / informat w.d
+_INPUT_POINTER_RE = re.compile(r"^[@#+]\d*$")
+_INPUT_NAME_RE = re.compile(r"^[a-zA-Z_]\w*$")
+_INPUT_WIDTH_RE = re.compile(r"^\$?\d+\.$")
+_INPUT_INFORMAT_RE = re.compile(r"^\w+\d*\.\d*$")
+
+# Dataset names in SET / MERGE lists, once their options are removed
+_DATASET_NAME_RE = re.compile(r"([\w.]+)")
+_DATASET_OPTIONS_RE = re.compile(_DATASET_OPTIONS)
 
-# Numeric literals and comparison operators (for condition analysis)
-_COMPARISON_RE = re.compile(
-    r"([a-zA-Z_]\w*)\s*(>=?|<=?|=|ne|eq|gt|lt|ge|le|in)\s*"
-    r"[('\"]?(\S+?)[)'\"]?(?:\s|$|;)",
-    re.IGNORECASE,
+# END; closing a SELECT group
+_END_RE = re.compile(r"(?i)\bEND\s*;")
+
+# SQL: output and input tables
+_CREATE_TABLE_RE = re.compile(r"(?i)\bCREATE\s+TABLE\s+([\w.]+)")
+_FROM_RE = re.compile(r"(?i)\bFROM\s+([\w.]+)")
+
+# Statement keywords of a step body, found in one scan (see _match_statements).
+# Each group name is a key of the pattern table that follows it.
+_DATA_KEYWORD_RE = re.compile(
+    r"(?i)(?=[ims])\b(?:(?P<set>SET\b)|(?P<merge>MERGE\b)|(?P<input>INPUT\b)"
+    r"|(?P<if>IF\b)|(?P<select>SELECT))"
+)
+_DATA_STATEMENT_RES = {
+    "set": _SET_RE,
+    "merge": _MERGE_RE,
+    "input": _INPUT_RE,
+    "if": _IF_THEN_RE,
+    "select": _SELECT_RE,
+}
+_SQL_KEYWORD_RE = re.compile(
+    r"(?i)(?=[cfw])\b(?:(?P<where>WHERE\b)|(?P<case>CASE\b)|(?P<create>CREATE\s)"
+    r"|(?P<from>FROM\s))"
 )
+_SQL_STATEMENT_RES = {
+    "where": _SQL_WHERE_RE,
+    "case": _SQL_CASE_RE,
+    "create": _CREATE_TABLE_RE,
+    "from": _FROM_RE,
+}
+
+# Condition tokens for _extract_variables_from_condition. Word operators
+# need word boundaries: "income" is a name, not "in" followed by "come".
+_COND_TOKEN_RE = re.compile(
+    r"""
+      (?P<date>(?:'[^']*'|"[^"]*")(?:dt|d|t)\b)   # '01JAN2020'd, '...'dt, '...'t
+    | (?P<str>'[^']*'|"[^"]*")
+    | (?P<num>-?(?:\d+(?:\.\d*)?|\.\d+))
+    | (?P<op>>=?|<=?|=|\b(?:ne|eq|gt|lt|ge|le|in)\b)
+    | (?P<ident>[a-zA-Z_]\w*)
+    | (?P<other>\S)
+    """,
+    re.IGNORECASE | re.VERBOSE,
+)
+
+# Type of a variable compared against each kind of value token
+_VALUE_TYPES = {"num": "numeric", "str": "character", "date": "date"}
 
 # SAS keywords to exclude from variable detection
 _SAS_KEYWORDS = frozenset({
@@ -175,7 +260,9 @@ def _strip_comments(code: str) -> str:
     # Replace block comments with equivalent whitespace
     def _block_replacer(m: re.Match) -> str:
         text = m.group(0)
-        return re.sub(r"[^\n]", " ", text)
+        if "\n" not in text:
+            return " " * len(text)
+        return "\n".join(" " * len(part) for part in text.split("\n"))
 
     result = _BLOCK_COMMENT_RE.sub(_block_replacer, code)
     # Replace line comments
@@ -183,38 +270,60 @@ def _strip_comments(code: str) -> str:
     return result
 
 
-def _line_number_at(code: str, pos: int) -> int:
-    """Return 1-based line number for character position in code."""
-    return code[:pos].count("\n") + 1
+def _line_starts(code: str) -> list[int]:
+    """Return the offset at which each line of code starts."""
+    return [0, *(m.end() for m in _NEWLINE_RE.finditer(code))]
+
+
+def _line_number_at(line_starts: list[int], pos: int) -> int:
+    """Return 1-based line number for a character position, given _line_starts(code)."""
+    return bisect_right(line_starts, pos)
+
+
+def _merge_variables(
+    unique_vars: dict[str, VariableRef],
+    variables: list[VariableRef],
+) -> dict[str, VariableRef]:
+    """Add variables to a lowercase-name map; a typed reference replaces an "unknown" one."""
+    for v in variables:
+        key = v.name.lower()
+        current = unique_vars.get(key)
+        if current is None or (current.inferred_type == "unknown" and v.inferred_type != "unknown"):
+            unique_vars[key] = v
+    return unique_vars
 
 
 def _extract_variables_from_condition(condition: str, line_number: int) -> list[VariableRef]:
     """Extract variable references from a SAS condition expression."""
     variables = []
     seen = set()
-
-    for match in _COMPARISON_RE.finditer(condition):
-        var_name = match.group(1).lower()
-        operator = match.group(2).lower()
-        value = match.group(3).strip("'\"()")
-
-        if var_name in _SAS_KEYWORDS or var_name in seen:
-            continue
-        seen.add(var_name)
-
-        # Infer type from the comparison value
-        inferred_type = "unknown"
-        if value.replace(".", "", 1).replace("-", "", 1).isdigit():
-            inferred_type = "numeric"
-        elif value.startswith("'") or value.startswith('"'):
-            inferred_type = "character"
-
-        variables.append(VariableRef(
-            name=var_name,
-            inferred_type=inferred_type,
-            source="condition",
-            line_number=line_number,
-        ))
+    var_name = None  # Name that may start a comparison
+    compared = False  # var_name was followed by an operator
+
+    # One pass over the tokens: a name, an operator, then the value whose
+    # token kind gives the type ("x in (1, 2)" is typed by its first item)
+    for match in _COND_TOKEN_RE.finditer(condition):
+        kind = match.lastgroup
+        if compared:
+            if kind == "other" and match.group() == "(":
+                continue
+            name = var_name.lower()
+            var_name, compared = None, False
+            if name in _SAS_KEYWORDS or name in seen:
+                continue
+            seen.add(name)
+            variables.append(VariableRef(
+                name=name,
+                inferred_type=_VALUE_TYPES.get(kind, "unknown"),
+                source="condition",
+                line_number=line_number,
+            ))
+        elif kind == "ident":
+            var_name = match.group()
+        elif kind == "op" and var_name is not None:
+            compared = True
+        else:
+            var_name = None
 
     return variables
 
@@ -228,11 +337,12 @@ def _extract_variables_from_input(input_text: str, line_number: int) -> list[Var
     while i < len(tokens):
         token = tokens[i]
         # Skip positional pointers like @1, +2, #3
-        if re.match(r"^[@#+]\d*$", token) or token in ("@@", "@"):
+        if _INPUT_POINTER_RE.match(token) or token in ("@@", "@"):
             i += 1
             continue
 
-        if re.match(r"^[a-zA-Z_]\w*$", token) and token.lower() not in _SAS_KEYWORDS:
+        name = token.lower()
+        if name not in _SAS_KEYWORDS and _INPUT_NAME_RE.match(token):
             var_type = "unknown"
             fmt = ""
             # Check next token for $ or format
@@ -241,20 +351,21 @@ def _extract_variables_from_input(input_text: str, line_number: int) -> list[Var
                 if next_tok == "$":
                     var_type = "character"
                     i += 1
-                elif re.match(r"^\$?\d+\.$", next_tok):
+                elif _INPUT_WIDTH_RE.match(next_tok):
                     var_type = "character" if next_tok.startswith("$") else "numeric"
                     fmt = next_tok
                     i += 1
-                elif re.match(r"^\w+\d*\.\d*$", next_tok):
+                elif _INPUT_INFORMAT_RE.match(next_tok):
                     fmt = next_tok
-                    if "date" in next_tok.lower() or "yymm" in next_tok.lower():
+                    informat = next_tok.lower()
+                    if "date" in informat or "yymm" in informat:
                         var_type = "date"
                     else:
                         var_type = "numeric"
                     i += 1
 
             variables.append(VariableRef(
-                name=token.lower(),
+                name=name,
                 inferred_type=var_type if var_type != "unknown" else "numeric",
                 source="input",
                 line_number=line_number,
@@ -265,22 +376,95 @@ def _extract_variables_from_input(input_text: str, line_number: int) -> list[Var
     return variables
 
 
+@dataclass
+class _StepSpan:
+    """Character offsets of one DATA step or PROC SQL block in the code."""
+    start: int       # Start of the DATA / PROC keyword
+    body_start: int  # Just past the header's semicolon
+    body_end: int    # Start of the closing RUN / QUIT
+    end: int         # Just past the closing semicolon
+    names: str = ""  # DATA step header names, as written
+
+
+def _find_steps(code: str) -> tuple[list[_StepSpan], list[_StepSpan]]:
+    """Return the DATA step and PROC SQL spans of code, in order.
+
+    One scan over the step tokens. A header opens a step when no step of
+    its kind is open; the first RUN (DATA) or QUIT (PROC SQL) after the
+    header closes it. Headers of the same kind inside an open step are
+    part of its body, and a header with no terminator after it is dropped.
+    """
+    data_steps: list[_StepSpan] = []
+    sql_steps: list[_StepSpan] = []
+    open_data: _StepSpan | None = None
+    open_sql: _StepSpan | None = None
+
+    for m in _STEP_TOKEN_RE.finditer(code):
+        kind = m.lastgroup
+        if kind == "data_semi":
+            if open_data is None:
+                open_data = _StepSpan(
+                    m.start(), m.end("data_semi"), -1, -1, m.group("data_names"),
+                )
+        elif kind == "sql_head":
+            if open_sql is None:
+                open_sql = _StepSpan(m.start(), m.end("sql_head"), -1, -1)
+        elif kind == "run":
+            if open_data is not None and m.start() >= open_data.body_start:
+                open_data.body_end = m.start()
+                open_data.end = m.end()
+                data_steps.append(open_data)
+                open_data = None
+        elif open_sql is not None and m.start() >= open_sql.body_start:
+            open_sql.body_end = m.start()
+            open_sql.end = m.end()
+            sql_steps.append(open_sql)
+            open_sql = None
+
+    return data_steps, sql_steps
+
+
+def _match_statements(
+    body: str,
+    keyword_re: re.Pattern,
+    patterns: dict[str, re.Pattern],
+) -> dict[str, list[re.Match]]:
+    """Return what patterns[k].finditer(body) would, for every key k.
+
+    One scan finds every keyword; a pattern is only tried where its own
+    keyword starts and its previous match has ended, instead of each
+    pattern searching the whole body.
+    """
+    found: dict[str, list[re.Match]] = {key: [] for key in patterns}
+    resume = dict.fromkeys(patterns, 0)
+    for hit in keyword_re.finditer(body):
+        key = hit.lastgroup
+        pos = hit.start()
+        if pos < resume[key]:
+            continue
+        m = patterns[key].match(body, pos)
+        if m:
+            found[key].append(m)
+            resume[key] = m.end()
+    return found
+
+
 def _parse_data_step(
-    match: re.Match,
+    span: _StepSpan,
     code: str,
+    line_starts: list[int],
     point_counter: list[int],
     file_id: str,
 ) -> SASBlock:
-    """Parse a single DATA step match into a SASBlock with coverage points."""
-    dataset_names_raw = match.group(1)
-    body = match.group(2)
-    start_line = _line_number_at(code, match.start())
-    end_line = _line_number_at(code, match.end())
+    """Parse a single DATA step span into a SASBlock with coverage points."""
+    dataset_names_raw = span.names
+    body = code[span.body_start:span.body_end]
+    start_line = _line_number_at(line_starts, span.start)
+    end_line = _line_number_at(line_starts, span.end)
 
     output_datasets = [
         name.strip().strip("'\"")
-        for name in re.split(r"\s+", dataset_names_raw.strip())
-        if name.strip()
+        for name in dataset_names_raw.split()
     ]
 
     block = SASBlock(
@@ -288,7 +472,7 @@ def _parse_data_step(
         name=output_datasets[0] if output_datasets else "unknown",
         start_line=start_line,
         end_line=end_line,
-        raw_text=match.group(0),
+        raw_text=code[span.start:span.end],
         output_datasets=output_datasets,
     )
 
@@ -302,24 +486,28 @@ def _parse_data_step(
         description=f"DATA step entry: {block.name}",
     ))
 
-    # Input datasets from SET / MERGE
-    for set_match in _SET_RE.finditer(body):
-        datasets = re.findall(r"([\w.]+)", set_match.group(1))
-        block.input_datasets.extend(d.lower() for d in datasets if d.lower() not in _SAS_KEYWORDS)
+    statements = _match_statements(body, _DATA_KEYWORD_RE, _DATA_STATEMENT_RES)
 
-    for merge_match in _MERGE_RE.finditer(body):
-        datasets = re.findall(r"([\w.]+)", merge_match.group(1))
-        block.input_datasets.extend(d.lower() for d in datasets if d.lower() not in _SAS_KEYWORDS)
+    # Input datasets from SET / MERGE, deduplicated in first-seen order
+    input_datasets: dict[str, None] = {}
+    for set_match in statements["set"] + statements["merge"]:
+        # Option text (where=, keep=, in=, ...) holds no dataset names
+        names = _DATASET_OPTIONS_RE.sub(" ", set_match.group(1))
+        for d in _DATASET_NAME_RE.findall(names):
+            d = d.lower()
+            if d not in _SAS_KEYWORDS:
+                input_datasets[d] = None
+    block.input_datasets = list(input_datasets)
 
     # Variables from INPUT
-    for input_match in _INPUT_RE.finditer(body):
-        line_num = _line_number_at(code, match.start() + input_match.start())
+    for input_match in statements["input"]:
+        line_num = _line_number_at(line_starts, span.start + input_match.start())
         block.variables.extend(_extract_variables_from_input(input_match.group(1), line_num))
 
     # IF/THEN branches
-    for if_match in _IF_THEN_RE.finditer(body):
+    for if_match in statements["if"]:
         condition = if_match.group(1).strip()
-        line_num = _line_number_at(code, match.start() + if_match.start())
+        line_num = _line_number_at(line_starts, span.start + if_match.start())
 
         point_counter[0] += 1
         pid_true = f"{file_id}:{point_counter[0]}"
@@ -345,18 +533,18 @@ def _parse_data_step(
         block.variables.extend(_extract_variables_from_condition(condition, line_num))
 
     # SELECT/WHEN/OTHERWISE
-    for sel_match in _SELECT_RE.finditer(body):
-        sel_start = match.start() + sel_match.start()
+    for sel_match in statements["select"]:
+        sel_start = span.start + sel_match.start()
         # Find all WHENs between this SELECT and next END
         sel_body_start = sel_match.end()
-        end_match = re.search(r"(?i)\bEND\s*;", body[sel_match.start():])
+        end_match = _END_RE.search(body, sel_match.start())
         if not end_match:
             continue
-        sel_body = body[sel_match.start():sel_match.start() + end_match.end()]
+        sel_body = body[sel_match.start():end_match.end()]
 
         for when_match in _WHEN_RE.finditer(sel_body):
             condition = when_match.group(1).strip()
-            line_num = _line_number_at(code, sel_start + when_match.start())
+            line_num = _line_number_at(line_starts, sel_start + when_match.start())
             point_counter[0] += 1
             pid = f"{file_id}:{point_counter[0]}"
             block.coverage_points.append(CoveragePoint(
@@ -368,9 +556,9 @@ def _parse_data_step(
             ))
             block.variables.extend(_extract_variables_from_condition(condition, line_num))
 
-        if _OTHERWISE_RE.search(sel_body):
-            ow_match = _OTHERWISE_RE.search(sel_body)
-            line_num = _line_number_at(code, sel_start + ow_match.start())
+        ow_match = _OTHERWISE_RE.search(sel_body)
+        if ow_match:
+            line_num = _line_number_at(line_starts, sel_start + ow_match.start())
             point_counter[0] += 1
             pid = f"{file_id}:{point_counter[0]}"
             block.coverage_points.append(CoveragePoint(
@@ -384,22 +572,23 @@ def _parse_data_step(
 
 
 def _parse_proc_sql(
-    match: re.Match,
+    span: _StepSpan,
     code: str,
+    line_starts: list[int],
     point_counter: list[int],
     file_id: str,
 ) -> SASBlock:
     """Parse a PROC SQL block."""
-    body = match.group(1)
-    start_line = _line_number_at(code, match.start())
-    end_line = _line_number_at(code, match.end())
+    body = code[span.body_start:span.body_end]
+    start_line = _line_number_at(line_starts, span.start)
+    end_line = _line_number_at(line_starts, span.end)
 
     block = SASBlock(
         block_type=BlockType.PROC_SQL,
         name="SQL",
         start_line=start_line,
         end_line=end_line,
-        raw_text=match.group(0),
+        raw_text=code[span.start:span.end],
     )
 
     # STEP_ENTRY
@@ -412,10 +601,12 @@ def _parse_proc_sql(
         description="PROC SQL entry",
     ))
 
+    statements = _match_statements(body, _SQL_KEYWORD_RE, _SQL_STATEMENT_RES)
+
     # WHERE clauses
-    for where_match in _SQL_WHERE_RE.finditer(body):
+    for where_match in statements["where"]:
         condition = where_match.group(1).strip()
-        line_num = _line_number_at(code, match.start() + where_match.start())
+        line_num = _line_number_at(line_starts, span.start + where_match.start())
         point_counter[0] += 1
         pid = f"{file_id}:{point_counter[0]}"
         block.coverage_points.append(CoveragePoint(
@@ -428,13 +619,13 @@ def _parse_proc_sql(
         block.variables.extend(_extract_variables_from_condition(condition, line_num))
 
     # CASE/WHEN/ELSE
-    for case_match in _SQL_CASE_RE.finditer(body):
+    for case_match in statements["case"]:
         case_body = case_match.group(1)
-        case_start = match.start() + case_match.start()
+        case_start = span.start + case_match.start()
 
         for when_match in _SQL_WHEN_RE.finditer(case_body):
             condition = when_match.group(1).strip()
-            line_num = _line_number_at(code, case_start + when_match.start())
+            line_num = _line_number_at(line_starts, case_start + when_match.start())
             point_counter[0] += 1
             pid = f"{file_id}:{point_counter[0]}"
             block.coverage_points.append(CoveragePoint(
@@ -446,9 +637,9 @@ def _parse_proc_sql(
             ))
             block.variables.extend(_extract_variables_from_condition(condition, line_num))
 
-        if _SQL_ELSE_RE.search(case_body):
-            el_match = _SQL_ELSE_RE.search(case_body)
-            line_num = _line_number_at(code, case_start + el_match.start())
+        el_match = _SQL_ELSE_RE.search(case_body)
+        if el_match:
+            line_num = _line_number_at(line_starts, case_start + el_match.start())
             point_counter[0] += 1
             pid = f"{file_id}:{point_counter[0]}"
             block.coverage_points.append(CoveragePoint(
@@ -458,72 +649,76 @@ def _parse_proc_sql(
                 description="CASE ELSE branch",
             ))
 
-    # Output tables from CREATE TABLE
-    for ct_match in re.finditer(r"(?i)\bCREATE\s+TABLE\s+([\w.]+)", body):
-        block.output_datasets.append(ct_match.group(1).lower())
-
-    # Input tables from FROM
-    for from_match in re.finditer(r"(?i)\bFROM\s+([\w.]+)", body):
+    # Output tables from CREATE TABLE and input tables from FROM, deduplicated
+    # in first-seen order
+    block.output_datasets = list(dict.fromkeys(
+        ct_match.group(1).lower() for ct_match in statements["create"]
+    ))
+    input_tables: dict[str, None] = {}
+    for from_match in statements["from"]:
         table = from_match.group(1).lower()
         if table not in _SAS_KEYWORDS:
-            block.input_datasets.append(table)
+            input_tables[table] = None
+    block.input_datasets = list(input_tables)
 
     return block
 
 
-def parse_sas_file(file_path: str | Path) -> ParseResult:
-    """Parse a SAS file and return all blocks, coverage points, and variables."""
-    file_path = Path(file_path)
-    logger.info("Parsing SAS file: %s", file_path)
-
+def _parse_code(raw_code: str, file_path: Path) -> ParseResult:
+    """Parse SAS source text; file_path is recorded and names the coverage points."""
     result = ParseResult(file_path=str(file_path))
 
-    try:
-        raw_code = file_path.read_text(encoding="utf-8", errors="replace")
-    except OSError as exc:
-        result.errors.append(f"Cannot read file: {exc}")
-        return result
-
     code = _strip_comments(raw_code)
     file_id = file_path.stem[:20]  # Short ID for coverage points
     point_counter = [0]  # Mutable counter shared across parsers
 
+    line_starts = _line_starts(code)
+    data_steps, sql_steps = _find_steps(code)
+
     # Parse DATA steps
-    for match in _DATA_STEP_RE.finditer(code):
+    for span in data_steps:
         try:
-            block = _parse_data_step(match, code, point_counter, file_id)
+            block = _parse_data_step(span, code, line_starts, point_counter, file_id)
             result.blocks.append(block)
         except Exception as exc:
-            line = _line_number_at(code, match.start())
+            line = _line_number_at(line_starts, span.start)
             result.errors.append(f"Error parsing DATA step at line {line}: {exc}")
             logger.warning("Parse error at line %d: %s", line, exc)
 
     # Parse PROC SQL
-    for match in _PROC_SQL_RE.finditer(code):
+    for span in sql_steps:
         try:
-            block = _parse_proc_sql(match, code, point_counter, file_id)
+            block = _parse_proc_sql(span, code, line_starts, point_counter, file_id)
             result.blocks.append(block)
         except Exception as exc:
-            line = _line_number_at(code, match.start())
+            line = _line_number_at(line_starts, span.start)
             result.errors.append(f"Error parsing PROC SQL at line {line}: {exc}")
             logger.warning("Parse error at line %d: %s", line, exc)
 
-    # Collect all points and variables
+    # Collect all points, and variables deduplicated by name as they come
+    seen_vars: dict[str, VariableRef] = {}
     for block in result.blocks:
         result.all_coverage_points.extend(block.coverage_points)
-        result.all_variables.extend(block.variables)
-
-    # Deduplicate variables by name
-    seen_vars: dict[str, VariableRef] = {}
-    for var in result.all_variables:
-        key = var.name.lower()
-        if key not in seen_vars or (
-            seen_vars[key].inferred_type == "unknown"
-            and var.inferred_type != "unknown"
-        ):
-            seen_vars[key] = var
+        _merge_variables(seen_vars, block.variables)
     result.all_variables = list(seen_vars.values())
 
+    return result
+
+
+def parse_sas_file(file_path: str | Path) -> ParseResult:
+    """Parse a SAS file and return all blocks, coverage points, and variables."""
+    file_path = Path(file_path)
+    logger.info("Parsing SAS file: %s", file_path)
+
+    try:
+        raw_code = file_path.read_text(encoding="utf-8", errors="replace")
+    except OSError as exc:
+        result = ParseResult(file_path=str(file_path))
+        result.errors.append(f"Cannot read file: {exc}")
+        return result
+
+    result = _parse_code(raw_code, file_path)
+
     logger.info(
         "Parsed %s: %d blocks, %d coverage points, %d variables",
         file_path.name,
@@ -535,10 +730,36 @@ def parse_sas_file(file_path: str | Path) -> ParseResult:
     return result
 
 
+def parse_sas_files(
+    file_paths: list[str | Path],
+    workers: int | None = None,
+) -> list[ParseResult]:
+    """Parse several independent SAS files, in a process pool if useful.
+
+    Parsing is pure-Python CPU work, so separate processes sidestep the
+    GIL. Results are returned in input order.
+
+    Args:
+        file_paths: SAS files to parse.
+        workers: Maximum worker processes (default: CPU count). With one
+            worker or one file, parsing runs in this process.
+    """
+    workers = min(workers or os.cpu_count() or 1, len(file_paths))
+    if workers <= 1:
+        return [parse_sas_file(path) for path in file_paths]
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    chunksize = max(1, min(4, len(file_paths) // workers))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(parse_sas_file, file_paths, chunksize=chunksize))
+
+
 def parse_sas_project(
     entry_file: str | Path,
     search_dirs: list[str | Path] | None = None,
     macro_vars: dict[str, str] | None = None,
+    resolved: ResolvedSource | None = None,
 ) -> ParseResult:
     """Parse a SAS project by resolving %INCLUDE directives first.
 
@@ -549,6 +770,7 @@ def parse_sas_project(
         entry_file: The main SAS program (e.g., main.sas).
         search_dirs: Additional directories to search for included files.
         macro_vars: Macro variable definitions for expanding paths in %INCLUDE.
+        resolved: Already-resolved source for entry_file (skips resolution).
 
     Returns:
         ParseResult for the entire resolved project.
@@ -558,57 +780,20 @@ def parse_sas_project(
     entry_file = Path(entry_file)
     logger.info("Parsing SAS project from entry: %s", entry_file)
 
-    resolved = resolve_includes(
-        entry_file,
-        search_dirs=search_dirs,
-        macro_vars=macro_vars,
-    )
+    if resolved is None:
+        resolved = resolve_includes(
+            entry_file,
+            search_dirs=search_dirs,
+            macro_vars=macro_vars,
+        )
 
     if resolved.errors:
         for err in resolved.errors:
             logger.warning("Include resolution: %s", err)
 
-    # Parse the resolved (fully inlined) code
-    code = _strip_comments(resolved.resolved_code)
-    file_id = entry_file.stem[:20]
-    point_counter = [0]
-
-    result = ParseResult(file_path=str(entry_file))
-    result.errors.extend(resolved.errors)
-
-    # Parse DATA steps
-    for match in _DATA_STEP_RE.finditer(code):
-        try:
-            block = _parse_data_step(match, code, point_counter, file_id)
-            result.blocks.append(block)
-        except Exception as exc:
-            line = _line_number_at(code, match.start())
-            result.errors.append(f"Error parsing DATA step at line {line}: {exc}")
-
-    # Parse PROC SQL
-    for match in _PROC_SQL_RE.finditer(code):
-        try:
-            block = _parse_proc_sql(match, code, point_counter, file_id)
-            result.blocks.append(block)
-        except Exception as exc:
-            line = _line_number_at(code, match.start())
-            result.errors.append(f"Error parsing PROC SQL at line {line}: {exc}")
-
-    # Collect all points and variables
-    for block in result.blocks:
-        result.all_coverage_points.extend(block.coverage_points)
-        result.all_variables.extend(block.variables)
-
-    # Deduplicate variables
-    seen_vars: dict[str, VariableRef] = {}
-    for var in result.all_variables:
-        key = var.name.lower()
-        if key not in seen_vars or (
-            seen_vars[key].inferred_type == "unknown"
-            and var.inferred_type != "unknown"
-        ):
-            seen_vars[key] = var
-    result.all_variables = list(seen_vars.values())
+    # Parse the resolved (fully inlined) code; include errors come first
+    result = _parse_code(resolved.resolved_code, entry_file)
+    result.errors[:0] = resolved.errors
 
     logger.info(
         "Parsed project %s: %d files included, %d blocks, %d coverage points, %d variables",
@@ -622,11 +807,57 @@ def parse_sas_project(
     return result
 
 
+# parse_sas_code results by (file_id, code digest), least recently used first.
+# Keyed on a digest so cached entries do not keep large programs alive.
+# Callers only ever get copies (see _copy_result), so none can alter an entry.
+_CODE_CACHE: OrderedDict[tuple[str, bytes], ParseResult] = OrderedDict()
+_CODE_CACHE_SIZE = 128
+_CODE_CACHE_LOCK = threading.Lock()
+
+
+def _copy_result(result: ParseResult) -> ParseResult:
+    """Return a copy of result with its own blocks and lists.
+
+    CoveragePoint and VariableRef are frozen, so the copies share them.
+    """
+    return ParseResult(
+        file_path=result.file_path,
+        blocks=[
+            replace(
+                b,
+                coverage_points=list(b.coverage_points),
+                variables=list(b.variables),
+                input_datasets=list(b.input_datasets),
+                output_datasets=list(b.output_datasets),
+            )
+            for b in result.blocks
+        ],
+        all_coverage_points=list(result.all_coverage_points),
+        all_variables=list(result.all_variables),
+        errors=list(result.errors),
+    )
+
+
 def parse_sas_code(code: str, file_id: str = "inline") -> ParseResult:
-    """Parse SAS code from a string (useful for testing)."""
-    from tempfile import NamedTemporaryFile
+    """Parse SAS code from a string (useful for testing).
 
-    with NamedTemporaryFile(mode="w", suffix=".sas", delete=False, encoding="utf-8") as f:
-        f.write(code)
-        f.flush()
-        return parse_sas_file(f.name)
+    file_id stands in for the file name, so coverage points are named
+    "<file_id>:<n>". The last results are cached by a hash of the code, so
+    parsing the same text again skips the parse; each call returns its own
+    copy, which the caller may modify.
+    """
+    digest = hashlib.blake2b(code.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+    key = (file_id, digest)
+    with _CODE_CACHE_LOCK:
+        result = _CODE_CACHE.get(key)
+        if result is not None:
+            _CODE_CACHE.move_to_end(key)
+            return _copy_result(result)
+
+    result = _parse_code(code, Path(f"{file_id}.sas"))
+
+    with _CODE_CACHE_LOCK:
+        _CODE_CACHE[key] = _copy_result(result)
+        if len(_CODE_CACHE) > _CODE_CACHE_SIZE:
+            _CODE_CACHE.popitem(last=False)
+    return result
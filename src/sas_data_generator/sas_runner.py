@@ -15,13 +15,19 @@ The runner:
 
 from __future__ import annotations
 
+import functools
 import logging
+import mmap
 import os
+import queue
+import re
 import shutil
 import subprocess
 import tempfile
+import threading
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Any, Iterable, Sequence
 
 logger = logging.getLogger(__name__)
 
@@ -48,9 +54,23 @@ class SASRunResult:
 
 
 def find_sas_executable() -> str | None:
-    """Find the SAS executable on this system."""
+    """Find the SAS executable on this system.
+
+    The search is cached per SAS_EXECUTABLE value, so repeated run_sas
+    calls don't walk PATH again. Call clear_sas_executable_cache() after
+    installing SAS while the process is running.
+    """
+    return _find_sas_executable(os.environ.get("SAS_EXECUTABLE"))
+
+
+def clear_sas_executable_cache() -> None:
+    """Forget the cached find_sas_executable() results."""
+    _find_sas_executable.cache_clear()
+
+
+@functools.lru_cache(maxsize=4)
+def _find_sas_executable(env_sas: str | None) -> str | None:
     # Check environment variable first
-    env_sas = os.environ.get("SAS_EXECUTABLE")
     if env_sas and Path(env_sas).exists():
         return env_sas
 
@@ -64,16 +84,74 @@ def find_sas_executable() -> str | None:
 
 
 def _extract_errors_warnings(log_text: str) -> tuple[list[str], list[str]]:
-    """Extract ERROR and WARNING lines from SAS log."""
-    errors = []
-    warnings = []
-    for line in log_text.splitlines():
-        stripped = line.strip()
-        if stripped.startswith("ERROR"):
-            errors.append(stripped)
-        elif stripped.startswith("WARNING"):
-            warnings.append(stripped)
-    return errors, warnings
+    """Extract ERROR and WARNING lines from SAS log text without splitting it into lines."""
+    return _lines_starting_with(log_text, "ERROR"), _lines_starting_with(log_text, "WARNING")
+
+
+def _preamble(
+    libname_map: dict[str, str] | None,
+    macro_vars: dict[str, str] | None,
+) -> list[str]:
+    """Return the LIBNAME and %LET statements to run before a program."""
+    preamble_parts = []
+
+    if libname_map:
+        for libref, lib_path in libname_map.items():
+            lib_path_resolved = Path(lib_path).resolve()
+            lib_path_resolved.mkdir(parents=True, exist_ok=True)
+            preamble_parts.append(f'libname {libref} "{lib_path_resolved}";')
+
+    if macro_vars:
+        for name, value in macro_vars.items():
+            preamble_parts.append(f"%let {name} = {value};")
+
+    return preamble_parts
+
+
+def _write_program(sas_file: Path, sas_code: str, preamble_parts: Sequence[str] = ()) -> None:
+    """Write the preamble statements, a blank line, then sas_code to sas_file.
+
+    Parts are written one after another instead of concatenated first, so
+    a large program is not copied again just to prepend a few statements.
+    """
+    with open(sas_file, "w", encoding="utf-8", buffering=1024 * 1024) as f:
+        if preamble_parts:
+            f.writelines(part + "\n" for part in preamble_parts)
+            f.write("\n")
+        f.write(sas_code)
+
+
+def _lines_starting_with(log_data, keyword: str | bytes) -> list[str]:
+    """Return the stripped lines of log_data that start with keyword.
+
+    log_data is str, or bytes/mmap with a bytes keyword (matching lines are
+    decoded). Leading whitespace is allowed before the keyword. Only
+    occurrences of keyword are visited, so no list of every line is built.
+    """
+    newline = b"\n" if isinstance(keyword, bytes) else "\n"
+    lines = []
+    pos = log_data.find(keyword)
+    while pos != -1:
+        start = log_data.rfind(newline, 0, pos) + 1
+        end = log_data.find(newline, pos)
+        if end == -1:
+            end = len(log_data)
+        if not log_data[start:pos].strip():
+            line = log_data[start:end].strip()
+            if isinstance(line, bytes):
+                line = line.decode("utf-8", errors="replace")
+            lines.append(line)
+        pos = log_data.find(keyword, end)
+    return lines
+
+
+def _extract_errors_warnings_from_file(log_file: Path) -> tuple[list[str], list[str]]:
+    """Extract ERROR and WARNING lines from a SAS log file without decoding all of it."""
+    with log_file.open("rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return [], []
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return _lines_starting_with(mm, b"ERROR"), _lines_starting_with(mm, b"WARNING")
 
 
 def run_sas(
@@ -85,6 +163,7 @@ def run_sas(
     autoexec_path: str | Path | None = None,
     macro_vars: dict[str, str] | None = None,
     libname_map: dict[str, str] | None = None,
+    keep_log_text: bool = True,
 ) -> SASRunResult:
     """Run a SAS program in batch mode and return the results.
 
@@ -97,6 +176,9 @@ def run_sas(
         autoexec_path: Path to autoexec.sas file.
         macro_vars: Macro variable definitions to inject (name -> value).
         libname_map: Library name mappings (libref -> path).
+        keep_log_text: Load the whole log into SASRunResult.log_text. When
+            False, log_text is empty and the log file is memory-mapped and
+            searched as bytes, so memory stays flat however large it grows.
 
     Returns:
         SASRunResult with log, return code, etc.
@@ -119,25 +201,9 @@ def run_sas(
     work_dir = Path(work_dir)
     work_dir.mkdir(parents=True, exist_ok=True)
 
-    # Prepend macro variables and libname statements
-    preamble_parts = []
-
-    if libname_map:
-        for libref, lib_path in libname_map.items():
-            lib_path_resolved = Path(lib_path).resolve()
-            lib_path_resolved.mkdir(parents=True, exist_ok=True)
-            preamble_parts.append(f'libname {libref} "{lib_path_resolved}";')
-
-    if macro_vars:
-        for name, value in macro_vars.items():
-            preamble_parts.append(f"%let {name} = {value};")
-
-    if preamble_parts:
-        sas_code = "\n".join(preamble_parts) + "\n\n" + sas_code
-
-    # Write SAS code to temp file
+    # Write SAS code, with macro variables and libname statements prepended
     sas_file = work_dir / "_sas_datagen_run.sas"
-    sas_file.write_text(sas_code, encoding="utf-8")
+    _write_program(sas_file, sas_code, _preamble(libname_map, macro_vars))
 
     log_file = work_dir / "_sas_datagen_run.log"
     lst_file = work_dir / "_sas_datagen_run.lst"
@@ -182,20 +248,23 @@ def run_sas(
 
     duration = time.monotonic() - start_time
 
-    # Read log
+    # Read log, or just scan it for errors and warnings
     log_text = ""
-    if log_file.exists():
+    errors: list[str] = []
+    warnings: list[str] = []
+    if not log_file.exists():
+        logger.warning("SAS log file not found: %s", log_file)
+    elif keep_log_text:
         log_text = log_file.read_text(encoding="utf-8", errors="replace")
+        errors, warnings = _extract_errors_warnings(log_text)
     else:
-        logger.warning("SAS log file not found: %s", log_file)
+        errors, warnings = _extract_errors_warnings_from_file(log_file)
 
     # Read listing
     lst_text = ""
     if lst_file.exists():
         lst_text = lst_file.read_text(encoding="utf-8", errors="replace")
 
-    errors, warnings = _extract_errors_warnings(log_text)
-
     if errors:
         logger.warning("SAS errors found: %d", len(errors))
         for err in errors[:5]:
@@ -220,6 +289,271 @@ def run_sas(
     return result
 
 
+# Printed to the session's stderr after each program: run number, then &SYSCC
+_SESSION_END_RE = re.compile(r"^_SASDATAGEN_END_(\d+)_(\d+)\s*$")
+
+
+class SASSession:
+    """A long-running SAS process (`sas -stdio`) that runs programs one after another.
+
+    Starting SAS takes seconds, which dominates when many small programs are
+    run. A session pays that once: each run() pipes a program to the same
+    process, routes its log and listing to files in the run's work_dir with
+    PROC PRINTTO, then waits for a sentinel %PUT on stderr.
+
+    Programs share the SAS session, so WORK datasets, options and macro
+    variables left by one run are visible to the next; OBS, REPLACE and
+    syntax-check mode are reset before each program. The return code is
+    derived from &SYSCC (0 = clean, 1 = warnings, 2 = errors), as batch SAS
+    reports it. A run that times out kills the process; the next run()
+    starts a fresh one.
+
+    Use as a context manager, or call close() when done.
+    """
+
+    def __init__(
+        self,
+        sas_executable: str | None = None,
+        work_dir: str | Path | None = None,
+        extra_sas_options: list[str] | None = None,
+        autoexec_path: str | Path | None = None,
+    ):
+        if sas_executable is None:
+            sas_executable = find_sas_executable()
+        if sas_executable is None:
+            raise FileNotFoundError(
+                "SAS executable not found. Set SAS_EXECUTABLE environment variable "
+                "or ensure 'sas' is on PATH."
+            )
+        self.sas_executable = sas_executable
+        self.work_dir = Path(work_dir or tempfile.mkdtemp(prefix="sas_datagen_session_"))
+        self.work_dir.mkdir(parents=True, exist_ok=True)
+        self.extra_sas_options = extra_sas_options
+        self.autoexec_path = autoexec_path
+        self._proc: subprocess.Popen | None = None
+        self._stderr_lines: queue.Queue[str | None] = queue.Queue()
+        self._runs = 0
+
+    def __enter__(self) -> SASSession:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _start(self) -> subprocess.Popen:
+        cmd = [
+            self.sas_executable,
+            "-stdio",
+            "-noterminal",
+            "-nologo",
+            "-work", str(self.work_dir),
+        ]
+        if self.autoexec_path:
+            cmd.extend(["-autoexec", str(self.autoexec_path)])
+        if self.extra_sas_options:
+            cmd.extend(self.extra_sas_options)
+
+        logger.info("Starting SAS session: %s", " ".join(cmd))
+        proc = subprocess.Popen(
+            cmd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            encoding="utf-8",
+            errors="replace",
+            bufsize=1,
+            cwd=str(self.work_dir),
+        )
+        # Drain both pipes so SAS never blocks on a full one; stderr lines
+        # are queued for run() to look for its sentinel
+        self._stderr_lines = queue.Queue()
+        threading.Thread(
+            target=_pump_lines, args=(proc.stderr, self._stderr_lines.put), daemon=True,
+        ).start()
+        threading.Thread(
+            target=_pump_lines, args=(proc.stdout, lambda line: None), daemon=True,
+        ).start()
+        return proc
+
+    def run(
+        self,
+        sas_code: str,
+        work_dir: str | Path | None = None,
+        timeout_seconds: int = 300,
+        macro_vars: dict[str, str] | None = None,
+        libname_map: dict[str, str] | None = None,
+        keep_log_text: bool = True,
+    ) -> SASRunResult:
+        """Run one program in the session; arguments are as for run_sas()."""
+        import time
+
+        if self._proc is None or self._proc.poll() is not None:
+            self._proc = self._start()
+
+        if work_dir is None:
+            work_dir = tempfile.mkdtemp(prefix="sas_datagen_")
+        work_dir = Path(work_dir).resolve()
+        work_dir.mkdir(parents=True, exist_ok=True)
+
+        sas_file = work_dir / "_sas_datagen_run.sas"
+        log_file = work_dir / "_sas_datagen_run.log"
+        lst_file = work_dir / "_sas_datagen_run.lst"
+        _write_program(sas_file, sas_code, _preamble(libname_map, macro_vars))
+
+        self._runs += 1
+        run_id = self._runs
+        # After an ERROR, non-interactive SAS sets OBS=0 and syntax-check
+        # mode for the rest of the session; reset both so a failed program
+        # does not leave the next one reading no observations. The magic
+        # comment closes any quote, comment or step the program left open,
+        # so the sentinel is always reached
+        program = (
+            f'proc printto log="{log_file}" print="{lst_file}" new; run;\n'
+            "%let syscc = 0;\n"
+            "options obs=max replace nosyntaxcheck;\n"
+            f'%include "{sas_file}";\n'
+            "*';*\";*/;quit;run;\n"
+            "%let _sasdatagen_rc = &syscc;\n"
+            "proc printto; run;\n"
+            f"%put _SASDATAGEN_END_{run_id}_&_sasdatagen_rc;\n"
+        )
+
+        logger.info("Running SAS program %d in session: %s", run_id, sas_file)
+        start_time = time.monotonic()
+        deadline = start_time + timeout_seconds
+        return_code = -1
+        try:
+            self._proc.stdin.write(program)
+            self._proc.stdin.flush()
+            while True:
+                line = self._stderr_lines.get(timeout=max(0.0, deadline - time.monotonic()))
+                if line is None:
+                    logger.error("SAS session exited with code %s", self._proc.wait())
+                    break
+                m = _SESSION_END_RE.match(line)
+                if m and int(m.group(1)) == run_id:
+                    syscc = int(m.group(2))
+                    return_code = 0 if syscc == 0 else 1 if syscc <= 4 else 2
+                    break
+        except queue.Empty:
+            logger.error("SAS execution timed out after %d seconds", timeout_seconds)
+            self._kill()
+        except OSError as exc:
+            logger.error("SAS session pipe closed: %s", exc)
+            self._kill()
+
+        duration = time.monotonic() - start_time
+
+        log_text = ""
+        errors: list[str] = []
+        warnings: list[str] = []
+        if not log_file.exists():
+            logger.warning("SAS log file not found: %s", log_file)
+        elif keep_log_text:
+            log_text = log_file.read_text(encoding="utf-8", errors="replace")
+            errors, warnings = _extract_errors_warnings(log_text)
+        else:
+            errors, warnings = _extract_errors_warnings_from_file(log_file)
+
+        lst_text = ""
+        if lst_file.exists():
+            lst_text = lst_file.read_text(encoding="utf-8", errors="replace")
+
+        logger.info(
+            "SAS completed: rc=%d, duration=%.1fs, errors=%d, warnings=%d",
+            return_code, duration, len(errors), len(warnings),
+        )
+
+        return SASRunResult(
+            return_code=return_code,
+            log_text=log_text,
+            log_path=str(log_file),
+            lst_text=lst_text,
+            work_dir=str(work_dir),
+            sas_errors=errors,
+            sas_warnings=warnings,
+            duration_seconds=duration,
+        )
+
+    def close(self) -> None:
+        """End the SAS process, killing it if it does not exit promptly."""
+        proc, self._proc = self._proc, None
+        if proc is None:
+            return
+        try:
+            if proc.poll() is None:
+                proc.stdin.write("endsas;\n")
+                proc.stdin.flush()
+            proc.stdin.close()
+            proc.wait(timeout=30)
+        except (OSError, subprocess.TimeoutExpired):
+            proc.kill()
+            proc.wait()
+
+    def _kill(self) -> None:
+        proc, self._proc = self._proc, None
+        if proc is not None:
+            proc.kill()
+            proc.wait()
+
+
+def _pump_lines(stream, put) -> None:
+    """Pass each line read from stream to put, then None at end of stream."""
+    for line in stream:
+        put(line)
+    put(None)
+
+
+def run_sas_many(
+    jobs: Iterable[dict[str, Any]],
+    max_concurrency: int = 4,
+    session_options: dict[str, Any] | None = None,
+) -> list[SASRunResult]:
+    """Run several SAS programs side by side and return their results in order.
+
+    Each job is a dict of run_sas keyword arguments (sas_code is required).
+    Jobs that share a work_dir would overwrite each other's files, so give
+    each one its own or leave it unset to get a fresh temp dir.
+
+    The threads only wait on SAS subprocesses, so the GIL is not a limit;
+    max_concurrency should match the SAS sessions the licence and machine
+    allow. The first job to raise aborts the call.
+
+    With session_options (SASSession keyword arguments, possibly empty),
+    each thread starts one SASSession and runs its share of the jobs in it,
+    so SAS starts max_concurrency times instead of once per job. Jobs then
+    take SASSession.run keyword arguments.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    jobs = list(jobs)
+    if not jobs:
+        return []
+    max_workers = max(1, min(max_concurrency, len(jobs)))
+
+    if session_options is None:
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            return list(pool.map(lambda job: run_sas(**job), jobs))
+
+    sessions: list[SASSession] = []
+    local = threading.local()
+
+    def run_in_session(job: dict[str, Any]) -> SASRunResult:
+        session = getattr(local, "session", None)
+        if session is None:
+            session = local.session = SASSession(**session_options)
+            sessions.append(session)
+        return session.run(**job)
+
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            return list(pool.map(run_in_session, jobs))
+    finally:
+        for session in sessions:
+            session.close()
+
+
 def run_sas_dry(
     sas_code: str,
     work_dir: str | Path | None = None,
@@ -235,7 +569,7 @@ def run_sas_dry(
     work_dir.mkdir(parents=True, exist_ok=True)
 
     sas_file = work_dir / "_sas_datagen_run.sas"
-    sas_file.write_text(sas_code, encoding="utf-8")
+    _write_program(sas_file, sas_code)
 
     logger.info("Dry run: SAS code written to %s", sas_file)
 
@@ -10,10 +10,12 @@ import pytest
 
 from sas_data_generator.coverage import (
     CoverageReport,
+    expected_index,
     export_coverage_report,
     merge_coverage_reports,
     parse_coverage_from_csv,
     parse_coverage_from_log,
+    parse_coverage_from_log_file,
 )
 from sas_data_generator.sas_parser import CoveragePoint, CoveragePointType
 
@@ -66,6 +68,11 @@ class TestParseFromLog:
         report = parse_coverage_from_log(log, sample_points)
         assert not report.is_complete
 
+    def test_complete_marker_before_long_tail(self, sample_points):
+        log = "COV:POINT=f:1\nCOV:COMPLETE\n" + "NOTE: trailing output\n" * 1000
+        report = parse_coverage_from_log(log, sample_points)
+        assert report.is_complete
+
     def test_duplicate_markers_counted_once(self, sample_points):
         log = "COV:POINT=f:1\nCOV:POINT=f:1\nCOV:POINT=f:1\nCOV:COMPLETE\n"
         report = parse_coverage_from_log(log, sample_points)
@@ -76,11 +83,72 @@ class TestParseFromLog:
         assert report.hit_points == 0
         assert not report.is_complete
 
+    def test_precomputed_index(self, sample_points):
+        all_ids, detail = expected_index(sample_points)
+        log = "COV:POINT=f:1\nCOV:POINT=f:2\nCOV:COMPLETE\n"
+
+        report = parse_coverage_from_log(log, sample_points, all_ids, detail)
+        assert report.hit_point_ids == {"f:1", "f:2"}
+        assert report.points_detail is detail
+
+    def test_bulk_scan_matches_loop(self, sample_points, monkeypatch):
+        import sas_data_generator.coverage as coverage_mod
+
+        log = "COV:POINT=f:2\nCOV:POINT=x:1\nCOV:POINT=f:2\nCOV:POINT=f:5\nCOV:COMPLETE\n"
+        expected = parse_coverage_from_log(log, sample_points)
+
+        monkeypatch.setattr(coverage_mod, "_BULK_SCAN_MIN_POINTS", 0)
+        bulk = parse_coverage_from_log(log, sample_points)
+
+        assert bulk.hit_point_ids == expected.hit_point_ids == {"f:2", "f:5"}
+        assert bulk.is_complete and expected.is_complete
+
     def test_no_expected_points(self):
         report = parse_coverage_from_log("COV:POINT=f:1\n", [])
         assert report.total_points == 0
         assert report.coverage_pct == 0.0
 
+    def test_no_expected_points_still_complete(self):
+        report = parse_coverage_from_log("COV:POINT=f:1\nCOV:COMPLETE\n", [])
+        assert report.hit_points == 0
+        assert report.is_complete
+
+
+class TestParseFromLogFile:
+    def test_matches_text_parser(self, sample_points, tmp_path):
+        log = "NOTE: start\nCOV:POINT=f:1\nCOV:POINT=f:4\nCOV:POINT=x:9\nCOV:COMPLETE\n"
+        log_path = tmp_path / "run.log"
+        log_path.write_text(log)
+
+        from_file = parse_coverage_from_log_file(log_path, sample_points)
+        from_text = parse_coverage_from_log(log, sample_points)
+
+        assert from_file.hit_point_ids == from_text.hit_point_ids == {"f:1", "f:4"}
+        assert from_file.missed_point_ids == from_text.missed_point_ids
+        assert from_file.is_complete
+
+    def test_empty_file(self, sample_points, tmp_path):
+        log_path = tmp_path / "run.log"
+        log_path.write_bytes(b"")
+
+        report = parse_coverage_from_log_file(log_path, sample_points)
+        assert report.hit_points == 0
+        assert not report.is_complete
+
+
+class TestParseFromCsv:
+    def test_hits_from_point_id_column(self, sample_points, tmp_path):
+        csv_path = tmp_path / "cov.csv"
+        csv_path.write_text("hit_time,point_id\n1,f:1\n2, f:3 \n3,x:9\n")
+
+        report = parse_coverage_from_csv(csv_path, sample_points)
+        assert report.hit_point_ids == {"f:1", "f:3"}
+        assert report.total_points == 5
+
+    def test_missing_file(self, sample_points, tmp_path):
+        report = parse_coverage_from_csv(tmp_path / "absent.csv", sample_points)
+        assert report.hit_points == 0
+
 
 class TestMergeReports:
     def test_merge_two_runs(self, sample_points):
@@ -103,6 +171,16 @@ class TestMergeReports:
         merged = merge_coverage_reports(r1, r2)
         assert merged.coverage_pct == 100.0
 
+    def test_merge_with_untracked_report(self, sample_points):
+        r1 = parse_coverage_from_log("COV:POINT=f:1\nCOV:COMPLETE\n", sample_points)
+        r2 = CoverageReport(hit_point_ids=frozenset({"g:1"}), missed_point_ids=frozenset({"g:2"}))
+
+        assert merge_coverage_reports(CoverageReport(), r1).expected_ids is r1.expected_ids
+        merged = merge_coverage_reports(r1, r2)
+        assert merged.total_points == 7
+        assert merged.hit_point_ids == {"f:1", "g:1"}
+        assert merged.missed_point_ids == {"f:2", "f:3", "f:4", "f:5", "g:2"}
+
     def test_merge_empty(self):
         merged = merge_coverage_reports()
         assert merged.total_points == 0
@@ -133,6 +133,19 @@ run;
 
         pd.testing.assert_frame_equal(ds1[0].df, ds2[0].df)
 
+    def test_threaded_columns_match_sequential(self, monkeypatch):
+        from sas_data_generator import dataset_generator
+
+        code = 'data a; set b; if x > 10 and name = "A" then y = z; run;'
+        parse_result = parse_sas_code(code)
+        sequential = generate_seed_datasets(parse_result, num_rows=50, seed=7)
+
+        monkeypatch.setattr(dataset_generator, "_PARALLEL_MIN_CELLS", 0)
+        monkeypatch.setattr(dataset_generator.os, "cpu_count", lambda: 4)
+        threaded = generate_seed_datasets(parse_result, num_rows=50, seed=7)
+
+        pd.testing.assert_frame_equal(sequential[0].df, threaded[0].df)
+
     def test_different_seeds_differ(self):
         code = "data a; set b; if x > 10 then y = 1; run;"
         parse_result = parse_sas_code(code)
@@ -197,6 +210,14 @@ run;
 
 
 class TestExportDataset:
+    def test_dataset_names(self):
+        ds = GeneratedDataset(name="work.my-data", df=pd.DataFrame())
+        assert ds.file_stem == "work_my_data"
+        assert ds.sas_name == "my_data"
+
+        plain = GeneratedDataset(name="customers", df=pd.DataFrame())
+        assert plain.file_stem == plain.sas_name == "customers"
+
     def test_csv_export(self):
         df = pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"]})
         ds = GeneratedDataset(name="test", df=df)
@@ -209,3 +230,30 @@ class TestExportDataset:
             loaded = pd.read_csv(paths[0])
             assert len(loaded) == 3
             assert list(loaded.columns) == ["a", "b"]
+
+    def test_parquet_export_zstd(self):
+        pq = pytest.importorskip("pyarrow.parquet")
+        df = pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"]})
+        ds = GeneratedDataset(name="test", df=df)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            paths = export_dataset(ds, tmpdir, formats=["parquet"])
+            assert paths[0].endswith(".parquet")
+            meta = pq.ParquetFile(paths[0]).metadata
+            assert meta.row_group(0).column(0).compression == "ZSTD"
+            pd.testing.assert_frame_equal(pd.read_parquet(paths[0]), df)
+
+    def test_csv_export_dates_as_iso(self):
+        df = pd.DataFrame({
+            "d": pd.to_datetime(["2000-01-01", "1960-01-01"]),
+            "x": [1.5, np.nan],
+        })
+        ds = GeneratedDataset(name="dates", df=df)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            paths = export_dataset(ds, tmpdir, formats=["csv"])
+            lines = Path(paths[0]).read_text().splitlines()
+
+        # The SAS loading step reads dates with yymmdd10.
+        assert lines[1].startswith("2000-01-01,")
+        assert lines[2].startswith("1960-01-01,")
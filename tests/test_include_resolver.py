@@ -9,6 +9,7 @@ import pytest
 
 from sas_data_generator.include_resolver import (
     ResolvedSource,
+    prefetch_sources,
     resolve_includes,
     scan_project_directory,
 )
@@ -133,6 +134,49 @@ class TestResolveIncludes:
         assert "data util" in result.resolved_code
         assert not any("not found" in e for e in result.errors)
 
+    def test_search_dir_order_and_basename_fallback(self, tmp_path):
+        # Libraries outside the project tree, so only search_dirs finds them
+        main_dir = tmp_path / "project" / "src"
+        main_dir.mkdir(parents=True)
+        first = tmp_path / "libs" / "first"
+        first.mkdir(parents=True)
+        second = tmp_path / "libs" / "second"
+        second.mkdir()
+
+        (main_dir / "main.sas").write_text(
+            '%include "util.sas";\n%include "old/helper.sas";\n'
+        )
+        (first / "util.sas").write_text("data from_first; run;\n")
+        (second / "util.sas").write_text("data from_second; run;\n")
+        (second / "helper.sas").write_text("data helper; run;\n")
+
+        result = resolve_includes(
+            main_dir / "main.sas",
+            search_dirs=[str(first), str(second)],
+        )
+
+        assert "data from_first" in result.resolved_code
+        assert "data from_second" not in result.resolved_code
+        assert "data helper" in result.resolved_code
+        assert not result.errors
+
+    def test_bare_name_case_folded_where_platform_does(self, tmp_path, monkeypatch):
+        import os
+
+        main_dir = tmp_path / "project" / "src"
+        main_dir.mkdir(parents=True)
+        lib_dir = tmp_path / "lib"
+        lib_dir.mkdir()
+        (main_dir / "main.sas").write_text('%include "UTIL.SAS";\n')
+        (lib_dir / "util.sas").write_text("data util; run;\n")
+
+        # Simulate Windows, where normcase lowercases file names
+        monkeypatch.setattr(os.path, "normcase", str.lower)
+        result = resolve_includes(main_dir / "main.sas", search_dirs=[str(lib_dir)])
+
+        assert "data util" in result.resolved_code
+        assert not result.errors
+
     def test_single_quoted_include(self, tmp_path):
         (tmp_path / "main.sas").write_text("%include 'sub.sas';\n")
         (tmp_path / "sub.sas").write_text("data sub; run;\n")
@@ -147,6 +191,42 @@ class TestResolveIncludes:
         result = resolve_includes(tmp_path / "main.sas")
         assert "data sub" in result.resolved_code
 
+    def test_include_between_lines(self, tmp_path):
+        (tmp_path / "main.sas").write_text(
+            "data a; run;\n"
+            '% INC "sub.sas" ;\n'
+            "%include\n"
+            '"sub.sas";\n'
+            "data c; run;"
+        )
+        (tmp_path / "sub.sas").write_text("data sub; run;\n")
+
+        result = resolve_includes(tmp_path / "main.sas")
+        lines = result.resolved_code.split("\n")
+        # The directive split over two lines is left alone
+        assert lines[1:] == [
+            "data a; run;",
+            f"/* %INCLUDE resolved: sub.sas -> {tmp_path / 'sub.sas'} */",
+            f"/* === BEGIN INCLUDE: sub.sas ({tmp_path / 'sub.sas'}) === */",
+            "data sub; run;",
+            "/* === END INCLUDE: sub.sas === */",
+            "%include",
+            '"sub.sas";',
+            "data c; run;",
+            "/* === END INCLUDE: main.sas === */",
+        ]
+
+    def test_edited_include_reread(self, tmp_path):
+        (tmp_path / "main.sas").write_text('%include "sub.sas";\n')
+        sub = tmp_path / "sub.sas"
+        sub.write_text("data old; run;\n")
+        assert "data old" in resolve_includes(tmp_path / "main.sas").resolved_code
+
+        sub.write_text("data newer; run;\n")
+        result = resolve_includes(tmp_path / "main.sas")
+        assert "data newer" in result.resolved_code
+        assert "data old" not in result.resolved_code
+
     def test_macro_var_in_path(self, tmp_path):
         (tmp_path / "main.sas").write_text('%include "&ROOT./sub.sas";\n')
         sub_dir = tmp_path / "myroot"
@@ -176,6 +256,17 @@ class TestResolveIncludes:
         assert "data a" in result.resolved_code
 
 
+class TestPrefetchSources:
+    def test_prefetch_then_resolve(self, project_dir):
+        expected = resolve_includes(project_dir / "main.sas")
+        files = scan_project_directory(project_dir)
+        prefetch_sources(files + [project_dir / "absent.sas"])
+
+        result = resolve_includes(project_dir / "main.sas")
+        assert result.resolved_code == expected.resolved_code
+        assert result.source_map == expected.source_map
+
+
 class TestScanProjectDirectory:
     def test_scan_finds_all_sas(self, project_dir):
         files = scan_project_directory(project_dir)
@@ -193,6 +284,17 @@ class TestScanProjectDirectory:
         # main.sas should be auto-detected and placed first
         assert files[0].name == "main.sas"
 
+    def test_nested_dirs_and_other_files(self, tmp_path):
+        deep = tmp_path / "a" / "b" / "c"
+        deep.mkdir(parents=True)
+        (deep / "deep.sas").write_text("data x; run;\n")
+        (deep / "notes.txt").write_text("not sas\n")
+        (tmp_path / "top.sas").write_text("data y; run;\n")
+
+        files = scan_project_directory(tmp_path)
+        assert [f.name for f in files] == ["deep.sas", "top.sas"]
+        assert files == sorted(files)
+
     def test_empty_directory(self, tmp_path):
         files = scan_project_directory(tmp_path)
         assert len(files) == 0
@@ -230,3 +332,13 @@ class TestResolveWithParser:
         assert "step_a" in block_names
         assert "step_b" in block_names
         assert "step_c" in block_names
+
+    def test_parse_with_pre_resolved_source(self, project_dir):
+        from sas_data_generator.sas_parser import parse_sas_project
+
+        resolved = resolve_includes(project_dir / "main.sas")
+        result = parse_sas_project(project_dir / "main.sas", resolved=resolved)
+        expected = parse_sas_project(project_dir / "main.sas")
+
+        assert [b.name for b in result.blocks] == [b.name for b in expected.blocks]
+        assert len(result.all_coverage_points) == len(expected.all_coverage_points)
@@ -0,0 +1,46 @@
+"""Tests for the persistent parse cache."""
+
+from __future__ import annotations
+
+from sas_data_generator import parse_cache
+from sas_data_generator.sas_parser import parse_sas_file
+
+SAS_CODE = "data out; set in; if x > 1 then y = 1; else y = 0; run;\n"
+
+
+class TestParseCache:
+    def test_round_trip(self, tmp_path):
+        sas_file = tmp_path / "prog.sas"
+        sas_file.write_text(SAS_CODE)
+        result = parse_sas_file(sas_file)
+
+        key = parse_cache.cache_key(sas_file, sas_file.read_bytes())
+        assert parse_cache.load(key, tmp_path / "cache") is None
+
+        parse_cache.store(key, result, tmp_path / "cache")
+        cached = parse_cache.load(key, tmp_path / "cache")
+
+        assert cached is not None
+        assert [b.name for b in cached.blocks] == [b.name for b in result.blocks]
+        assert len(cached.all_coverage_points) == len(result.all_coverage_points)
+
+    def test_key_changes_with_source_and_mode(self, tmp_path):
+        sas_file = tmp_path / "prog.sas"
+        base = parse_cache.cache_key(sas_file, b"data a; run;")
+
+        assert parse_cache.cache_key(sas_file, b"data a; run;") == base
+        assert parse_cache.cache_key(sas_file, b"data b; run;") != base
+        assert parse_cache.cache_key(sas_file, b"data a; run;", mode="project") != base
+        assert parse_cache.cache_key(tmp_path / "other.sas", b"data a; run;") != base
+
+    def test_key_changes_with_parser(self, monkeypatch):
+        base = parse_cache.cache_key("prog.sas", b"data a; run;")
+
+        monkeypatch.setattr(parse_cache, "_parser_fingerprint", lambda: b"edited parser")
+        assert parse_cache.cache_key("prog.sas", b"data a; run;") != base
+
+    def test_corrupt_entry_is_a_miss(self, tmp_path):
+        key = parse_cache.cache_key("prog.sas", b"")
+        (tmp_path / f"{key}.pkl").write_bytes(b"not a pickle")
+
+        assert parse_cache.load(key, tmp_path) is None
@@ -7,7 +7,11 @@ from pathlib import Path
 
 import pytest
 
-from sas_data_generator.sas_instrumenter import instrument_sas_code, instrument_sas_file
+from sas_data_generator.sas_instrumenter import (
+    instrument_sas_code,
+    instrument_sas_file,
+    instrument_sas_file_to,
+)
 from sas_data_generator.sas_parser import CoveragePointType
 
 EXAMPLES_DIR = Path(__file__).parent.parent / "examples"
@@ -119,6 +123,30 @@ class TestInstrumentCode:
         ]
         assert len(step_entries) == 2
 
+    @pytest.mark.parametrize("code", [
+        "data a; set b; if x>1 then y=1; run; data c; set d; if z>2 then w=1; run;",
+        textwrap.dedent("""\
+            data a;
+                set b;
+                if x > 1 then y = 1;
+            run; data c;
+                set d;
+            run; proc sql;
+                create table t as select * from c where w > 1;
+            quit;
+        """),
+    ])
+    def test_steps_sharing_a_line_all_marked(self, code):
+        result = instrument_sas_code(code)
+        code_out = result.instrumented_code
+
+        assert len({cp.point_id for cp in result.coverage_points}) >= 5
+        for cp in result.coverage_points:
+            assert (
+                f'put "COV:POINT={cp.point_id}";' in code_out
+                or f"%_cov_hit({cp.point_id})" in code_out
+            ), cp.point_id
+
     def test_empty_code(self):
         result = instrument_sas_code("")
         assert result.instrumented_code  # Should at least have preamble/postamble
@@ -150,3 +178,49 @@ class TestInstrumentSampleFile:
         # Coverage infrastructure should be present
         assert "_cov_tracker" in result.instrumented_code
         assert "COV:COMPLETE" in result.instrumented_code
+
+
+class TestInstrumentationCache:
+    CODE = "data out; set in;\n    if x > 1 then y = 1;\nrun;\n"
+
+    def test_unchanged_file_is_not_reparsed(self, tmp_path, monkeypatch):
+        from sas_data_generator import sas_instrumenter
+
+        sas_file = tmp_path / "cached.sas"
+        sas_file.write_text(self.CODE)
+        first = instrument_sas_file(sas_file)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("unchanged file was parsed again")
+
+        monkeypatch.setattr(sas_instrumenter, "parse_sas_file", fail)
+        second = instrument_sas_file(sas_file)
+
+        assert second.instrumented_code == first.instrumented_code
+        assert second.coverage_points == first.coverage_points
+        assert second.coverage_points is not first.coverage_points
+
+    def test_edited_file_is_reinstrumented(self, tmp_path):
+        sas_file = tmp_path / "edited.sas"
+        sas_file.write_text(self.CODE)
+        first = instrument_sas_file(sas_file)
+
+        sas_file.write_text(self.CODE.replace("x > 1", "x > 2"))
+        second = instrument_sas_file(sas_file)
+
+        assert "x > 2" in second.instrumented_code
+        assert "x > 2" not in first.instrumented_code
+
+
+class TestInstrumentToFile:
+    def test_matches_in_memory_result(self, tmp_path):
+        sample_path = EXAMPLES_DIR / "sample_program.sas"
+        if not sample_path.exists():
+            pytest.skip("Sample program not found")
+
+        out_path = tmp_path / "instrumented.sas"
+        points = instrument_sas_file_to(sample_path, out_path, coverage_csv_path="cov.csv")
+        result = instrument_sas_file(sample_path, coverage_csv_path="cov.csv")
+
+        assert out_path.read_text(encoding="utf-8") == result.instrumented_code
+        assert points == result.coverage_points
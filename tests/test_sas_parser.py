@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import textwrap
+from collections import Counter
 from pathlib import Path
 
 import pytest
@@ -16,6 +17,7 @@ from sas_data_generator.sas_parser import (
     _strip_comments,
     parse_sas_code,
     parse_sas_file,
+    parse_sas_files,
 )
 
 EXAMPLES_DIR = Path(__file__).parent.parent / "examples"
@@ -26,8 +28,11 @@ EXAMPLES_DIR = Path(__file__).parent.parent / "examples"
 # ---------------------------------------------------------------------------
 
 class TestStripComments:
-    def test_block_comment(self):
-        code = "data a; /* this is a comment */ set b; run;"
+    @pytest.mark.parametrize("code", [
+        "data a; /* this is a comment */ set b; run;",
+        "data a;\n* this is a comment;\nset b;\nrun;",
+    ])
+    def test_comment_removed(self, code):
         result = _strip_comments(code)
         assert "this is a comment" not in result
         assert "data a;" in result
@@ -40,12 +45,6 @@ class TestStripComments:
         assert result.count("\n") == code.count("\n")
         assert "line1" not in result
 
-    def test_line_comment(self):
-        code = "data a;\n* this is a comment;\nset b;\nrun;"
-        result = _strip_comments(code)
-        assert "this is a comment" not in result
-        assert "set b;" in result
-
     def test_no_comments(self):
         code = "data a; set b; run;"
         result = _strip_comments(code)
@@ -57,37 +56,36 @@ class TestStripComments:
 # ---------------------------------------------------------------------------
 
 class TestVariableExtraction:
-    def test_numeric_comparison(self):
-        vars = _extract_variables_from_condition("age > 65", 1)
+    @pytest.mark.parametrize("condition,name", [
+        ("age > 65", "age"),
+        ("score ge 80", "score"),
+    ])
+    def test_single_comparison(self, condition, name):
+        vars = _extract_variables_from_condition(condition, 1)
         assert len(vars) == 1
-        assert vars[0].name == "age"
+        assert vars[0].name == name
         assert vars[0].inferred_type == "numeric"
 
     def test_multiple_comparisons(self):
         vars = _extract_variables_from_condition("age >= 25 and income < 50000", 1)
-        names = {v.name for v in vars}
-        assert "age" in names
-        assert "income" in names
+        assert {"age", "income"} <= {v.name for v in vars}
 
     def test_skips_keywords(self):
         vars = _extract_variables_from_condition("if age > 10 then", 1)
-        names = {v.name for v in vars}
-        assert "if" not in names
-        assert "then" not in names
+        assert {"if", "then"}.isdisjoint(v.name for v in vars)
 
-    def test_sas_operators(self):
-        vars = _extract_variables_from_condition("score ge 80", 1)
-        assert len(vars) == 1
-        assert vars[0].name == "score"
+    def test_types_from_literals(self):
+        vars = _extract_variables_from_condition(
+            "status = 'ACTIVE' and dob > '01JAN2000'd and code in (1, 2)", 1,
+        )
+        types = {v.name: v.inferred_type for v in vars}
+        assert types == {"status": "character", "dob": "date", "code": "numeric"}
 
 
 class TestInputParsing:
     def test_simple_input(self):
         vars = _extract_variables_from_input("name $ age salary", 1)
-        names = {v.name for v in vars}
-        assert "name" in names
-        assert "age" in names
-        assert "salary" in names
+        assert {"name", "age", "salary"} <= {v.name for v in vars}
 
     def test_character_variable(self):
         vars = _extract_variables_from_input("name $ age", 1)
@@ -104,30 +102,30 @@ class TestInputParsing:
 # Full SAS parsing
 # ---------------------------------------------------------------------------
 
+# A DATA step with one IF/ELSE, parsed once for the tests below
+SIMPLE_IF_CODE = textwrap.dedent("""\
+    data output;
+        set input;
+        if age > 65 then status = "SENIOR";
+        else status = "OTHER";
+    run;
+""")
+
+
+@pytest.fixture(scope="module")
+def simple_if_result() -> ParseResult:
+    return parse_sas_code(SIMPLE_IF_CODE)
+
+
 class TestParseSASCode:
-    def test_simple_data_step(self):
-        code = textwrap.dedent("""\
-            data output;
-                set input;
-                if age > 65 then status = "SENIOR";
-                else status = "OTHER";
-            run;
-        """)
-        result = parse_sas_code(code)
+    def test_simple_data_step(self, simple_if_result: ParseResult):
+        result = simple_if_result
         assert len(result.blocks) == 1
         assert result.blocks[0].block_type == BlockType.DATA_STEP
         assert result.blocks[0].name == "output"
 
-    def test_data_step_coverage_points(self):
-        code = textwrap.dedent("""\
-            data output;
-                set input;
-                if age > 65 then status = "SENIOR";
-                else status = "OTHER";
-            run;
-        """)
-        result = parse_sas_code(code)
-        types = {cp.point_type for cp in result.all_coverage_points}
+    def test_data_step_coverage_points(self, simple_if_result: ParseResult):
+        types = frozenset(cp.point_type for cp in simple_if_result.all_coverage_points)
         assert CoveragePointType.STEP_ENTRY in types
         assert CoveragePointType.IF_TRUE in types
         assert CoveragePointType.IF_FALSE in types
@@ -142,12 +140,9 @@ class TestParseSASCode:
             run;
         """)
         result = parse_sas_code(code)
-        if_true_count = sum(
-            1 for cp in result.all_coverage_points
-            if cp.point_type == CoveragePointType.IF_TRUE
-        )
+        counts = Counter(cp.point_type for cp in result.all_coverage_points)
         # Two IF conditions: age < 25 and age < 45
-        assert if_true_count == 2
+        assert counts[CoveragePointType.IF_TRUE] == 2
 
     def test_select_when(self):
         code = textwrap.dedent("""\
@@ -161,12 +156,9 @@ class TestParseSASCode:
             run;
         """)
         result = parse_sas_code(code)
-        types = [cp.point_type for cp in result.all_coverage_points]
-        assert CoveragePointType.SELECT_WHEN in types
-        assert CoveragePointType.SELECT_OTHERWISE in types
-
-        when_count = types.count(CoveragePointType.SELECT_WHEN)
-        assert when_count == 2
+        counts = Counter(cp.point_type for cp in result.all_coverage_points)
+        assert counts[CoveragePointType.SELECT_WHEN] == 2
+        assert CoveragePointType.SELECT_OTHERWISE in counts
 
     def test_proc_sql(self):
         code = textwrap.dedent("""\
@@ -186,7 +178,7 @@ class TestParseSASCode:
         assert len(result.blocks) == 1
         assert result.blocks[0].block_type == BlockType.PROC_SQL
 
-        types = {cp.point_type for cp in result.all_coverage_points}
+        types = frozenset(cp.point_type for cp in result.all_coverage_points)
         assert CoveragePointType.STEP_ENTRY in types
         assert CoveragePointType.SQL_CASE_WHEN in types
         assert CoveragePointType.SQL_CASE_ELSE in types
@@ -202,6 +194,28 @@ class TestParseSASCode:
         result = parse_sas_code(code)
         assert "mylib.customers" in result.blocks[0].input_datasets
 
+    def test_input_datasets_deduplicated(self):
+        code = textwrap.dedent("""\
+            data output;
+                set b a;
+                merge a B c;
+                set c;
+            run;
+        """)
+        result = parse_sas_code(code)
+        assert result.blocks[0].input_datasets == ["b", "a", "c"]
+
+    def test_set_with_nested_options(self):
+        code = textwrap.dedent("""\
+            data output;
+                set mylib.a(where=(x in (1, 2))) b (keep=y);
+                merge """ + "c(in=z) " * 40 + """
+            run;
+        """)
+        # The unterminated MERGE list must not backtrack exponentially
+        result = parse_sas_code(code)
+        assert result.blocks[0].input_datasets == ["mylib.a", "b"]
+
     def test_output_datasets(self):
         code = textwrap.dedent("""\
             data results;
@@ -221,30 +235,70 @@ class TestParseSASCode:
             run;
         """)
         result = parse_sas_code(code)
-        var_names = {v.name for v in result.all_variables}
-        assert "age" in var_names
-        assert "income" in var_names
+        assert {"age", "income"} <= {v.name for v in result.all_variables}
 
-    def test_condition_captured(self):
-        code = textwrap.dedent("""\
-            data output;
-                set input;
-                if age > 65 then x = 1;
-            run;
-        """)
-        result = parse_sas_code(code)
+    def test_condition_captured(self, simple_if_result: ParseResult):
         if_true_points = [
-            cp for cp in result.all_coverage_points
+            cp for cp in simple_if_result.all_coverage_points
             if cp.point_type == CoveragePointType.IF_TRUE
         ]
         assert len(if_true_points) == 1
         assert "age" in if_true_points[0].condition.lower()
 
+    def test_file_id_names_points(self):
+        result = parse_sas_code("data a;\n    if x > 1 then y = 1;\nrun;\n", file_id="prog")
+        assert result.file_path == "prog.sas"
+        assert [cp.point_id for cp in result.all_coverage_points] == [
+            "prog:1", "prog:2", "prog:3",
+        ]
+
+    def test_repeated_code_served_from_cache(self):
+        code = "data a;\n    if x > 1 then y = 1;\nrun;\n"
+        first = parse_sas_code(code, file_id="cached")
+        assert parse_sas_code(code, file_id="cached") == first
+        other = parse_sas_code(code, file_id="other")
+        assert other.all_coverage_points[0].point_id == "other:1"
+
+    def test_modified_result_does_not_leak_into_cache(self):
+        code = "data a;\n    set b;\n    if x > 1 then y = 1;\nrun;\n"
+        first = parse_sas_code(code, file_id="mutated")
+        expected = parse_sas_code(code, file_id="mutated")
+        first.blocks[0].input_datasets.append("extra")
+        first.blocks.clear()
+        first.all_coverage_points.clear()
+
+        again = parse_sas_code(code, file_id="mutated")
+        assert again == expected
+        assert len(again.blocks) == 1
+        assert again.blocks[0].input_datasets == ["b"]
+
     def test_empty_file(self):
         result = parse_sas_code("")
         assert len(result.blocks) == 0
         assert len(result.all_coverage_points) == 0
 
+    def test_step_boundaries(self):
+        code = textwrap.dedent("""\
+            data first;
+                x = 1;
+            run;
+            proc sql;
+                create table t as select * from first;
+            quit;
+            data second;
+                y = 2;
+            RUN ;
+            data unterminated;
+                z = 3;
+        """)
+        result = parse_sas_code(code)
+        spans = [(b.block_type, b.name, b.start_line, b.end_line) for b in result.blocks]
+        assert spans == [
+            (BlockType.DATA_STEP, "first", 1, 3),
+            (BlockType.DATA_STEP, "second", 7, 9),
+            (BlockType.PROC_SQL, "SQL", 4, 6),
+        ]
+
     def test_comments_ignored(self):
         code = textwrap.dedent("""\
             /* data fake; set nothing; if x > 1 then y = 2; run; */
@@ -258,16 +312,18 @@ class TestParseSASCode:
         assert result.blocks[0].name == "real"
 
 
+# Parsed once for the module; the tests only read the result
+@pytest.fixture(scope="module")
+def sample_result() -> ParseResult:
+    sample_path = EXAMPLES_DIR / "sample_program.sas"
+    if not sample_path.exists():
+        pytest.skip("Sample program not found")
+    return parse_sas_file(sample_path)
+
+
 class TestSampleProgram:
     """Test parsing of the sample SAS program in examples/."""
 
-    @pytest.fixture
-    def sample_result(self) -> ParseResult:
-        sample_path = EXAMPLES_DIR / "sample_program.sas"
-        if not sample_path.exists():
-            pytest.skip("Sample program not found")
-        return parse_sas_file(sample_path)
-
     def test_blocks_found(self, sample_result: ParseResult):
         assert len(sample_result.blocks) >= 2  # DATA step + PROC SQL
 
@@ -285,10 +341,32 @@ class TestSampleProgram:
         assert len(sample_result.all_coverage_points) >= 10
 
     def test_variables_detected(self, sample_result: ParseResult):
-        var_names = {v.name for v in sample_result.all_variables}
-        assert "age" in var_names
-        assert "income" in var_names
-        assert "score" in var_names
+        assert {"age", "income", "score"} <= {v.name for v in sample_result.all_variables}
 
     def test_no_errors(self, sample_result: ParseResult):
         assert len(sample_result.errors) == 0
+
+    def test_to_soa_columns(self, sample_result: ParseResult):
+        points = sample_result.all_coverage_points
+        soa = sample_result.to_soa()
+
+        assert soa["point_id"] == [cp.point_id for cp in points]
+        assert soa["line_number"].tolist() == [cp.line_number for cp in points]
+        assert soa["condition"] == [cp.condition for cp in points]
+        entries = int((soa["point_type"] == CoveragePointType.STEP_ENTRY.value).sum())
+        assert entries == len(sample_result.blocks)
+
+
+class TestParseSASFiles:
+    def test_matches_parse_sas_file_in_order(self, tmp_path):
+        paths = []
+        for i in range(3):
+            path = tmp_path / f"prog{i}.sas"
+            path.write_text(f"data out{i};\n    if x > {i} then y = 1;\nrun;\n")
+            paths.append(path)
+
+        serial = parse_sas_files(paths, workers=1)
+        pooled = parse_sas_files(paths, workers=2)
+
+        assert [r.blocks[0].name for r in pooled] == ["out0", "out1", "out2"]
+        assert pooled == serial == [parse_sas_file(p) for p in paths]
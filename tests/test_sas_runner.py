@@ -0,0 +1,129 @@
+"""Tests for the SAS session runner, driven by a stub `sas -stdio` executable."""
+
+from __future__ import annotations
+
+import sys
+import textwrap
+
+import pytest
+
+from sas_data_generator.sas_runner import SASSession, run_sas_many
+
+pytestmark = pytest.mark.skipif(
+    sys.platform == "win32", reason="stub SAS executable needs a #! line",
+)
+
+# Stands in for `sas -stdio`: echoes each %included program to the PRINTTO
+# log, sets &SYSCC to 8 when the program writes an ERROR line, and answers
+# the sentinel %PUT on stderr. STUB:* markers in a program change behaviour.
+_STUB_SAS = textwrap.dedent("""\
+    import pathlib, re, sys, time
+
+    transcript = open("stdin.txt", "a")
+    log = None
+    syscc = 0
+    for line in sys.stdin:
+        transcript.write(line)
+        transcript.flush()
+        m = re.match(r'proc printto log="([^"]+)"', line)
+        if m:
+            log = m.group(1)
+            continue
+        m = re.match(r'%include "([^"]+)";', line)
+        if m:
+            code = pathlib.Path(m.group(1)).read_text()
+            if log:
+                pathlib.Path(log).write_text(code)
+            if "STUB:EXIT" in code:
+                sys.exit(3)
+            if "STUB:SLEEP" in code:
+                time.sleep(60)
+            if "STUB:STALE" in code:
+                print("_SASDATAGEN_END_0_0", file=sys.stderr, flush=True)
+            syscc = 8 if "ERROR:" in code else 0
+            continue
+        m = re.match(r"%put (_SASDATAGEN_END_\\d+_)&_sasdatagen_rc;", line)
+        if m:
+            print(f"{m.group(1)}{syscc}", file=sys.stderr, flush=True)
+        elif line.startswith("endsas;"):
+            break
+""")
+
+
+@pytest.fixture
+def stub_sas(tmp_path):
+    path = tmp_path / "stub_sas"
+    path.write_text(f"#!{sys.executable}\n{_STUB_SAS}")
+    path.chmod(0o755)
+    return str(path)
+
+
+@pytest.fixture
+def session(stub_sas, tmp_path):
+    with SASSession(sas_executable=stub_sas, work_dir=tmp_path / "session") as s:
+        yield s
+
+
+class TestSASSession:
+    def test_runs_share_one_process(self, session, tmp_path):
+        failed = session.run("data a;\nERROR: bad step\n", work_dir=tmp_path / "r1")
+        pid = session._proc.pid
+        clean = session.run("data b; run;\n", work_dir=tmp_path / "r2")
+
+        assert failed.return_code == 2
+        assert failed.sas_errors == ["ERROR: bad step"]
+        assert clean.return_code == 0
+        assert "data b; run;" in clean.log_text
+        assert session._proc.pid == pid
+
+    def test_options_reset_before_each_program(self, session, tmp_path):
+        session.run("data a;\nERROR: bad step\n", work_dir=tmp_path / "r1")
+        session.run("data b; run;\n", work_dir=tmp_path / "r2")
+
+        lines = (tmp_path / "session" / "stdin.txt").read_text().splitlines()
+        includes = [i for i, line in enumerate(lines) if line.startswith("%include")]
+        assert len(includes) == 2
+        for i in includes:
+            assert lines[i - 1] == "options obs=max replace nosyntaxcheck;"
+
+    def test_stale_sentinel_ignored(self, session, tmp_path):
+        result = session.run("* STUB:STALE;\nERROR: bad step\n", work_dir=tmp_path / "r1")
+        assert result.return_code == 2
+
+    def test_timeout_then_restart(self, session, tmp_path):
+        session.run("data a; run;\n", work_dir=tmp_path / "r1")
+        pid = session._proc.pid
+
+        hung = session.run("* STUB:SLEEP;\n", work_dir=tmp_path / "r2", timeout_seconds=1)
+        assert hung.return_code == -1
+        assert session._proc is None
+
+        after = session.run("data c; run;\n", work_dir=tmp_path / "r3")
+        assert after.return_code == 0
+        assert "data c; run;" in after.log_text
+        assert session._proc.pid != pid
+
+    def test_process_exit(self, session, tmp_path):
+        exited = session.run("* STUB:EXIT;\n", work_dir=tmp_path / "r1", timeout_seconds=30)
+        assert exited.return_code == -1
+        assert exited.duration_seconds < 30
+
+        after = session.run("data b; run;\n", work_dir=tmp_path / "r2")
+        assert after.return_code == 0
+
+
+class TestRunSasMany:
+    def test_sessions_return_results_in_order(self, stub_sas, tmp_path):
+        jobs = [
+            {"sas_code": f"data out{i}; run;\n", "work_dir": tmp_path / f"job{i}"}
+            for i in range(6)
+        ]
+        jobs[1]["sas_code"] += "ERROR: bad step\n"
+
+        results = run_sas_many(
+            jobs, max_concurrency=2, session_options={"sas_executable": stub_sas},
+        )
+
+        assert [r.return_code for r in results] == [0, 2, 0, 0, 0, 0]
+        for i, result in enumerate(results):
+            assert f"data out{i}; run;" in result.log_text